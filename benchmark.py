@@ -0,0 +1,698 @@
+"""
+This file benchmarks the parts of the textadventure api that are used the most. It is run from the command line just\
+    like main.py and is not meant to be imported.
+
+Examples:
+    python3 benchmark.py                              # run every benchmark and print the results
+    python3 benchmark.py --output baseline.json       # also save the results so they can be compared later
+    python3 benchmark.py --compare baseline.json      # flag benchmarks that are slower than the ones in baseline.json
+    python3 benchmark.py --only battle_turn,save_data --rounds 10
+    python3 benchmark.py --only memory_health,memory_message_part
+
+Benchmarks whose names start with memory_ measure the number of bytes each object takes up instead of time.
+
+When comparing, the exit code is 1 if there were any regressions.
+"""
+import gc
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ninjagame.walkthrough import WALKTHROUGH, create_simulation
+from textadventure.battling.managing import BattleManager
+from textadventure.battling.move import Target, Turn
+from textadventure.battling.outcome import HealthChangeOutcome
+from textadventure.entity import Living, Health
+from textadventure.input.inputhandling import CommandInput, FlagData, FlagSpec, InputHandle
+from textadventure.item.holder import Holder
+from textadventure.item.items import Coin, Wallet
+from textadventure.reference import ReferenceIndex, get_score
+from textadventure.saving.saving import save_data, load_data, Durability
+from textadventure.sending.message import Message, MessageType, MessagePart
+from textadventure.simulation import Simulation
+from textadventure.utils import are_mostly_equal, normalize_reference, are_normalized_mostly_equal, Point
+from textprint.colors import Color
+
+RESULTS_VERSION = 1
+"""Changed when the format of the json results changes"""
+
+Operation = Callable[[], None]
+
+BENCHMARKS = []  # type List[Tuple[str, Callable[[], Operation]]]
+"""A list of tuples where [0] is the name of the benchmark and [1] is a function that sets up the benchmark and \
+    returns the operation that will be timed"""
+
+MEMORY_BENCHMARKS = []  # type List[Tuple[str, Callable[[], Callable[[], object]]]]
+"""A list of tuples where [0] is the name of the benchmark and [1] is a function that returns a function that creates \
+    one of the objects being measured"""
+
+_simulations = []  # type List[Simulation]
+"""Every Simulation created by a benchmark so they can be closed at the end"""
+
+
+def benchmark(name: str):
+    """
+    A decorator that adds a setup function to BENCHMARKS. The setup function should return a function that does one\
+    operation. That is what gets timed.
+    """
+    def decorator(setup: Callable[[], Operation]):
+        BENCHMARKS.append((name, setup))
+        return setup
+    return decorator
+
+
+def memory_benchmark(name: str):
+    """
+    A decorator that adds a setup function to MEMORY_BENCHMARKS. The setup function should return a function that \
+    creates one object. The size of that object is what gets measured.
+    """
+    def decorator(setup: Callable[[], Callable[[], object]]):
+        MEMORY_BENCHMARKS.append(("memory_" + name, setup))
+        return setup
+    return decorator
+
+
+def _create_simulation(lines: List[str]) -> Simulation:
+    """
+    :param lines: The input that will be used to get the game to the state the benchmark needs
+    :return: A Simulation of the ninja game that has already handled all of lines. Its output is not captured
+    """
+    simulation = create_simulation(lines, capture=False)
+    _simulations.append(simulation)
+    simulation.run()
+    return simulation
+
+
+# region benchmarks
+COMMANDS = ["go to the castle of rainbow unicorns", "take the wooden sword", "attack 0", "yell 'hello there' --loud",
+            "go north -f", "name Bob", "inventory", "place the chinese steel sword here"]
+FLAG_OPTIONS = {("loud", "l"): 0, ("f", "fast"): 0, ("times", "t"): 1}
+FLAG_SPEC = FlagSpec(FLAG_OPTIONS)
+
+
+@benchmark("command_input")
+def setup_command_input():
+    def operation():
+        for command in COMMANDS:
+            CommandInput(command).split()
+    return operation
+
+
+@benchmark("command_input_args")
+def setup_command_input_args():
+    inputs = [CommandInput(command) for command in COMMANDS]
+
+    def operation():
+        for command_input in inputs:
+            command_input.get_arg(0)
+            command_input.get_arg(1, False)
+            command_input.get_arg(0, flag_options=FLAG_OPTIONS)
+            command_input.get_flags()
+            FlagData(command_input, FLAG_OPTIONS).get_flag("times")
+    return operation
+
+
+@benchmark("flag_spec")
+def setup_flag_spec():
+    inputs = [CommandInput(command) for command in COMMANDS]
+
+    def operation():
+        for command_input in inputs:
+            command_input.get_arg(0, flag_options=FLAG_SPEC)
+            flags = FLAG_SPEC.parse(command_input)
+            flags.get("times")
+            flags.get("loud")
+    return operation
+
+
+@benchmark("handler_do_input")
+def setup_handler_do_input():
+    simulation = _create_simulation(WALKTHROUGH[:WALKTHROUGH.index("go east")])
+    handler = simulation.handler
+    player = next(iter(handler.get_players()))
+    do_input = handler._Handler__do_input  # we want to time the dispatch without any of the rest of update
+    inputs = ["look", "inventory", "locate", "yell hi", "take the rock", "go up", "not a command"]
+
+    def operation():
+        for inp in inputs:
+            do_input(player, inp)
+    return operation
+
+
+@benchmark("player_handled_objects")
+def setup_player_handled_objects():
+    simulation = _create_simulation(WALKTHROUGH[:WALKTHROUGH.index("look")])
+    player = next(iter(simulation.handler.get_players()))
+    handled_objects = list(player.handled_objects.values())
+    types = [type(handled_object) for handled_object in handled_objects] * 4 + [int]
+
+    def operation():
+        for handled_type in types:
+            player[handled_type]  # int is never found
+        for handled_object in handled_objects:
+            player[type(handled_object)] = handled_object
+    return operation
+
+
+@benchmark("are_mostly_equal")
+def setup_are_mostly_equal():
+    pairs = [("the wooden sword", "wooden sword"), ("chinese steel sword", "wooden sword"),
+             ("white belt ninja", "the white belt ninja"), ("penny", "a wallet"), ("nrth", "north"),
+             ("go to the castle", "castle")]
+
+    def operation():
+        for a, b in pairs:
+            are_mostly_equal(a, b)
+    return operation
+
+
+@benchmark("are_mostly_equal_uncached")
+def setup_are_mostly_equal_uncached():
+    pairs = [("the wooden sword", "wooden sword"), ("chinese steel sword", "wooden sword"),
+             ("white belt ninja", "the white belt ninja"), ("penny", "a wallet"), ("nrth", "north"),
+             ("go to the castle", "castle")]
+
+    def operation():
+        normalize_reference.cache_clear()
+        are_normalized_mostly_equal.cache_clear()
+        for a, b in pairs:
+            are_mostly_equal(a, b)
+    return operation
+
+
+@benchmark("is_reference")
+def setup_is_reference():
+    livings = [Living(name) for name in ["wooden sword", "chinese steel sword", "wallet", "penny", "rock", "stick",
+                                         "spider web", "old fountain", "double doors", "white belt"]]
+    references = ["the wooden sword", "my penny", "steel sword", "fountain", "the double door"]
+
+    def operation():
+        for reference in references:
+            for living in livings:
+                living.is_reference(reference)
+    return operation
+
+
+@benchmark("reference_index_find")
+def setup_reference_index_find():
+    livings = [Living(name) for name in ["wooden sword", "chinese steel sword", "wallet", "penny", "rock", "stick",
+                                         "spider web", "old fountain", "double doors", "white belt"]]
+    references = ["the wooden sword", "my penny", "steel sword", "fountain", "the double door"]
+    index = ReferenceIndex(Living.is_reference, reference_first=True)
+
+    def operation():
+        for reference in references:
+            index.find(livings, reference)
+    return operation
+
+
+@benchmark("reference_index_find_large")
+def setup_reference_index_find_large():
+    adjectives = ["wooden", "steel", "rusty", "golden", "silver", "old", "red", "blue", "shiny", "broken"]
+    nouns = ["sword", "shield", "penny", "wallet", "rock", "stick", "lamp", "key", "map", "gem", "ring", "potion"]
+    livings = [Living("{} {} {}".format(adjective, noun, number)) for adjective in adjectives for noun in nouns
+               for number in range(4)]
+    references = ["the rusty swrod 2", "my golden penny", "silver potoin 3", "red lamp 0", "the key"]
+    index = ReferenceIndex(Living.is_reference, reference_first=True)
+
+    def operation():
+        get_score.cache_clear()
+        for reference in references:
+            index.find(livings, reference)
+    return operation
+
+
+@benchmark("holder_items")
+def setup_holder_items():
+    holder = Holder()
+    items = [Wallet() for _ in range(400)]
+    for item in items:
+        item.change_holder(None, holder)
+    moved = items[::10]
+
+    def operation():
+        holder_items = holder.items
+        for item in moved:
+            holder_items.remove(item)
+            holder_items.append(item)
+        for item in items[::4]:
+            item in holder_items
+        holder_items.count_type(Wallet)
+    return operation
+
+
+@benchmark("wallet_coins")
+def setup_wallet_coins():
+    wallet = Wallet()
+    other = Wallet()
+    for coin_type in [Coin.PENNY, Coin.DIME, Coin.QUARTER, Coin.DOLLAR]:
+        coin_type.create(1000).change_holder(None, wallet)
+
+    def operation():
+        for coin_type in [Coin.PENNY, Coin.DIME, Coin.QUARTER, Coin.DOLLAR]:
+            wallet.transfer(other, coin_type, 7)
+        other.transfer_all(wallet)
+        wallet.get_amount(Coin.DIME)
+        wallet.get_total()
+    return operation
+
+
+@benchmark("message_create_parts")
+def setup_message_create_parts():
+    messages = [Message("Hello there, {}. Would you like to go {}?", named_variables=["Bob", ["north", "east"]]),
+                Message(Color.RED + "You are at " + Color.RESET + "{}", message_type=MessageType.IMMEDIATE,
+                        named_variables=["Entrance"]),
+                Message("A |long| message that has a |few| spots that are |printed immediately|. " * 3,
+                        message_type=MessageType.TYPE_SLOW)]
+
+    def operation():
+        for message in messages:
+            message.create_parts()
+    return operation
+
+
+def _create_text_printer(rows=24, columns=80):
+    from textprint.section import Section
+    from textprint.textprinter import TextPrinter
+    section = Section(None, fake_line=(Color.BLUE >> "~"))
+    printer = TextPrinter([Section(1), section, Section(1)], output=io.StringIO())
+    printer.dimensions = (rows, columns)  # update_dimensions would need a terminal
+    return printer, section
+
+
+def _reset_output(printer):
+    if printer.output.tell() > 1 << 20:  # don't let the output keep growing while we are timing
+        printer.output.seek(0)
+        printer.output.truncate()
+
+
+@benchmark("text_printer_output")
+def setup_text_printer_output():
+    from textadventure.clientside.outputs import TextPrinterOutput
+    printer, section = _create_text_printer()
+    output = TextPrinterOutput(printer, section)
+    message = Message("You are at {}. You see a {} and a {}.", named_variables=["Entrance", "wallet", "rock"])
+
+    def operation():
+        output.send_message(message)
+        output.print_immediately()
+        _reset_output(printer)
+    return operation
+
+
+@benchmark("line_update")
+def setup_line_update():
+    printer, section = _create_text_printer()
+    lines = [section.println(printer, "Line number {} ".format(i) * (1 + i % 8)) for i in range(30)]
+
+    def operation():
+        for line in lines:
+            line.update(printer, reprint=True)
+        _reset_output(printer)
+    return operation
+
+
+@benchmark("section_update_lines")
+def setup_section_update_lines():
+    printer, section = _create_text_printer()
+    for i in range(60):
+        section.println(printer, (Color.GREEN >> "Line number {} ".format(i)) * (1 + i % 8))
+
+    def operation():
+        section.update_lines(printer, force_reprint=True)
+        _reset_output(printer)
+    return operation
+
+
+@benchmark("battle_turn")
+def setup_battle_turn():
+    simulation = _create_simulation(WALKTHROUGH[:WALKTHROUGH.index("attack 0")])
+    battle_manager = simulation.handler.get_managers(BattleManager, 1)[0]
+    battle = battle_manager.active_battles[0]
+    for team in battle.teams:
+        for entity in team.members:
+            entity.health.max_health = entity.health.current_health = 1 << 60  # so the battle never ends
+    input_getter = simulation.input_getters[0]
+
+    def operation():
+        number = battle.current_turn.number
+        input_getter.lines.append("attack 0")
+        while battle.current_turn.number == number:
+            simulation.update()
+    return operation
+
+
+def _setup_saving():
+    simulation = _create_simulation(WALKTHROUGH[:WALKTHROUGH.index("go west")])
+    handler = simulation.handler
+    player = next(iter(handler.get_players()))
+    handler.savable.before_save(handler, handler)
+    player.savable.before_save(player, handler)
+    handler_path = simulation.save_path.get_handler_path()
+    player_path = simulation.save_path.get_player_path(player)
+    return handler.savable, handler_path, player.savable, player_path
+
+
+@benchmark("save_data")
+def setup_save_data():
+    handler_savable, handler_path, player_savable, player_path = _setup_saving()
+
+    def operation():
+        save_data(handler_savable, handler_path)
+        save_data(player_savable, player_path)
+    return operation
+
+
+def _setup_save_data_durability(durability: Durability) -> Callable[[], Operation]:
+    def setup():
+        handler_savable, handler_path, player_savable, player_path = _setup_saving()
+
+        def operation():
+            save_data(handler_savable, handler_path, durability)
+            save_data(player_savable, player_path, durability)
+        return operation
+    return setup
+
+
+for _durability in Durability:
+    benchmark("save_data_" + _durability.name.lower())(_setup_save_data_durability(_durability))
+
+
+@benchmark("load_data")
+def setup_load_data():
+    handler_savable, handler_path, player_savable, player_path = _setup_saving()
+    save_data(handler_savable, handler_path)
+    save_data(player_savable, player_path)
+
+    def operation():
+        load_data(handler_path)
+        load_data(player_path)
+    return operation
+
+
+@benchmark("handler_save_unchanged")
+def setup_handler_save_unchanged():
+    simulation = _create_simulation(WALKTHROUGH[:WALKTHROUGH.index("go west")])
+    handler = simulation.handler
+    handler.save()
+
+    def operation():
+        handler.save()  # nothing changed so nothing is written
+    return operation
+
+
+@benchmark("handler_save_player_moved")
+def setup_handler_save_player_moved():
+    simulation = _create_simulation(WALKTHROUGH[:WALKTHROUGH.index("go west")])
+    handler = simulation.handler
+    player = next(iter(handler.get_players()))
+    handler.save()
+
+    def operation():
+        player.mark_dirty()  # only the player's file is written
+        handler.save()
+    return operation
+
+
+@benchmark("handler_save_forced")
+def setup_handler_save_forced():
+    simulation = _create_simulation(WALKTHROUGH[:WALKTHROUGH.index("go west")])
+    handler = simulation.handler
+
+    def operation():
+        handler.save(force=True)
+    return operation
+# endregion
+
+
+# region memory benchmarks
+@memory_benchmark("point")
+def setup_memory_point():
+    return lambda: Point(1, 2, 3)
+
+
+@memory_benchmark("health")
+def setup_memory_health():
+    return lambda: Health(30, 30)
+
+
+@memory_benchmark("message")
+def setup_memory_message():
+    return lambda: Message("Hello there, {}.", named_variables=["Bob"])
+
+
+@memory_benchmark("message_part")
+def setup_memory_message_part():
+    return lambda: MessagePart("Hello there", print_before=Color.CYAN, print_after=Color.RESET)
+
+
+@memory_benchmark("line")
+def setup_memory_line():
+    from textprint.line import Line
+    return lambda: Line("Hello there", None, 0)
+
+
+@memory_benchmark("input_handle")
+def setup_memory_input_handle():
+    return lambda: InputHandle(InputHandle.PRIORITY_COMMAND, None, None)
+
+
+@memory_benchmark("target")
+def setup_memory_target():
+    return lambda: Target(None, None, None, 0)
+
+
+@memory_benchmark("turn")
+def setup_memory_turn():
+    return lambda: Turn(0, [])
+
+
+@memory_benchmark("health_outcome")
+def setup_memory_health_outcome():
+    return lambda: HealthChangeOutcome(None, 30)
+# endregion
+
+
+def measure_memory(create: Callable[[], object], count=2000) -> Dict[str, float]:
+    """
+    Measures how many bytes each object returned by create takes up using tracemalloc. The memory used by the \
+    object's attributes is not included unless create makes a new one for each object. (Like a new list)
+
+    :param create: The function that creates one object
+    :param count: The number of objects to create. The more there are, the more accurate the result is
+    :return: A dict that can be turned into json
+    """
+    create()  # make sure anything created once (like a cache) isn't counted
+    holder = [None] * count  # created before so the list isn't counted
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        for i in range(count):
+            holder[i] = create()
+        used = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+        if gc_was_enabled:
+            gc.enable()
+    return {"bytes_per_object": used / count, "count": count}
+
+
+def measure(operation: Operation, rounds: int, round_time: float) -> Dict[str, float]:
+    """
+    Times operation. Just like timeit, garbage collection is disabled while timing.
+
+    :param operation: The function to time
+    :param rounds: The number of times to time a group of calls to operation
+    :param round_time: The minimum number of seconds each round should take. Used to decide how many times to call \
+            operation in each round
+    :return: A dict that can be turned into json
+    """
+    loops = 1
+    while True:  # figure out how many loops we need so the timer is accurate
+        start = time.perf_counter()
+        for _ in range(loops):
+            operation()
+        taken = time.perf_counter() - start
+        if taken >= round_time:
+            break
+        loops *= 2 if taken * 10 >= round_time else 10
+
+    times = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(loops):
+                operation()
+            times.append((time.perf_counter() - start) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    times.sort()
+    return {"seconds_per_op": times[0], "median": times[len(times) // 2], "loops": loops, "rounds": rounds}
+
+
+def run_benchmarks(only: Optional[List[str]] = None, rounds=5, round_time=.05) -> dict:
+    """
+    :param only: The names of the benchmarks to run or None to run all of them
+    :param rounds: The number of rounds for each benchmark
+    :param round_time: The minimum time each round should take
+    :return: The results that can be turned into json
+    """
+    results = {}
+    memory = {}
+    skipped = {}
+    try:
+        for name, setup in BENCHMARKS:
+            if only is not None and name not in only:
+                continue
+            try:
+                operation = setup()
+            except ModuleNotFoundError as e:  # textprint needs pyparsing which is optional
+                skipped[name] = str(e)
+                print("{:<24}{:>14}".format(name, "skipped") + " ({})".format(e))
+                continue
+            results[name] = measure(operation, rounds, round_time)
+            print("{:<24}{:>12.3f}us".format(name, results[name]["seconds_per_op"] * 1e6))
+        for name, setup in MEMORY_BENCHMARKS:
+            if only is not None and name not in only:
+                continue
+            try:
+                create = setup()
+            except ModuleNotFoundError as e:
+                skipped[name] = str(e)
+                print("{:<24}{:>14}".format(name, "skipped") + " ({})".format(e))
+                continue
+            memory[name] = measure_memory(create)
+            print("{:<24}{:>8.1f} bytes".format(name, memory[name]["bytes_per_object"]))
+    finally:
+        for simulation in _simulations:
+            simulation.close()
+        _simulations.clear()
+    return {"version": RESULTS_VERSION, "python": platform.python_version(), "benchmarks": results,
+            "memory": memory, "skipped": skipped}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> Tuple[List[str], List[str]]:
+    """
+    :param results: The results from run_benchmarks
+    :param baseline: The results loaded from the baseline json file
+    :param threshold: The fraction that a benchmark can be slower than the baseline without being a regression. \
+            (Ex: .1 means 10% slower is fine)
+    :return: A tuple where [0] is a list of lines to print and [1] is a list of the names of the benchmarks that \
+            regressed
+    """
+    lines = []
+    regressions = []
+    old_benchmarks = baseline.get("benchmarks", {})
+    for name, result in results["benchmarks"].items():
+        old = old_benchmarks.get(name)
+        new_time = result["seconds_per_op"]
+        if old is None:
+            lines.append("{:<24}{:>12.3f}us (not in baseline)".format(name, new_time * 1e6))
+            continue
+        old_time = old["seconds_per_op"]
+        change = new_time / old_time - 1 if old_time > 0 else 0.0
+        status = ""
+        if change > threshold:
+            status = " REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            status = " improved"
+        lines.append("{:<24}{:>12.3f}us -> {:>10.3f}us ({:+.1%}){}".format(name, old_time * 1e6, new_time * 1e6,
+                                                                          change, status))
+    old_memory = baseline.get("memory", {})
+    for name, result in results.get("memory", {}).items():
+        old = old_memory.get(name)
+        new_bytes = result["bytes_per_object"]
+        if old is None:
+            lines.append("{:<24}{:>8.1f} bytes (not in baseline)".format(name, new_bytes))
+            continue
+        old_bytes = old["bytes_per_object"]
+        change = new_bytes / old_bytes - 1 if old_bytes > 0 else 0.0
+        status = ""
+        if change > threshold:
+            status = " REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            status = " improved"
+        lines.append("{:<24}{:>8.1f} bytes -> {:>8.1f} bytes ({:+.1%}){}".format(name, old_bytes, new_bytes, change,
+                                                                                status))
+    return lines, regressions
+
+
+def main():
+    command = CommandInput.from_split(list(sys.argv))
+    flag_spec = FlagSpec({
+        ("output", "o"): 1,
+        ("compare", "c", "baseline"): 1,
+        ("threshold", "t"): 1,
+        ("only", "k"): 1,
+        ("rounds", "r"): 1,
+        ("list", "l"): 0
+    })
+    flags = flag_spec.parse(command)
+    if flags.unknown:
+        print("Unknown flags: {}. Valid flags: {}".format(", ".join(flags.unknown), flag_spec))
+        sys.exit(2)
+
+    names = [name for name, _ in BENCHMARKS + MEMORY_BENCHMARKS]
+    if flags.get("list"):
+        for name in names:
+            print(name)
+        return
+
+    try:
+        threshold = float(flags.get("threshold") or .1)
+        rounds = int(flags.get("rounds") or 5)
+    except ValueError:
+        print("threshold must be a number and rounds must be an integer.")
+        sys.exit(2)
+
+    only = None
+    string_only = flags.get("only")
+    if string_only:
+        only = string_only.split(",")
+        unknown = [name for name in only if name not in names]
+        if unknown:
+            print("Unknown benchmarks: {}. Use --list to see them all.".format(", ".join(unknown)))
+            sys.exit(2)
+
+    baseline = None
+    baseline_file = flags.get("compare")
+    if baseline_file:
+        try:
+            with open(baseline_file) as file:
+                baseline = json.load(file)
+        except (IOError, ValueError) as e:
+            print("Unable to load baseline '{}': {}".format(baseline_file, e))
+            sys.exit(2)
+
+    results = run_benchmarks(only, rounds=rounds)
+
+    output_file = flags.get("output")
+    if output_file:
+        with open(output_file, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+        print("Saved results to {}".format(output_file))
+
+    if baseline is not None:
+        lines, regressions = compare(results, baseline, threshold)
+        print()
+        print("Compared to {} (threshold: {:.0%}):".format(baseline_file, threshold))
+        for line in lines:
+            print(line)
+        if regressions:
+            print("{} regression(s): {}".format(len(regressions), ", ".join(regressions)))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
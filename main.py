@@ -3,7 +3,7 @@ import time
 
 from pathlib import Path
 
-from textadventure.input.inputhandling import CommandInput, FlagData
+from textadventure.input.inputhandling import CommandInput, FlagSpec
 from textadventure.saving.saving import SavePath
 
 
@@ -80,43 +80,48 @@ def create_simple_player(savable):
     return player, [output], lambda: None
 
 
+FLAG_SPEC = FlagSpec({
+    ("rest", "r"): 1,
+    ("simple", "windows", "dos"): 0,
+    ("file", "f", "save", "path"): 1,
+    ("clean", "no_load"): 0,
+    ("user", "u", "player", "name"): 1
+})
+
+
 def auto_flag_setup():
-    command = CommandInput(CommandInput.join(sys.argv))
-    options = {
-        ("rest", "r"): 1,
-        ("simple", "windows", "dos"): 0,
-        ("file", "f", "save", "path"): 1,
-        ("clean", "no_load"): 0,
-        ("user", "u", "player", "name"): 1
-    }
-    flag_data = FlagData(command, options)
-
-    rest = 0.001
-    string_rest = flag_data.get_flag("rest")
+    command = CommandInput.from_split(list(sys.argv))
+    flags = FLAG_SPEC.parse(command)  # every flag is found at once
+    if flags.unknown:
+        print("Unknown flags: {}. Valid flags: {}".format(", ".join(flags.unknown), FLAG_SPEC))
+        sys.exit(1)
+
+    rest = None  # when None, the game is event driven and will only update when it needs to
+    string_rest = flags.get("rest")
     if string_rest is not None:
         try:
             rest = float(string_rest)
         except ValueError:
             print("'{}' is not a valid number for rest.".format(string_rest))
             sys.exit(1)
-    if rest > 1:
+    if rest is not None and rest > 1:
         print("Rest cannot be greater than 1. Rest is the amount of time in seconds it waits to update.")
         print("Making this greater than 1 makes the game unresponsive for too long of a period.")
         sys.exit(1)
 
-    string_file = flag_data.get_flag("file")
+    string_file = flags.get("file")
     save_path = SavePath(Path("./save.dat.d"))
     if string_file:
         save_path = SavePath(Path(string_file))
 
-    is_clean = flag_data.get_flag("clean")  # should we load data?
+    is_clean = flags.get("clean")  # should we load data?
 
     player_handler = PlayerHandler(save_path)
     player_savable = None
 
     result = player_handler.load_player_savables()  # load these anyway
 
-    player_name = flag_data.get_flag("user")
+    player_name = flags.get("user")
     if player_name is not None:
         if is_clean:
             print("Error: Using --clean flag but also specifying a player to load.")
@@ -131,7 +136,7 @@ def auto_flag_setup():
         else:
             print("Successfully loaded player: '{}'".format(player_savable.name))
 
-    if flag_data.get_flag("simple"):
+    if flags.get("simple"):
         # setup_simple(player_savable)
         information = create_simple_player(player_savable)
     else:
@@ -148,13 +153,16 @@ def auto_flag_setup():
 
     player, custom_managers, end_function = information
     try:
-        main_instance = ClientSideMain(NinjaGame(), custom_managers, player, save_path, rest=rest,
-                                       player_handler=player_handler)
+        main_instance = ClientSideMain(NinjaGame(), custom_managers, player, save_path,
+                                       rest=rest if rest is not None else 0.0, player_handler=player_handler)
         main_instance.start()
 
-        while True:
-            main_instance.update()
-            time.sleep(rest)
+        if rest is None:
+            main_instance.run()  # sleeps until there's something to do
+        else:  # the old way: update on a fixed interval
+            while True:
+                main_instance.update()
+                time.sleep(rest)
     finally:
         end_function()
 
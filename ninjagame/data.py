@@ -28,3 +28,7 @@ class EventsObject(Savable):
 
     def before_save(self, player, handler):
         pass
+
+    def _get_snapshot(self, source):
+        return (self.been_introduced_to_furry, self.knows_laura, self.has_cleared_spider_webs_at_entrance,
+                self.has_been_in_center_spider_web_forest)
@@ -21,6 +21,9 @@ class PlayerFriend(Living, Savable):
     def on_load(self, player, handler):
         pass  # nothing to update
 
+    def _get_snapshot(self, source):
+        return self.name
+
 
 class OtherPerson(Living):
     def __init__(self):
@@ -150,7 +150,7 @@ class Entrance(Location):  # players should only be in this location when starti
                 player.location.on_enter(player, self, handler)
 
                 player.send_wait(1.3)
-                handler.input_handlers.append(NameTaker(player))
+                handler.add_input_handler(NameTaker(player))
             return InputHandleType.HANDLED
 
         return InputHandle(InputHandle.PRIORITY_LOCATION, handle_function, self)
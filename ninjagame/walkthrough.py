@@ -0,0 +1,57 @@
+"""
+A scripted walkthrough of the ninja game that is run using a Simulation. It can be run directly to see how many \
+    times per second the whole walkthrough can be played:
+
+    python3 -m ninjagame.walkthrough [runs]
+"""
+import sys
+import time
+from typing import List
+
+from ninjagame.game import NinjaGame
+from textadventure.simulation import Simulation
+
+WALKTHROUGH = ["yes", "Bob", "y", "Jim", "y", "look", "go east", "take wallet", "feel penny", "go west", "go west",
+               "yell hi", "take wooden sword", "take chinese steel sword", "inv", "go east", "go north",
+               "use wooden sword", "go north", "go east", "attack white belt ninja", "attack 0", "attack 0", "attack 0",
+               "attack 0", "attack 0", "attack 0", "attack 0", "go west", "locate", "uuid", "go south"]
+"""The input for a new player that goes through the first few locations and fights the white belt ninja"""
+
+
+def create_simulation(lines: List[str] = WALKTHROUGH, seed: int = 0, capture: bool = True) -> Simulation:
+    """
+    :param lines: The input of the player. By default, WALKTHROUGH
+    :param seed: The seed used so the simulation does the same thing every time. By default, 0
+    :param capture: True if the output should be kept. By default, True
+    :return: A Simulation of the ninja game that has been started
+    """
+    simulation = Simulation(NinjaGame(), [lines], seed=seed, capture=capture)
+    simulation.start()
+    return simulation
+
+
+def run_walkthrough(runs: int) -> float:
+    """
+    Plays the walkthrough runs times without capturing any output
+
+    :param runs: The number of times to play the walkthrough
+    :return: The number of seconds it took
+    """
+    start = time.perf_counter()
+    for _ in range(runs):
+        simulation = create_simulation(capture=False)
+        try:
+            simulation.run()
+        finally:
+            simulation.close()
+    return time.perf_counter() - start
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    seconds = run_walkthrough(runs)
+    print("{} runs in {:.3f}s ({:.1f} runs/s)".format(runs, seconds, runs / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+import unittest
+
+from textadventure.input.inputhandling import CommandInput, FlagSpec, FlagData
+
+
+class FlagSpecParseTest(unittest.TestCase):
+    def test_command_is_not_a_flag(self):
+        spec = FlagSpec({("x",): 2, ("file", "f"): 1})
+        flags = spec.parse(CommandInput("-x --file a"))
+        self.assertNotIn("x", flags)
+        self.assertEqual(flags.get("file"), "a")
+
+    def test_command_does_not_take_arguments(self):
+        spec = FlagSpec({("x",): 1, ("simple",): 0})
+        flags = spec.parse(CommandInput("-x --simple"))
+        self.assertIsNone(flags.get("x"))
+        self.assertTrue(flags.get("simple"))
+
+    def test_flag_is_not_an_argument(self):
+        spec = FlagSpec({("s",): 1, ("f",): 1})
+        flags = spec.parse(CommandInput("a -s -f the a"))
+        self.assertEqual(flags.get("s"), "")
+        self.assertEqual(flags.get("f"), "the")
+
+    def test_flag_ends_arguments(self):
+        spec = FlagSpec({("pair", "p"): 2, ("simple",): 0})
+        flags = spec.parse(CommandInput("a --pair one --simple"))
+        self.assertEqual(flags.get("pair"), ["one"])
+        self.assertTrue(flags.get("simple"))
+
+    def test_arguments_are_not_the_first_argument(self):
+        spec = FlagSpec({("rest", "r"): 1, ("simple",): 0})
+        flags = spec.parse(CommandInput("main --rest 0.5 --simple"))
+        self.assertEqual(flags.get("rest"), "0.5")
+        self.assertTrue(flags.get("simple"))
+
+    def test_no_argument_flag_after_argument(self):
+        spec = FlagSpec({("simple",): 0})
+        flags = spec.parse(CommandInput("main thing --simple"))
+        self.assertFalse(flags.get("simple"))
+
+    def test_unknown(self):
+        spec = FlagSpec({("list", "l"): 0})
+        flags = spec.parse(CommandInput("benchmark --help -l thing --other"))
+        self.assertEqual(flags.unknown, ["help", "other"])
+        self.assertTrue(flags.get("list"))
+
+    def test_flag_data_uses_spec(self):
+        options = {("s",): 1, ("f",): 1}
+        command = CommandInput("a -s -f the a")
+        data = FlagData(command, options)
+        self.assertEqual(data.get_flag("s"), "")
+        self.assertEqual(data.get_flag("f"), "the")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from ninjagame.data import EventsObject
+from ninjagame.entites import PlayerFriend
+
+FLAGS = ("been_introduced_to_furry", "knows_laura", "has_cleared_spider_webs_at_entrance",
+         "has_been_in_center_spider_web_forest")
+
+
+class EventsObjectNeedsSaveTest(unittest.TestCase):
+    def test_new_needs_save(self):
+        self.assertTrue(EventsObject().needs_save(None))
+
+    def test_saved_does_not_need_save(self):
+        events = EventsObject()
+        events.mark_saved(None)
+        self.assertFalse(events.needs_save(None))
+
+    def test_each_flag_needs_save(self):
+        for flag in FLAGS:
+            with self.subTest(flag=flag):
+                events = EventsObject()
+                events.mark_saved(None)
+                setattr(events, flag, True)
+                self.assertTrue(events.needs_save(None))
+                events.mark_saved(None)
+                self.assertFalse(events.needs_save(None))
+
+
+class PlayerFriendNeedsSaveTest(unittest.TestCase):
+    def test_name_needs_save(self):
+        friend = PlayerFriend("Friend")
+        friend.mark_saved(None)
+        self.assertFalse(friend.needs_save(None))
+        friend.name = "Buddy"
+        self.assertTrue(friend.needs_save(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,6 +20,12 @@ class EntityActionToEntityManager(Manager):
     def update(self, handler: Handler):
         pass
 
+    def get_update_interval(self):
+        return None  # update doesn't do anything
+
+    def get_action_types(self):
+        return EntityActionToEntity,
+
     def on_action(self, handler: Handler, action: Action):
         if isinstance(action, EntityActionToEntity):
             can_do = action.asked_entity.can_do_action(handler, action)
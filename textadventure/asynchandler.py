@@ -0,0 +1,181 @@
+"""
+This file has the AsyncHandler which runs the game on an asyncio event loop. Unlike the normal Handler that needs \
+    a Thread for each InputGetter that blocks (like KeyboardInputGetter), the AsyncHandler awaits each \
+    AsyncInputGetter on the same thread which lets thousands of CommandSenders share one thread.
+
+InputHandlers, Managers and Locations don't need to change to work with this. They are updated exactly like they \
+    are with a normal Handler.
+"""
+import asyncio
+import warnings
+from collections import deque
+from typing import List, Optional, Iterator, Tuple, Dict, Deque
+
+from textadventure.entity import Identifiable
+from textadventure.handler import Handler
+from textadventure.manager import Manager
+from textadventure.sending.commandsender import CommandSender, AsyncInputGetter, AsyncOutputSender
+
+
+class AsyncHandler(Handler):
+    """
+    A Handler that is meant to be run using the run_async coroutine. It can still be updated the same way a \
+    normal Handler is updated, but input from AsyncInputGetters will only be received while run_async is running.
+
+    CommandSenders whose InputGetter isn't an AsyncInputGetter are still supported. They're polled just like they \
+    are with a normal Handler.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Takes the same arguments as Handler
+        """
+        super().__init__(*args, **kwargs)
+        self._input_tasks = {}  # type Dict[CommandSender, asyncio.Task]
+        """A dict of each CommandSender with an AsyncInputGetter and the Task that is waiting for its input"""
+        self._ready_inputs = deque()  # type Deque[Tuple[CommandSender, str]]
+        """The input that has been received but hasn't been handled yet. Added to by each Task in _input_tasks"""
+        self._wake_event = None  # type Optional[asyncio.Event]
+        """Initialized in run_async. Set when the AsyncHandler should stop waiting and update."""
+
+    def add_identifiable(self, identifiable: Identifiable):
+        super().add_identifiable(identifiable)
+        self.__update_input_tasks()  # so a CommandSender added while run_async is running gets input right away
+
+    def remove_identifiable(self, identifiable: Identifiable):
+        super().remove_identifiable(identifiable)
+        self.__update_input_tasks()
+
+    def _take_inputs(self) -> Iterator[Tuple[CommandSender, str]]:
+        self.__update_input_tasks()
+        while self._ready_inputs:
+            yield self._ready_inputs.popleft()
+
+        for sender in self.get_command_senders():
+            if not isinstance(sender.input_getter, AsyncInputGetter):  # polled just like a normal Handler would
+                inp = sender.take_input()
+                if inp is not None:
+                    yield sender, inp
+
+    def __update_input_tasks(self):
+        """
+        Starts a Task for each new CommandSender that has an AsyncInputGetter and cancels the Tasks of the \
+        CommandSenders that have been removed.
+        """
+        if self._wake_event is None:
+            return  # run_async isn't running so we can't start any Tasks
+
+        senders = set()
+        for sender in self.get_command_senders():
+            if isinstance(sender.input_getter, AsyncInputGetter):
+                senders.add(sender)
+                if sender not in self._input_tasks:
+                    task = asyncio.ensure_future(self.__receive_input(sender))
+                    task.add_done_callback(self.__on_input_task_done)
+                    self._input_tasks[sender] = task
+
+        for sender in [sender for sender in self._input_tasks.keys() if sender not in senders]:
+            self._input_tasks.pop(sender).cancel()
+
+    async def __receive_input(self, sender: CommandSender):
+        input_getter = sender.input_getter  # type AsyncInputGetter
+        while True:
+            inp = await input_getter.wait_for_input()
+            if inp is None:
+                break
+            self._ready_inputs.append((sender, inp))
+            self._wake_event.set()
+
+    def __on_input_task_done(self, task: asyncio.Task):
+        """
+        Called when a Task in _input_tasks is done. If the InputGetter raised an exception, it is shown as a warning \
+        instead of being hidden in the Task
+        """
+        if task.cancelled():
+            return
+        exception = task.exception()  # this also makes it so asyncio doesn't complain that it was never retrieved
+        if exception is not None:
+            warnings.warn("An AsyncInputGetter raised an exception while waiting for input: {!r}".format(exception))
+            if self._wake_event is not None:
+                self._wake_event.set()
+
+    def __on_notified(self):
+        self.wakeup_notifier.clear()
+        self._wake_event.set()
+
+    async def flush_outputs(self):
+        """
+        Awaits flush on each AsyncOutputSender that needs to be flushed
+        """
+        to_flush = []
+        for sender in self.get_command_senders():
+            output = sender.output
+            if isinstance(output, AsyncOutputSender) and output.needs_flush():
+                to_flush.append(output.flush())
+        if to_flush:
+            await asyncio.gather(*to_flush)
+
+    async def wait_async(self, other_managers: List[Manager] = (), max_wait: Optional[float] = None) -> bool:
+        """
+        The same as wait except this doesn't block the event loop. This can only be called while run_async is running
+
+        :param other_managers: Managers that aren't in self.managers but are updated with this Handler (like the \
+                custom managers in Main). By default, empty
+        :param max_wait: The maximum amount of time in seconds to wait or None to wait as long as needed
+        :return: True if something woke up the Handler, False if it was woken up because it was time to
+        """
+        self.__update_input_tasks()  # in case a CommandSender was added to self.identifiables directly
+        if self._ready_inputs:
+            return True
+        next_time = self.get_next_update_time(other_managers)
+        timeout = None if next_time is None else max(0.0, next_time - self.clock())
+        if max_wait is not None and (timeout is None or timeout > max_wait):
+            timeout = max_wait
+        if timeout == 0:
+            return False
+
+        loop = asyncio.get_event_loop()
+        files = []
+        for sender in self.get_command_senders():
+            input_file = sender.input_getter.get_input_file()
+            if input_file is not None:
+                files.append(input_file)
+                loop.add_reader(input_file, self._wake_event.set)
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._wake_event.clear()
+            for input_file in files:
+                loop.remove_reader(input_file)
+
+    async def run_async(self, other_managers: List[Manager] = (), max_wait: Optional[float] = None):
+        """
+        Updates this AsyncHandler until should_end is True. Between each update, this awaits until there is input, \
+        until a Location or Manager needs to be updated or until something notifies self.wakeup_notifier.
+
+        Note that start should be called before this
+
+        :param other_managers: Managers that aren't in self.managers but should be updated right after this Handler \
+                is updated (like the custom managers in Main). By default, empty
+        :param max_wait: The maximum amount of time in seconds to wait between updates or None (default) to wait as\
+                long as needed
+        """
+        assert self._wake_event is None, "run_async is already running"
+        loop = asyncio.get_event_loop()
+        self._wake_event = asyncio.Event()
+        loop.add_reader(self.wakeup_notifier, self.__on_notified)  # lets other threads wake up the event loop
+        try:
+            while not self.should_end:
+                self.update()
+                self.update_managers(other_managers)
+                await self.flush_outputs()
+                await self.wait_async(other_managers, max_wait=max_wait)
+        finally:
+            loop.remove_reader(self.wakeup_notifier)
+            for task in self._input_tasks.values():
+                task.cancel()
+            self._input_tasks.clear()
+            self._wake_event = None
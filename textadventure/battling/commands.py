@@ -8,6 +8,7 @@ from textadventure.commands.command import SimpleCommandHandler
 from textadventure.handler import Handler
 from textadventure.input.inputhandling import CommandInput, InputHandleType
 from textadventure.player import Player
+from textadventure.reference import AMBIGUOUS_MESSAGE
 from textadventure.sending.commandsender import CommandSender
 from textadventure.sending.message import Message
 from textadventure.utils import join_list
@@ -19,7 +20,9 @@ class AttackCommandHandler(SimpleCommandHandler):
         in a battle
     """
 
-    command_names = ["fight", "battle", "attack", "figh", "fite", "kill", "battel", "batel", "att", "harm"]
+    command_names = ["fight", "battle", "attack", "fite", "kill", "batel", "att", "harm"]
+    # fite and batel are 2 typos from fight and battle but Handler's CommandLexicon only allows 1 for words of 4 or 5
+    #   letters. Misspellings it does find (like figh and battel) aren't in command_names
     description = "Used to start a battle with an another entity."
 
     def __init__(self):
@@ -46,11 +49,15 @@ class AttackCommandHandler(SimpleCommandHandler):
                 player.send_message("Who would you like to battle?")
                 return InputHandleType.HANDLED
             reference = " ".join(first_arg)
-            challenged = player.location.get_referenced_entity(handler, reference)
-            if challenged is None:
+            match = player.location.find_referenced_entity(handler, reference)
+            if match is None:
                 player.send_message(Message("Cannot find entity named: '{}' in your current location.",
                                             named_variables=[reference]))
                 return InputHandleType.HANDLED
+            if match.is_ambiguous():
+                player.send_message(Message(AMBIGUOUS_MESSAGE, named_variables=[match.value, match.runner_up]))
+                return InputHandleType.HANDLED
+            challenged = match.value
             challenge_action = EntityChallengeAction(player, challenged)
             handler.do_action(challenge_action)
             challenge_action.try_action(handler)
@@ -44,6 +44,15 @@ class BattleManager(Manager):
             if battle.has_ended:
                 self.active_battles.remove(battle)  # the battle has ended so remove it
 
+    def get_next_update_time(self, handler: Handler):
+        for battle in self.active_battles:
+            turn = battle.current_turn
+            if battle.has_ended or (battle.should_update() and turn is not None and not turn.is_started):
+                # the battle needs to be removed or the next turn needs to be started. Once a turn has started,
+                #   it's waiting for input
+                return handler.clock()
+        return None
+
     def add_battle(self, battle: Battle):
         """
         Adds a battle to the list of active_battles. If the battle has not started, it will not start the battle
@@ -66,6 +75,10 @@ class BattleManager(Manager):
 
         return r
 
+    def get_action_types(self):
+        from textadventure.location import GoAction
+        return GoAction,
+
     def on_action(self, handler: Handler, action: Action):
         from textadventure.location import GoAction
         if isinstance(action, GoAction):
@@ -92,6 +105,14 @@ class HostileEntityManager(Manager):
     def update(self, handler: Handler):
         pass
 
+    def get_update_interval(self):
+        return None  # update doesn't do anything
+
+    def get_action_types(self):
+        from textadventure.location import GoAction
+        from textadventure.battling.actions import BattleEnd
+        return GoAction, BattleEnd
+
     def on_action(self, handler: Handler, action: Action):
         from textadventure.location import GoAction
         from textadventure.battling.actions import BattleEnd
@@ -126,10 +147,12 @@ class HostileEntityManager(Manager):
                         continue
                     for entity in team.members:
                         if winning_team == team:  # entity has beaten hostile
-                            hostile.entities_lost_to.append(entity.uuid)
+                            hostile.entities_lost_to.add(entity.uuid)
+                            hostile.mark_dirty()
                             # print("Appended to lost_to: {}".format(entity))
                         elif winning_team == hostile_team:  # extra elif that will only be false if more than 3 teams
-                            hostile.entities_won_against.append(entity.uuid)
+                            hostile.entities_won_against.add(entity.uuid)
+                            hostile.mark_dirty()
                             # print("Appended to won_to: {}".format(entity))
                         else:
                             raise Exception("This shouldn't be called unless there are more than 2 teams")
@@ -148,6 +171,13 @@ class DamageActionManager(Manager):
     def update(self, handler: Handler):
         pass
 
+    def get_update_interval(self):
+        return None  # update doesn't do anything
+
+    def get_action_types(self):
+        from textadventure.battling.actions import DamageAction
+        return DamageAction,
+
     def on_action(self, handler: Handler, action: Action):
         from textadventure.battling.actions import DamageAction
         if isinstance(action, DamageAction):
@@ -174,6 +204,13 @@ class PropertyEffectManager(Manager):
     def update(self, handler: 'Handler'):
         pass
 
+    def get_update_interval(self):
+        return None  # update doesn't do anything
+
+    def get_action_types(self):
+        from textadventure.battling.actions import BattleStart
+        return BattleStart,
+
     def on_action(self, handler: 'Handler', action: Action):
         from textadventure.battling.actions import BattleStart
         if isinstance(action, BattleStart):
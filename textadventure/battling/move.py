@@ -4,7 +4,7 @@ from typing import List, Dict, Optional, TYPE_CHECKING, Type, TypeVar
 from textadventure.battling.outcome import MoveOutcome, OutcomePart  # needed
 from textadventure.battling.team import Team
 from textadventure.entity import Entity
-from textadventure.utils import CanDo
+from textadventure.utils import CanDo, SlotsPickleMixin
 
 if TYPE_CHECKING:  # if removed, will cause type errors
     from textadventure.battling.choosing import MoveOption, MoveChooser
@@ -16,13 +16,14 @@ if TYPE_CHECKING:  # if removed, will cause type errors
 T = TypeVar('T')
 
 
-class Target:
+class Target(SlotsPickleMixin):
     """
     An object that stores information on the current turn and what moves it can use
 
     Later, if the api is changed for a pokemon like game, we want to make sure this class doesn't heavily rely on
         Entity when Entity could be changed drastically for a Pokemon game. Just a thought for future maintainability
     """
+    __slots__ = ("entity", "team", "move_chooser", "turn_number", "effects")
 
     def __init__(self, entity: Entity, team: Team, move_chooser: 'MoveChooser', turn_number: int):
         """
@@ -79,12 +80,14 @@ class Target:
         return target
 
 
-class Turn:
+class Turn(SlotsPickleMixin):
     """
     A class that holds data for a single turn and that contains methods that can be called to initiate the turn.
     The reason this has methods to initiate and to do the turn, is because it should be divided from the Battle class\
         what better way to use all of the data in a turn than using its own methods.
     """
+    __slots__ = ("number", "targets", "is_started", "is_doing", "is_done", "chosen_moves")
+
     def __init__(self, number: int, targets: List[Target]):
         self.number = number
         self.targets = targets  # remember, this is stored like this because a Team has entities as members
@@ -3,7 +3,7 @@ from abc import abstractmethod, ABC
 from typing import List, Optional
 
 from textadventure.sending.message import Message
-from textadventure.utils import CanDo, MessageConstant
+from textadventure.utils import CanDo, MessageConstant, SlotsPickleMixin
 
 if typing.TYPE_CHECKING:
     from textadventure.battling.battle import Battle
@@ -11,7 +11,8 @@ if typing.TYPE_CHECKING:
     from textadventure.battling.effect import Effect
 
 
-class OutcomePart(ABC):
+class OutcomePart(SlotsPickleMixin, ABC):
+    __slots__ = ()
 
     @abstractmethod
     def get_message(self) -> Optional[MessageConstant]:
@@ -57,6 +58,8 @@ class UseMoveOutcome(OutcomePart):
         Usually, for the most part, there shouldn't really be special ones that appear every time because the \
         information displayed may be something that should be displayed with a command.
     """
+    __slots__ = ("move",)
+
     def __init__(self, move: 'Move'):
         self.move = move
 
@@ -74,6 +77,8 @@ class UseMoveOutcome(OutcomePart):
 
 
 class HealthChangeOutcome(OutcomePart):
+    __slots__ = ("affected_target", "before_health", "multiplier")
+
     def __init__(self, affected_target: 'Target', before_health: int, multiplier: int=1):
         """
         :param affected_target: The Target that has had its health changed
@@ -109,6 +114,8 @@ class HealthChangeOutcome(OutcomePart):
 
 
 class EffectAddedOutcome(OutcomePart):
+    __slots__ = ("affected_target", "added_effect")
+
     def __init__(self, affected_target: 'Target', added_effect: 'Effect'):
         self.affected_target = affected_target
         self.added_effect = added_effect
@@ -118,6 +125,8 @@ class EffectAddedOutcome(OutcomePart):
 
 
 class EffectRemoveOutcome(OutcomePart):
+    __slots__ = ("affected_target", "removed_effect")
+
     def __init__(self, affected_target: 'Target', removed_effect: 'Effect'):
         self.affected_target = affected_target
         self.removed_effect = removed_effect
@@ -1,6 +1,7 @@
 import _thread
 import sys
 import threading
+import time
 from threading import Thread
 from typing import Optional, TYPE_CHECKING
 
@@ -11,6 +12,7 @@ from textadventure.sending.commandsender import InputGetter, OutputSender, Outpu
 
 if TYPE_CHECKING:
     from textprint.input import InputLineUpdater
+    from textadventure.wakeup import WakeupNotifier
 
 
 class KeyboardInputGetter(InputGetter, Thread):
@@ -27,6 +29,8 @@ class KeyboardInputGetter(InputGetter, Thread):
         self.inputs = []
         self.output = output
         self.input_prompt = self.__class__.DEFAULT_INPUT_PROMPT
+        self.notifier = None
+        """The WakeupNotifier passed to get_next_input_time or None. Notified each time there is new input"""
 
         self.daemon = True
 
@@ -37,6 +41,7 @@ class KeyboardInputGetter(InputGetter, Thread):
             except EOFError:
                 _thread.interrupt_main()  # TODO find a better replacement
                 # threading.main_thread().idk
+                self.__notify()  # if the main thread is waiting, it needs to wake up to get interrupted
                 return
 
             self.input_prompt = self.__class__.DEFAULT_INPUT_PROMPT
@@ -51,6 +56,12 @@ class KeyboardInputGetter(InputGetter, Thread):
             #     continue
 
             self.inputs.append(inp)
+            self.__notify()
+
+    def __notify(self):
+        notifier = self.notifier
+        if notifier is not None:
+            notifier.notify()
 
     @staticmethod
     def should_use_input(inp: str):
@@ -64,20 +75,40 @@ class KeyboardInputGetter(InputGetter, Thread):
 
         return r
 
+    def get_next_input_time(self, notifier: 'WakeupNotifier'):
+        self.notifier = notifier
+        if len(self.inputs) > 0:
+            return time.time()
+        return None  # we will notify when there is input
+
 
 class BasicInputGetter(InputGetter, Manager):
+    """
+    Unlike every other InputGetter, take_input pauses the thread until the player presses enter. Because of that, \
+    this can only be polled. When the Handler has one of these, Main.run updates it on a fixed interval instead of \
+    waiting for input. If you want the game to be event driven, use KeyboardInputGetter instead
+    """
     def __init__(self):
         pass
 
     def take_input(self):
         return input()
 
+    def get_next_input_time(self, notifier: 'WakeupNotifier'):
+        return time.time()  # we can't notify so if something calls Handler.wait, don't let it wait forever
+
+    def is_polling_only(self):
+        return True
+
     def update(self, handler: 'Handler'):
         pass
 
     def on_action(self, handler: 'Handler', action: Action):
         pass
 
+    def get_action_types(self):
+        return ()
+
 
 class TextPrinterInputGetter(InputGetter, Manager):
     """
@@ -106,6 +137,14 @@ class TextPrinterInputGetter(InputGetter, Manager):
 
         return None
 
+    def get_next_input_time(self, notifier: 'WakeupNotifier'):
+        if self._amount_taken < len(self.updater.string_lines()):
+            return time.time()  # we already have lines that haven't been taken
+        return None
+
+    def get_input_file(self):
+        return sys.stdin  # curses reads key presses from stdin so we'll wake up when a key is pressed
+
     def update(self, handler: 'Handler'):
         # start = time.time()  # tested and seems to have a good speed
         self.updater.update()
@@ -114,3 +153,6 @@ class TextPrinterInputGetter(InputGetter, Manager):
 
     def on_action(self, handler: 'Handler', action: Action):
         pass
+
+    def get_action_types(self):
+        return ()
@@ -189,6 +189,14 @@ class ImmediateStreamOutput(Manager, BaseStreamOutput):
     def on_action(self, handler: 'Handler', action: Action):
         pass
 
+    def get_action_types(self):
+        return ()
+
+    def get_next_update_time(self, handler: 'Handler'):
+        if len(self.messages) != 0:
+            return time.time()
+        return None
+
 
 class TextPrinterOutput(Manager, OutputSender):
     def __init__(self, printer: 'TextPrinter', section: 'Section'):
@@ -215,6 +223,8 @@ class TextPrinterOutput(Manager, OutputSender):
             call the update method and set immediate to True"""
         self._last_blank = 0
         """Used in on_input to tell how long it's been since the user pressed enter with no input"""
+        self._next_print_time = None
+        """Used by __print_parts to remember when the next character in current_line_parts should be printed"""
 
         self.wait_multiplier = 1
 
@@ -250,11 +260,23 @@ class TextPrinterOutput(Manager, OutputSender):
     def on_action(self, handler: 'Handler', action: Action):
         pass
 
+    def get_action_types(self):
+        return ()
+
     def update(self, handler: 'Handler'):
         """If you're reading this, all you have to know is that this calls __add_messages and __print_parts"""
         self.__add_messages()
         self.__print_parts()
 
+    def get_next_update_time(self, handler: 'Handler'):
+        if len(self.messages) != 0:
+            return time.time()
+        if self.current_line_parts is not None:
+            return self._next_print_time  # we are in the middle of printing a line
+        if len(self.message_parts) != 0 and len(self.message_parts[0]) != 0:
+            return time.time()  # there is another line waiting to be printed
+        return None
+
     def __add_messages(self):
         if len(self.message_parts) == 0:
             self.message_parts.append([])
@@ -294,6 +316,7 @@ class TextPrinterOutput(Manager, OutputSender):
             contents = ""  # the contents that we will return based on parts
             for part in parts:
                 if add_time and time_count >= passed:  # first check if this message is instant then check time
+                    self._next_print_time = self.current_line_parts[1] + time_count
                     return False, contents  # we are done printing. Must have been added from wait_after_print
                 contents += part.print_before
                 wait = part.wait_between * self.wait_multiplier
@@ -302,6 +325,7 @@ class TextPrinterOutput(Manager, OutputSender):
                 else:
                     for c in part.main_text:
                         if add_time and time_count >= passed:
+                            self._next_print_time = self.current_line_parts[1] + time_count
                             return False, contents  # we are done printing for now
                         contents += c
                         if add_time:
@@ -362,6 +386,12 @@ class OutputNotifierSender(Manager, OutputSender):
     def on_action(self, handler: 'Handler', action: Action):
         self.manager_sender.on_action(handler, action)
 
+    def get_action_types(self):
+        return self.manager_sender.get_action_types()
+
+    def get_next_update_time(self, handler: 'Handler'):
+        return self.manager_sender.get_next_update_time(handler)
+
     def send_message(self, message: Message):
         self.manager_sender.send_message(message)
         self.to_notify()
@@ -382,6 +412,9 @@ class LocationTitleBarManager(Manager):
     def on_action(self, handler: 'Handler', action: Action):
         pass
 
+    def get_action_types(self):
+        return ()
+
     def update(self, handler: 'Handler'):
         location = self.player.location
         point = location.point
@@ -88,7 +88,8 @@ class SimpleCommandHandler(CommandHandler):
         """
         A subclass of CommandHandler that makes using/extending CommandHandler simpler
 
-        :param command_names: A list of strings that will trigger this command
+        :param command_names: A list of lower case strings that will trigger this command. Typos don't need to be \
+                in this list since the Handler recognizes commands that are close to a command name
         :param description: The help/description string
         """
         super(SimpleCommandHandler, self).__init__()
@@ -96,7 +97,14 @@ class SimpleCommandHandler(CommandHandler):
         self.description = description
 
     def _should_handle_command(self, command_input: CommandInput):
-        return command_input.get_command().lower() in self.command_names
+        return command_input.get_command_name() in self.command_names
+
+    def get_command_names(self):
+        cls = type(self)
+        if cls._should_handle_command is not SimpleCommandHandler._should_handle_command \
+                or cls.on_input is not CommandHandler.on_input:
+            return None  # the subclass decides what to handle so we can't assume it only handles command_names
+        return self.command_names
 
     def send_help(self, sender: CommandSender):
         sender.send_message(self.description)
@@ -10,6 +10,7 @@ from textadventure.item.holder import Holder
 from textadventure.item.item import FiveSensesHandler, Item
 from textadventure.location import Location
 from textadventure.player import Player
+from textadventure.reference import ReferenceMatch, get_best_match, get_holder_index, AMBIGUOUS_MESSAGE
 from textadventure.sending.commandsender import CommandSender
 from textadventure.sending.message import Message, MessageType
 from textadventure.utils import Point, NORTH, EAST, SOUTH, WEST, UP, DOWN, ZERO, CanDo
@@ -17,22 +18,53 @@ from textadventure.utils import Point, NORTH, EAST, SOUTH, WEST, UP, DOWN, ZERO,
 """This file holds some nice commands and util methods that help out with it. Most of the commands are essential."""
 
 
+def find_reference(player: Player, string_args: str) -> Optional[ReferenceMatch[Item]]:
+    """
+    Finds the item in the player's location or the player's inventory that is closest to string_args. If an item \
+    in the location and an item in the inventory are equally close, the one in the location is used.
+
+    :param player: the player
+    :param string_args: The arguments that the player entered
+    :return: The ReferenceMatch or None if no item is close enough. Use is_ambiguous to see if the player may have \
+            meant another item
+    """
+    location = player.location
+    return get_best_match(get_holder_index(location).find(location.items, string_args),
+                          get_holder_index(player).find(player.items, string_args))
+
+
 def get_reference(player: Player, string_args: str) -> Optional[Item]:
     """
-    Senses command handler has a good code snippet that shows how you should use this method
-    Note: Remember, this can return None.
+    Note: Remember, this can return None. Commands should usually use ask_reference instead
 
     :param player: the player
     :param string_args: The arguments that the player entered
-    :return: The weapon
+    :return: The weapon that is closest to string_args. See find_reference
     """
-    for item in player.location.items:
-        if item.is_reference(string_args):
-            return item
-    for item in player.items:
-        if item.is_reference(string_args):
-            return item
-    return None
+    match = find_reference(player, string_args)
+    if match is None:
+        return None
+    return match.value
+
+
+def ask_reference(player: Player, string_args: str) -> Optional[Item]:
+    """
+    Like get_reference except this sends the player a message when None is returned. If no item is close enough, \
+    Item.CANNOT_SEE[1] is sent. If the player may have meant another item they can reference, they are asked which \
+    one they meant. (See AMBIGUOUS_MESSAGE)
+
+    :param player: the player
+    :param string_args: The arguments that the player entered
+    :return: The item that is closest to string_args or None if the player has already been sent a message
+    """
+    match = find_reference(player, string_args)
+    if match is None:
+        player.send_message(Item.CANNOT_SEE[1])
+        return None
+    if match.is_ambiguous() and match.runner_up.can_reference(player)[0]:
+        player.send_message(Message(AMBIGUOUS_MESSAGE, named_variables=[match.value, match.runner_up]))
+        return None
+    return match.value
 
 
 def get_point(handler: Handler, player: Player, string_args: str) -> Optional[Point]:
@@ -124,14 +156,13 @@ class SensesCommandHandler(LocationCommandHandler):
         first_arg = command_input.get_arg(0)
         if len(first_arg) != 0:  # thing stuff
             # here to
-            referenced_item = get_reference(sender, " ".join(first_arg))
+            referenced_item = ask_reference(sender, " ".join(first_arg))
             if referenced_item is None:
-                sender.send_message(Item.CANNOT_SEE[1])
                 return InputHandleType.HANDLED
             can_ref = referenced_item.can_reference(sender)
             if can_ref[0] is False:
                 sender.send_message(can_ref[1])
-            else:  # here is how you should use get_reference
+            else:  # here is how you should use ask_reference
                 can_do_sense = self.can_sense(referenced_item, sender)
                 if can_do_sense[0]:
                     self.sense(referenced_item, handler, sender)
@@ -143,7 +174,9 @@ class SensesCommandHandler(LocationCommandHandler):
 
 
 class LookCommandHandler(SensesCommandHandler):
-    command_names = ["look", "see", "lok", "find", "se", "ook", "ls"]  # yeah I know, magic strings deal with it
+    command_names = ["look", "see", "lok", "find", "se", "ls"]  # yeah I know, magic strings deal with it
+    # Misspellings that Handler's CommandLexicon finds on its own aren't in command_names. These ones it can't find:
+    #   se: words of 2 letters can't have typos. lok: just as close to loc (locate) so it's ambiguous
     description = """Allows you to see your surroundings. Aliases: look, see, find\nUsage: look [thing] """
 
     def __init__(self, location: Location):
@@ -157,7 +190,7 @@ class LookCommandHandler(SensesCommandHandler):
 
 
 class ListenCommandHandler(SensesCommandHandler):
-    command_names = ["listen", "hear", "escucha", "liste", "isten", "hea", "listne"]
+    command_names = ["listen", "hear", "escucha"]
     description = """Allows you to listen to your surroundings. Aliases: listen, hear\nUsage: listen [thing]"""
 
     def __init__(self, location: Location):
@@ -171,7 +204,8 @@ class ListenCommandHandler(SensesCommandHandler):
 
 
 class FeelCommandHandler(SensesCommandHandler):
-    command_names = ["feel", "touch", "eel", "fee", "tou", "tuch", "toch"]
+    command_names = ["feel", "touch", "fee", "tou"]
+    # fee: just as close to see (look) so it's ambiguous. tou: 2 typos from touch but 3 letter words can only have 1
     description = """Allows you to feel your surroundings. Aliases: look, touch\nUsage: feel [item]"""
 
     def __init__(self, location: Location):
@@ -185,7 +219,8 @@ class FeelCommandHandler(SensesCommandHandler):
 
 
 class SmellCommandHandler(SensesCommandHandler):
-    command_names = ["smell", "nose", "smel", "mell", "nos", "smeel", "smee", "mel"]
+    command_names = ["smell", "nose", "mell", "smee"]
+    # mell: just as close to yell so it's ambiguous. smee: closer to see (look)
     description = """Allows you to smell your surroundings. Aliases: smell, nose\nUsage: smell [item]"""
 
     def __init__(self, location: Location):
@@ -199,7 +234,7 @@ class SmellCommandHandler(SensesCommandHandler):
 
 
 class TasteCommandHandler(SensesCommandHandler):
-    command_names = ["taste", "tongue", "aste", "tast"]
+    command_names = ["taste", "tongue"]
     description = """Allows you to taste. Aliases: taste, tongue\nUsage: taste [item]"""
 
     def __init__(self, location: Location):
@@ -214,7 +249,7 @@ class TasteCommandHandler(SensesCommandHandler):
 
 class GoCommandHandler(SimpleCommandHandler):  # written on friday with a football ninjagame
 
-    command_names = ["go", "move", "mov", "ove", "va", "voy", "walk", "step"]
+    command_names = ["go", "move", "va", "voy", "walk", "step"]  # va and voy are Spanish, not typos
     description = "Allows you to go to another location usually nearby. Aliases: go, move\n" \
                   "Usage: go <location or direction>"
 
@@ -278,7 +313,7 @@ class DirectionInputHandler(PlayerInputHandler):
 
 
 class TakeCommandHandler(SimpleCommandHandler):
-    command_names = ["take", "grab", "tak", "steal", "pick", "pik", "pickup"]
+    command_names = ["take", "grab", "steal", "pick", "pickup"]
     description = "Allows you to take something from a location or someone. Aliases: take, grab, pickup\n" \
                   "Usage: take <weapon name>"
 
@@ -293,10 +328,8 @@ class TakeCommandHandler(SimpleCommandHandler):
         if not first_arg:
             self.send_help(player)
             return InputHandleType.HANDLED
-        item = get_reference(player, " ".join(first_arg))
-
+        item = ask_reference(player, " ".join(first_arg))
         if item is None:
-            player.send_message(Item.CANNOT_SEE[1])
             return InputHandleType.HANDLED
         can_ref = item.can_reference(player)
         if can_ref[0] is False:
@@ -325,7 +358,7 @@ class TakeCommandHandler(SimpleCommandHandler):
 
 
 class PlaceCommandHandler(SimpleCommandHandler):
-    command_names = ["place", "put", "plac", "drop"]
+    command_names = ["place", "put", "drop"]
     description = "Allows you to place something in your current location. Aliases: place, put, drop\n" \
                   "Usage: place <weapon name>"
 
@@ -341,10 +374,8 @@ class PlaceCommandHandler(SimpleCommandHandler):
         if not first_arg:
             self.send_help(player)
             return InputHandleType.HANDLED
-        item = get_reference(player, " ".join(first_arg))
-
+        item = ask_reference(player, " ".join(first_arg))
         if item is None:
-            player.send_message(Item.CANNOT_SEE[1])
             return InputHandleType.HANDLED
         can_ref = item.can_reference(player)
         if can_ref[0] is False:
@@ -365,7 +396,7 @@ class PlaceCommandHandler(SimpleCommandHandler):
 
 
 class YellCommandHandler(SimpleCommandHandler):
-    command_names = ["yell", "yel", "grita", "grito", "shout", "holler", "echo"]
+    command_names = ["yell", "grita", "grito", "shout", "holler", "echo"]
     description = "Allows you to yell out something that someone or something may respond to. Use with caution.\n" \
                   "Aliases: yell\nUsage: yell <text to yell>"
 
@@ -410,10 +441,10 @@ class UseCommandHandler(SimpleCommandHandler):
         if not first_arg:
             self.send_help(player)
             return InputHandleType.HANDLED
-        item = get_reference(player, " ".join(first_arg))
-        can_ref = Item.CANNOT_SEE  # by default, make it so they can't see the item
-        if item is not None:
-            can_ref = item.can_reference(player)  # check if they can reference/see the item
+        item = ask_reference(player, " ".join(first_arg))
+        if item is None:
+            return InputHandleType.HANDLED
+        can_ref = item.can_reference(player)  # check if they can reference/see the item
         if can_ref[0] is False:
             player.send_message(can_ref[1])
             return InputHandleType.HANDLED
@@ -434,7 +465,8 @@ class NameCommandHandler(SimpleCommandHandler):
 
 
 class InventoryCommandHandler(SimpleCommandHandler):
-    command_names = ["inv", "inventory", "inve", "invet", "invetory", "items"]
+    command_names = ["inv", "inventory", "invet", "items"]
+    # invet: 2 typos from inv and further from inventory but 5 letter words can only have 1
     description = "Allows you to see what's in your inventory"
 
     def __init__(self):
@@ -449,14 +481,14 @@ class InventoryCommandHandler(SimpleCommandHandler):
         if amount == 0:
             holder.send_message("You don't have anything in your inventory")
         elif amount == 1:
-            holder.send_message(Message("You have {}.", named_variables=holder.items))
+            holder.send_message(Message("You have {}.", named_variables=list(holder.items)))
         else:
             names = []
             for i in range(0, amount):
                 names.append("{}")
 
             holder.send_message(Message("You have these items: {}".format(", ".join(names)),
-                                        named_variables=holder.items))
+                                        named_variables=list(holder.items)))
 
         return InputHandleType.HANDLED
 
@@ -503,3 +535,41 @@ class UUIDCommandHandler(SimpleCommandHandler):
             return InputHandleType.HANDLED
 
         return InputHandleType.UNSUPPORTED_SENDER
+
+
+class PerfCommandHandler(SimpleCommandHandler):
+    command_names = ["perf"]
+    description = "Shows how long each part of the game's update takes.\n" \
+                  "Usage: perf [on, off, reset or all] - 'perf on' starts recording and 'perf' shows the slowest parts."
+
+    def __init__(self):
+        super().__init__(self.__class__.command_names, self.__class__.description)
+
+    def _handle_command(self, handler: Handler, sender: CommandSender, command_input: CommandInput):
+        first_arg = command_input.get_arg(0)
+        option = first_arg[0].lower() if len(first_arg) != 0 else None
+        if option == "on":
+            handler.enable_profiling()
+            sender.send_message(Message("Started recording how long each update takes.", MessageType.IMMEDIATE))
+            return InputHandleType.HANDLED
+        if option == "off":
+            handler.disable_profiling()
+            sender.send_message(Message("Stopped recording how long each update takes.", MessageType.IMMEDIATE))
+            return InputHandleType.HANDLED
+        if handler.profiler is None:
+            sender.send_message(Message("Nothing is being recorded. Use 'perf on' to start.", MessageType.IMMEDIATE))
+            return InputHandleType.HANDLED
+        if option == "reset":
+            handler.profiler.reset()
+            sender.send_message(Message("Reset the recorded times.", MessageType.IMMEDIATE))
+            return InputHandleType.HANDLED
+        if option is not None and option != "all":
+            self.send_help(sender)
+            return InputHandleType.HANDLED
+
+        stats = handler.get_profiler_stats(None if option == "all" else 6)  # the tick and the top 5
+        if len(stats) == 0:
+            sender.send_message(Message("There aren't any recorded times yet.", MessageType.IMMEDIATE))
+        else:
+            sender.send_message(Message("\n".join(str(stat) for stat in stats), MessageType.IMMEDIATE))
+        return InputHandleType.HANDLED
@@ -6,7 +6,7 @@ from textadventure.battling.commands import AttackCommandHandler
 from textadventure.battling.managing import DamageActionManager, BattleManager, HostileEntityManager
 from textadventure.commands.commands import GoCommandHandler, TakeCommandHandler, PlaceCommandHandler, \
     YellCommandHandler, UseCommandHandler, NameCommandHandler, InventoryCommandHandler, LocateCommandHandler, \
-    HelpCommandHandler, DirectionInputHandler, SaveCommandHandler, UUIDCommandHandler
+    HelpCommandHandler, DirectionInputHandler, SaveCommandHandler, UUIDCommandHandler, PerfCommandHandler
 from textadventure.handler import Handler
 from textadventure.input.inputhandling import InputHandler
 from textadventure.location import Location
@@ -81,7 +81,7 @@ class CustomGame(ABC):
         return [GoCommandHandler(), TakeCommandHandler(), PlaceCommandHandler(), YellCommandHandler(),
                 UseCommandHandler(), NameCommandHandler(), SaveCommandHandler(), UUIDCommandHandler(),
                 InventoryCommandHandler(), LocateCommandHandler(), HelpCommandHandler(), AttackCommandHandler(),
-                DirectionInputHandler()
+                PerfCommandHandler(), DirectionInputHandler()
                 ]
 
     @abstractmethod
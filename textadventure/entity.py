@@ -9,7 +9,8 @@ from textadventure.saving.savable import HasSavable, Savable
 from textadventure.saving.savables import EntitySavable
 from textadventure.sending.commandsender import CommandSender
 from textadventure.sending.message import Message
-from textadventure.utils import MessageConstant, CanDo, are_mostly_equal
+from textadventure.utils import MessageConstant, CanDo, are_normalized_mostly_equal, normalize_reference, \
+    ReferenceName, SlotsPickleMixin
 
 if TYPE_CHECKING:
     from textadventure.handler import Handler
@@ -20,13 +21,15 @@ class Identifiable:
     """
     An object with a uuid.
     """
+    uuid_factory = uuid4
+    """The function that creates the uuid when one isn't given. Can be changed to create predictable uuids"""
 
     def __init__(self, uuid: UUID = None):
         """
         :param uuid: The uuid that will not change and will stay the same even if it was saved and loaded
         """
         if uuid is None:
-            uuid = uuid4()
+            uuid = Identifiable.uuid_factory()
         self.uuid = uuid
 
 
@@ -41,6 +44,8 @@ class Living:
         is it's name
     """
 
+    name = ReferenceName()  # type Optional[str]
+
     def __init__(self, name: Optional[str]):
         self.name = name
 
@@ -61,7 +66,7 @@ class Living:
         sender.send_message(message)
 
     def is_reference(self, reference: str) -> bool:
-        return are_mostly_equal(reference, self.name)
+        return are_normalized_mostly_equal(normalize_reference(reference), Living.name.get_normalized(self))
 
     def __str__(self):
         """Should be used in Message to replace named_variables with"""
@@ -70,7 +75,9 @@ class Living:
         return self.name
 
 
-class Health:
+class Health(SlotsPickleMixin):
+    __slots__ = ("current_health", "max_health")
+
     def __init__(self, current_health: int, max_health: int):
         self.current_health = current_health
         self.max_health = max_health
@@ -129,12 +136,31 @@ class Entity(Living, Holder, Identifiable, HasSavable):
 
         self.health = health
 
+        self._location = None
         self.location = location
+
+    @property
+    def location(self) -> Optional['Location']:
         """
         The location of the entity. Unless initializing for the first time, you almost should never set this
         by yourself because you probably want to do it with GoAction or something similar that abstracts a few 
         details away.
+
+        Setting this also updates the occupants of the previous location and the new location
         """
+        return self._location
+
+    @location.setter
+    def location(self, location: Optional['Location']):
+        previous_location = self._location
+        if previous_location is location:
+            return
+        if previous_location is not None and self in previous_location.occupants:
+            previous_location.occupants.remove(self)
+        self._location = location
+        if location is not None:
+            location.occupants.append(self)
+        self.mark_dirty()
 
     def _create_savable(self):
         """
@@ -199,15 +225,19 @@ class SimpleHostileEntitySavable(EntitySavable):
         super().before_save(source, handler)
         self.hostile_now = source.hostile_now
         self.hostile_type = source.hostile_type
-        self.entities_lost_to = list(source.entities_lost_to)
+        self.entities_lost_to = list(source.entities_lost_to)  # saved as a list to stay compatible with older saves
         self.entities_won_against = list(source.entities_won_against)
 
+    def _get_snapshot(self, source: Any) -> Any:
+        return super()._get_snapshot(source) + (source.hostile_now, source.hostile_type, len(source.entities_lost_to),
+                                                len(source.entities_won_against))
+
     def on_load(self, source: Any, handler: 'Handler'):
         super().on_load(source, handler)
         source.hostile_type = self.hostile_now
         source.hostile_type = self.hostile_type
-        source.entities_lost_to.extend(self.entities_lost_to)
-        source.entities_won_against.extend(self.entities_won_against)
+        source.entities_lost_to.update(self.entities_lost_to)
+        source.entities_won_against.update(self.entities_won_against)
 
 
 class SimpleHostileEntity(HostileEntity):
@@ -223,10 +253,10 @@ class SimpleHostileEntity(HostileEntity):
         """Usually constant, but it can change if a subclass changes it. It is used as a message in can_entity_pass"""
         self.hostile_type = hostile_type
 
-        self.entities_lost_to = []
-        """A list of UUIDs from entities that beat this enemy in battle"""
-        self.entities_won_against = []
-        """A list of UUIDs from entities that have been beaten by this enemy"""
+        self.entities_lost_to = set()  # type Set[UUID]
+        """A set of UUIDs from entities that beat this enemy in battle"""
+        self.entities_won_against = set()  # type Set[UUID]
+        """A set of UUIDs from entities that have been beaten by this enemy"""
 
     def _create_savable(self):
         return SimpleHostileEntitySavable()
@@ -1,17 +1,25 @@
 import sys
-from typing import List, Optional, TypeVar, Type, TYPE_CHECKING, Any, Union
+import time
+from heapq import merge
+from typing import List, Optional, TypeVar, Type, TYPE_CHECKING, Any, Union, Iterator, Tuple, Dict
+
+from uuid import UUID
 
 from textadventure.action import Action
 from textadventure.entity import Entity, Identifiable, Living
 from textadventure.input.inputhandling import CommandInput, InputHandleType, InputHandler
+from textadventure.input.lexicon import CommandLexicon, MaxDistance, default_max_distance
 from textadventure.manager import Manager
 from textadventure.player import Player
 from textadventure.saving.savables import PlayerSavable
 from textadventure.saving.savable import Savable, HasSavable, SaveLoadException
-from textadventure.saving.saving import SavePath, save_data, load_data
+from textadventure.saving.saving import SavePath, SaveReport, save_data, load_data, Durability, DEFAULT_DURABILITY, \
+    TEMP_SUFFIX
 from textadventure.sending.commandsender import CommandSender
 from textadventure.sending.message import Message, MessageType
-from textadventure.utils import Point, get_type_from_list, TypeCollection, CanDo
+from textadventure.utils import Point, get_type_from_list, TypeRegistry, TypeView, CanDo, VersionedList
+from textadventure.timing import TickProfiler, PhaseStats
+from textadventure.wakeup import WakeupNotifier, get_earliest
 from textprint.colors import Color
 
 if TYPE_CHECKING:
@@ -23,6 +31,11 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
+def get_uuid(identifiable: Identifiable) -> UUID:
+    """Used as the key of Handler.identifiables"""
+    return identifiable.uuid
+
+
 def has_only(the_list: List[T], only_list: List[T]):
     """
     Checks to make sure that all the items that are in the_list are in only_list
@@ -59,20 +72,23 @@ class Handler(HasSavable):
         :param player_handler: The PlayerHandler object. By default, it is None which will create a new one
         """
         super().__init__(savable)
-        self.identifiables = identifiables
-        """Contains Players, Entities and other types of Identifiables. Note that when a player is added to this list,
-        it should and will be saved separately. 
+        self.identifiables = TypeRegistry(identifiables, key=get_uuid)  # type TypeRegistry[Identifiable]
+        """Contains Players, Entities and other types of Identifiables. Note that when a player is added to this,
+        it should and will be saved separately. This can be appended to and removed from just like a list.
         
         Other elements like Entities that aren't Players will only be saved
         if you have called set_savable and passed a Savable that will handle saving and loading for the Entity or
         Identifiable. (Only players are saved automatically)"""
         self.locations = locations
         self.input_handlers = input_handlers
-        """A list of InputHandlers that do not include Locations"""
         self.managers = managers
         self.save_path = save_path
 
         # Variables not from the constructor
+        self.last_save_report = None  # type Optional[SaveReport]
+        """The SaveReport of the last call to save or None if save hasn't been called"""
+        self.save_durability = DEFAULT_DURABILITY
+        """The Durability used by save when one isn't passed. Can be raised to make sure saves aren't lost"""
         self._savables = savable.savables if savable is not None else {}
         """
         A Dictionary of savables where the key is something that is usually a tuple with the first value
@@ -98,6 +114,80 @@ class Handler(HasSavable):
         """
         When True, what ever is calling the update method should stop their infinite loop, and terminate the program.
         """
+        self.max_command_typos = default_max_distance  # type MaxDistance
+        """The maximum number of typos a command can have and still be recognized or a function that takes the \
+        length of the command and returns that. After changing this, call invalidate_input_handlers"""
+        self._input_handler_index = None  # type Optional[Tuple[tuple, CommandLexicon[tuple], list]]
+        """
+        A cache used by get_input_handlers_for. None if it needs to be rebuilt. [0] is the versions of \
+        self.input_handlers, self.locations and each location's command_handlers it was built from so it's rebuilt \
+        when one of them changes, [1] is a CommandLexicon of each \
+        command name to Tuples of the index in get_input_handlers and the InputHandler. [2] is a list of the \
+        InputHandlers (also Tuples with the index) that need to be called no matter what the command is.
+        """
+        self._location_index = None  # type Optional[Tuple[int, Dict[Point, Location], Dict[type, Location]]]
+        """A cache used by get_point_location and get_location. None if it needs to be rebuilt. [0] is the version \
+        of self.locations it was built from"""
+        self._action_managers = {}  # type Dict[Type[Action], List[Manager]]
+        """A cache used by get_action_managers of each type of action to the managers that want that action"""
+        self._action_managers_key = None
+        """The version of self.managers that _action_managers was created from"""
+        self._manager_intervals = {}  # type Dict[Manager, Optional[float]]
+        """A cache of each Manager's get_update_interval"""
+        self._manager_update_times = {}  # type Dict[Manager, float]
+        """The next time each Manager with an update interval greater than 0 should be updated"""
+        self._manager_next_times = {}  # type Dict[Manager, Optional[float]]
+        """A cache of get_next_update_time of each Manager whose update interval is None. It's only called again \
+        after the Manager is updated so those Managers aren't asked every time update_managers is called"""
+        self._woken_managers = set()  # type Set[Manager]
+        """The Managers that need to be updated the next time update_managers is called with them"""
+        self._updating_locations = None  # type Optional[Tuple[int, List[Location]]]
+        """A cache used by get_updating_locations. [0] is the version of self.locations it was built from"""
+        self.clock = time.time  # type Callable[[], float]
+        """A function that returns the current time in seconds. This is used instead of time.time() so that the \
+        time can be controlled when simulating the game. (See textadventure.simulation) Anything that needs the time \
+        to decide when to update should use this."""
+        self.profiler = None  # type Optional[TickProfiler]
+        """When not None, update records how long each part of it takes. See enable_profiling"""
+        self.wakeup_notifier = WakeupNotifier()
+        """Used to wake up the Handler while it is waiting in the wait method. Anything can call notify on this (even\
+        from another thread) when it needs update to be called."""
+
+    @property
+    def locations(self) -> List['Location']:
+        """
+        List of all the locations in the game. This is a VersionedList so changing it is noticed by the caches that \
+        use it. Setting this to a normal list makes it a VersionedList
+        """
+        return self._locations
+
+    @locations.setter
+    def locations(self, locations: List['Location']):
+        self._locations = VersionedList(locations)
+
+    @property
+    def input_handlers(self) -> List[InputHandler]:
+        """
+        A list of InputHandlers that do not include Locations. This is a VersionedList so changing it is noticed by \
+        the caches that use it. Setting this to a normal list makes it a VersionedList
+        """
+        return self._input_handlers
+
+    @input_handlers.setter
+    def input_handlers(self, input_handlers: List[InputHandler]):
+        self._input_handlers = VersionedList(input_handlers)
+
+    @property
+    def managers(self) -> List[Manager]:
+        """
+        A list of the Managers that are updated and told about actions. This is a VersionedList so changing it is \
+        noticed by the caches that use it. Setting this to a normal list makes it a VersionedList
+        """
+        return self._managers
+
+    @managers.setter
+    def managers(self, managers: List[Manager]):
+        self._managers = VersionedList(managers)
 
     def _create_savable(self):
         return HandlerSavable()
@@ -125,54 +215,297 @@ class Handler(HasSavable):
         if self.should_end:
             self.broadcast("The program should have already ended.")
             return
+        if self.profiler is not None:
+            self.__update_profiled(self.profiler)
+            return
 
         for player in self.get_players():
             player.update(self)
 
+        for sender, inp in self._take_inputs():
+            self.__do_input(sender, inp)
+
+        for location in self.get_updating_locations():
+            location.update(self)
+
+        self.update_managers(self.managers)
+
+    def __update_profiled(self, profiler: TickProfiler):
+        """
+        Does the same thing as update except this records how long each part takes
+        """
+        now = profiler.now
+        profiler.start_tick()
+
+        start = now()
+        for player in self.get_players():
+            player.update(self)
+        profiler.add("players", now() - start)
+
+        start = now()
+        for sender, inp in self._take_inputs():
+            profiler.add("input", now() - start)
+            self.__do_input(sender, inp)  # this records the time for each InputHandler
+            start = now()
+        profiler.add("input", now() - start)
+
+        for location in self.get_updating_locations():
+            start = now()
+            location.update(self)
+            profiler.add("location:" + type(location).__name__, now() - start)
+
+        self.update_managers(self.managers)
+        profiler.end_tick()
+
+    def enable_profiling(self, max_samples: int = 500) -> TickProfiler:
+        """
+        Makes it so each update records how long each part of it takes. Use get_profiler_stats or self.profiler to\
+        see the results. Calling this when profiling is already enabled does nothing.
+
+        :param max_samples: The number of updates to calculate percentiles from. By default, 500
+        :return: self.profiler
+        """
+        if self.profiler is None:
+            self.profiler = TickProfiler(max_samples)
+        return self.profiler
+
+    def disable_profiling(self):
+        """
+        Stops recording how long each part of update takes and removes the recorded data
+        """
+        self.profiler = None
+
+    def get_profiler_stats(self, amount: Optional[int] = None) -> List[PhaseStats]:
+        """
+        :param amount: The maximum number of PhaseStats to return or None to return all of them. By default, None
+        :return: A list of the PhaseStats with the highest p95 first (The first element is usually the "tick") or an\
+                 empty list if profiling isn't enabled
+        """
+        if self.profiler is None:
+            return []
+        return self.profiler.get_top(amount if amount is not None else len(self.profiler.timings), include_tick=True)
+
+    def update_managers(self, managers: List[Manager]):
+        """
+        Calls update on each manager that should be updated right now. (Uses each Manager's get_update_interval)
+
+        This is called in update with self.managers, but this can also be used for managers that are updated along \
+        with this handler (like the custom managers in Main)
+
+        :param managers: The list of managers to update
+        """
+        now = self.clock()
+        profiler = self.profiler
+        for manager in managers:
+            interval = self.__get_update_interval(manager)
+            if interval == 0:
+                if profiler is None:
+                    manager.update(self)
+                else:
+                    self.__update_manager_profiled(manager, profiler)
+                continue
+            woken = manager in self._woken_managers
+            if interval is None:
+                if not woken:
+                    next_time = self.__get_manager_next_time(manager)
+                    if next_time is None or next_time > now:
+                        continue
+            elif not woken and self._manager_update_times.get(manager, now) > now:
+                continue
+            self._woken_managers.discard(manager)
+            if interval is not None:
+                self._manager_update_times[manager] = now + interval
+            if profiler is None:
+                manager.update(self)
+            else:
+                self.__update_manager_profiled(manager, profiler)
+            if interval is None:
+                self._manager_next_times[manager] = manager.get_next_update_time(self)
+
+    def __update_manager_profiled(self, manager: Manager, profiler: TickProfiler):
+        start = profiler.now()
+        manager.update(self)
+        profiler.add("manager:" + type(manager).__name__, profiler.now() - start)
+
+    def __get_manager_next_time(self, manager: Manager) -> Optional[float]:
+        """
+        :return: The cached get_next_update_time of a Manager whose update interval is None
+        """
+        try:
+            return self._manager_next_times[manager]
+        except KeyError:
+            next_time = manager.get_next_update_time(self)
+            self._manager_next_times[manager] = next_time
+            return next_time
+
+    def __get_update_interval(self, manager: Manager) -> Optional[float]:
+        try:
+            return self._manager_intervals[manager]
+        except KeyError:
+            interval = manager.get_update_interval()
+            self._manager_intervals[manager] = interval
+            return interval
+
+    def wake_manager(self, manager: Manager):
+        """
+        Makes it so manager is updated the next time update is called (or the next time update_managers is called \
+        with manager) even if its update interval says it shouldn't be. This also wakes up this Handler if it is \
+        waiting.
+
+        This is thread safe.
+
+        :param manager: The manager to update
+        """
+        self._woken_managers.add(manager)
+        self.wakeup_notifier.notify()
+
+    def get_updating_locations(self) -> List['Location']:
+        """
+        :return: The locations in self.locations whose class overrides Location's update method. Locations that \
+                 don't override it don't need to be updated.
+        """
+        from textadventure.location import Location
+        key = self.locations.version
+        if self._updating_locations is None or self._updating_locations[0] != key:
+            self._updating_locations = key, [location for location in self.locations
+                                             if type(location).update is not Location.update]
+        return self._updating_locations[1]
+
+    def _take_inputs(self) -> Iterator[Tuple[CommandSender, str]]:
+        """
+        Used by update to get the input that needs to be handled. Subclasses can override this to change where the \
+        input comes from.
+
+        :return: An iterator of Tuples where [0] is the CommandSender and [1] is the input from that sender
+        """
         for sender in self.get_command_senders():
             inp = sender.take_input()  # this does not pause the thread
             if inp is not None:  # since taking input doesn't pause the thread this could be null
-                self.__do_input(sender, inp)
+                yield sender, inp
 
-        for location in self.locations:
-            location.update(self)
+    def get_next_update_time(self, other_managers: List[Manager] = ()) -> Optional[float]:
+        """
+        Used when running event driven to figure out when update needs to be called again
 
-        for manager in self.managers:
-            manager.update(self)
+        :param other_managers: Managers that aren't in self.managers but are updated with this Handler (like the \
+                custom managers in Main). By default, empty
+        :return: The earliest time (from self.clock()) when update should be called again or None if nothing needs to \
+                 be updated until something wakes up this Handler
+        """
+        r = None
+        for sender in self.get_command_senders():
+            r = get_earliest(r, sender.input_getter.get_next_input_time(self.wakeup_notifier))
+        for location in self.get_updating_locations():
+            r = get_earliest(r, location.get_next_update_time(self))
+        if self._woken_managers:
+            return self.clock()
+        for managers in (self.managers, other_managers):
+            for manager in managers:
+                interval = self.__get_update_interval(manager)
+                if interval is None:
+                    r = get_earliest(r, self.__get_manager_next_time(manager))
+                    continue
+                r = get_earliest(r, manager.get_next_update_time(self))
+                if interval:  # not 0
+                    r = get_earliest(r, self._manager_update_times.get(manager))
+        return r
 
-    def __do_input(self, sender: CommandSender, inp: str):
-        input_object = CommandInput(inp)
-        if sender.output.on_input(sender, input_object):
-            # since the on_input method returned True, it must have done something, so we don't need to send a message
-            return
-        if input_object.is_empty():
-            # since the player's OutputSender didn't handle this, we should do it
-            sender.send_message(
-                "You must enter a command. Normally, pressing enter with a blank line won't trigger this.")
-            return
+    def is_polling_only(self) -> bool:
+        """
+        :return: True if one of the CommandSenders has an InputGetter that can't wake up this Handler when there is \
+                 input. (See InputGetter.is_polling_only) When this is True, wait shouldn't be used.
+        """
+        return any(sender.input_getter.is_polling_only() for sender in self.get_command_senders())
+
+    def wait(self, other_managers: List[Manager] = (), max_wait: Optional[float] = None) -> bool:
+        """
+        Blocks the current thread until there is input from an InputGetter, until a Location or Manager needs to be\
+        updated or until something calls notify on self.wakeup_notifier. This should be called between each call to\
+        update when you don't want to update the Handler on a fixed interval.
+
+        :param other_managers: Managers that aren't in self.managers but are updated with this Handler (like the \
+                custom managers in Main). By default, empty
+        :param max_wait: The maximum amount of time in seconds to wait or None to wait as long as needed
+        :return: True if something woke up the Handler, False if it was woken up because it was time to
+        """
+        next_time = self.get_next_update_time(other_managers)
+        timeout = None if next_time is None else max(0.0, next_time - self.clock())
+        if max_wait is not None and (timeout is None or timeout > max_wait):
+            timeout = max_wait
+        if timeout == 0:
+            self.wakeup_notifier.clear()
+            return False
+
+        files = []
+        for sender in self.get_command_senders():
+            input_file = sender.input_getter.get_input_file()
+            if input_file is not None:
+                files.append(input_file)
+        return self.wakeup_notifier.wait(timeout, files)
+
+    def __handle_input(self, sender: CommandSender, input_object: CommandInput,
+                       input_handlers: List[InputHandler]) -> List[InputHandleType]:
+        """
+        Calls on_input on each InputHandler in input_handlers and then handles the returned InputHandles in order of \
+        their priority
+
+        :return: A list of the InputHandleTypes that were returned by each InputHandle's handle
+        """
+        profiler = self.profiler
         input_handles = []  # Note this is a list of InputHandles
-        for input_handler in self.get_input_handlers():
-            handle = input_handler.on_input(self, sender, input_object)  # call on_input for each handler
+        for input_handler in input_handlers:
+            if profiler is None:
+                handle = input_handler.on_input(self, sender, input_object)  # call on_input for each handler
+            else:
+                start = profiler.now()
+                handle = input_handler.on_input(self, sender, input_object)
+                profiler.add("input_handler:" + type(input_handler).__name__, profiler.now() - start)
             if handle is not None:
                 input_handles.append(handle)
 
         input_handles.sort(key=lambda k: k.priority)  # sort by priority
         already_handled = []
         for input_handle in list(input_handles):  # copy list so we can delete stuff
-            handle_type = input_handle.handle(already_handled)  # note not method # let it decide to take
+            if profiler is None:
+                handle_type = input_handle.handle(already_handled)  # note not method # let it decide to take
+            else:
+                start = profiler.now()
+                handle_type = input_handle.handle(already_handled)
+                profiler.add("input_handler:" + type(input_handle.input_handler).__name__, profiler.now() - start)
             assert handle_type is not None, "An InputHandle's handle callable cannot return None. {} broke this rule" \
                 .format(type(input_handle.input_handler))  # cannot be None because it said it would handle it
 
             already_handled.append(handle_type)
             if handle_type is InputHandleType.REMOVE_HANDLER or handle_type is \
                     InputHandleType.REMOVE_HANDLER_ALLOW_RESPONSE:
-                self.input_handlers.remove(input_handle.input_handler)
+                self.remove_input_handler(input_handle.input_handler)
             elif handle_type is InputHandleType.HANDLED_AND_DONE:
                 break  # we don't care what others have to say. We're done handling this input
 
-        # player.send_line()  # for the debug
-        if len(already_handled) == 0 or has_only(already_handled,
-                                                 [InputHandleType.NOT_HANDLED, InputHandleType.UNNOTICEABLE]):
+        return already_handled
+
+    @staticmethod
+    def __is_unhandled(already_handled: List[InputHandleType]) -> bool:
+        return len(already_handled) == 0 or has_only(already_handled,
+                                                     [InputHandleType.NOT_HANDLED, InputHandleType.UNNOTICEABLE])
+
+    def __do_input(self, sender: CommandSender, inp: str):
+        input_object = CommandInput(inp)
+        if sender.output.on_input(sender, input_object):
+            # since the on_input method returned True, it must have done something, so we don't need to send a message
+            return
+        if input_object.is_empty():
+            # since the player's OutputSender didn't handle this, we should do it
+            sender.send_message(
+                "You must enter a command. Normally, pressing enter with a blank line won't trigger this.")
+            return
+        already_handled = self.__handle_input(sender, input_object, self.get_input_handlers_for(input_object))
+        if self.__is_unhandled(already_handled):
+            # nothing understood the command so maybe it was a typo of a command name
+            typo_input_handlers = self.get_input_handlers_for_typo(input_object)
+            if typo_input_handlers:
+                already_handled = self.__handle_input(sender, input_object, typo_input_handlers)
+        if self.__is_unhandled(already_handled):
             sender.send_message("Command: \"" + input_object.get_command() + "\" not recognized.")
 
     def do_action(self, action: Action):
@@ -185,42 +518,111 @@ class Handler(HasSavable):
         :param action: The action to be called
         :return: None, but you the action's state should change if one of the managers acted on it
         """
-        for manager in self.managers:
+        for manager in self.get_action_managers(type(action)):
             manager.on_action(self, action)
 
-    def save(self, sender: Optional[CommandSender] = None) -> CanDo:
+    def get_action_managers(self, action_type: Type[Action]) -> List[Manager]:
+        """
+        :param action_type: The type of the action
+        :return: The managers in self.managers (in the same order) whose on_action should be called with an action \
+                 of the type action_type. (Uses each Manager's get_action_types)
+        """
+        key = self.managers.version
+        if self._action_managers_key != key:
+            self._action_managers = {}
+            self._action_managers_key = key
+        r = self._action_managers.get(action_type)
+        if r is None:
+            r = []
+            for manager in self.managers:
+                action_types = manager.get_action_types()
+                if action_types is None or issubclass(action_type, action_types):
+                    r.append(manager)
+            self._action_managers[action_type] = r
+        return r
+
+    def invalidate_managers(self):
+        """
+        Should be called if a Manager's get_action_types or get_update_interval would return something different \
+        than it did before. Note that changing self.managers is noticed automatically.
+        """
+        self._action_managers_key = None
+        self._manager_intervals.clear()
+        self._manager_next_times.clear()
+
+    def save(self, sender: Optional[CommandSender] = None, force: bool = False,
+             durability: Optional[Durability] = None) -> CanDo:
         """
         Saves data for the running game. If you want to change the save path, set save_path before you call this method
         as this method uses self.save_path to determine where to save the data
+
+        Only the files whose data changed since they were last saved are written (See Savable.needs_save) so this is
+        cheap enough to call often. What was written is stored in self.last_save_report
+        :param sender: The sender that errors are sent to or None
+        :param force: True to write every file even if nothing changed. By default, False
+        :param durability: The Durability passed to save_data or None to use self.save_durability. By default, None
         :return: A CanDo representing whether or not the handler data saved successfully. The return value at [1]
                  should always be displayed to the user.
         """
         is_valid = self.save_path.is_valid()
         if not is_valid[0]:
             return is_valid
-        handler_result = self._save_handler()
+        if durability is None:
+            durability = self.save_durability
+        report = SaveReport()
+        self.last_save_report = report
+        if force:
+            self.mark_dirty()
+            for savable, source in self._savables.values():
+                savable.mark_dirty()
+        handler_result = self._save_handler(report, durability)
         if not handler_result[0]:
             return handler_result
 
         unsaved_string = ""
         unsaved_amount = 0
         for player in self.get_players():
+            path = self.save_path.get_player_path(player)
+            if not force and not player.savable.needs_save(player):
+                report.unchanged.append(path)
+                continue
             # sender.send_message(Message("Saving: {}", named_variables=[player]))
-            player_result = self.player_handler.save_player(player)
+            player_result = self.player_handler.save_player(player, durability)
             if not player_result[0]:
-                sender.send_message(Message(str(player.uuid) + " - " + player_result[1],
-                                            message_type=MessageType.IMMEDIATE))
+                if sender is not None:
+                    sender.send_message(Message(str(player.uuid) + " - " + player_result[1],
+                                                message_type=MessageType.IMMEDIATE))
                 unsaved_amount += 1
+                report.failed.append(path)
+            else:
+                player.savable.mark_saved(player)
+                report.written.append(path)
 
         if unsaved_amount:
             unsaved_string = " {} players were unable to be saved.".format(unsaved_amount)
 
-        return True, "You successfully saved data to {}.".format(self.save_path) + unsaved_string
+        return True, "You successfully saved data to {}. {}".format(self.save_path, report) + unsaved_string
+
+    def _save_handler(self, report: Optional[SaveReport] = None, durability: Optional[Durability] = None) -> CanDo:
+        """
+        Saves self.savable if it or one of the savables in it changed since it was last saved
 
-    def _save_handler(self) -> CanDo:
+        :param report: The SaveReport to add the handler path to or None
+        :param durability: The Durability passed to save_data or None to use self.save_durability
+        :return: A CanDo representing whether or not it was successful
+        """
         path = self.save_path.get_handler_path()
+        if not self.savable.needs_save(self) and path.is_file():
+            if report is not None:
+                report.unchanged.append(path)
+            return True, "The handler data was already saved to {}.".format(path.absolute())
         self.savable.before_save(self, self)
-        return save_data(self.savable, path)
+        result = save_data(self.savable, path, self.save_durability if durability is None else durability)
+        if result[0]:
+            self.savable.mark_saved(self)
+        if report is not None:
+            (report.written if result[0] else report.failed).append(path)
+        return result
 
     # region all getters
     def get_savable(self, key) -> Union[Savable, Any]:
@@ -257,35 +659,169 @@ class Handler(HasSavable):
 
         return r
 
+    def __get_input_handlers_key(self) -> tuple:
+        """
+        :return: The versions of each VersionedList that get_input_handlers uses
+        """
+        return (self.input_handlers.version, self.locations.version) \
+            + tuple(location.command_handlers.version for location in self.locations)
+
+    def __get_input_handler_index(self) -> Tuple[CommandLexicon, list]:
+        """
+        :return: A tuple where [0] is a CommandLexicon of each command name to Tuples of the index in \
+                get_input_handlers and the InputHandler and [1] is a list of the others (also Tuples with the index)
+        """
+        key = self.__get_input_handlers_key()
+        if self._input_handler_index is None or self._input_handler_index[0] != key:
+            commands = CommandLexicon(self.max_command_typos)
+            others = []
+            for i, input_handler in enumerate(self.get_input_handlers()):
+                names = input_handler.get_command_names()
+                if names is None:
+                    others.append((i, input_handler))
+                else:
+                    for name in set(name.lower() for name in names):
+                        commands.add(name, (i, input_handler))
+            self._input_handler_index = key, commands, others
+        return self._input_handler_index[1:]
+
+    def get_input_handlers_for(self, command_input: CommandInput) -> List[InputHandler]:
+        """
+        Does the same thing as get_input_handlers except this leaves out the InputHandlers that won't react to the \
+        command in command_input. (Uses each InputHandler's get_command_names) The order is the same as the order \
+        of get_input_handlers.
+
+        :param command_input: The CommandInput that is not empty
+        :return: A list of InputHandlers that on_input should be called on
+        """
+        commands, others = self.__get_input_handler_index()
+        command = command_input.get_command().lower()
+        if command not in commands:
+            return [input_handler for i, input_handler in others]
+        candidates = commands.get(command)
+        return [input_handler for i, input_handler in merge(candidates, others, key=lambda pair: pair[0])]
+
+    def get_input_handlers_for_typo(self, command_input: CommandInput) -> List[InputHandler]:
+        """
+        Used when nothing handled command_input. If the command isn't a command name but is close to one, (a typo \
+        like "atack") command_input.command_name is set to that name and the InputHandlers of that name are returned.
+
+        The InputHandlers that react to any command aren't returned because get_input_handlers_for already \
+        returned them.
+
+        :param command_input: The CommandInput that is not empty and that nothing handled
+        :return: A list of InputHandlers that on_input should be called on. Empty if the command isn't a typo
+        """
+        commands = self.__get_input_handler_index()[0]
+        command = command_input.get_command().lower()
+        name = commands.resolve(command)
+        if name is None or name == command:
+            return []
+        command_input.command_name = name
+        return [input_handler for i, input_handler in commands.get(name)]
+
+    def add_input_handler(self, input_handler: InputHandler):
+        """
+        Adds input_handler to self.input_handlers. This should be used instead of appending to input_handlers\
+        directly.
+
+        :param input_handler: The InputHandler to add
+        """
+        self.input_handlers.append(input_handler)
+        self.invalidate_input_handlers()
+
+    def remove_input_handler(self, input_handler: InputHandler):
+        """
+        Removes input_handler from self.input_handlers. This should be used instead of removing it from \
+        input_handlers directly.
+
+        :param input_handler: The InputHandler to remove
+        """
+        self.input_handlers.remove(input_handler)
+        self.invalidate_input_handlers()
+
+    def invalidate_input_handlers(self):
+        """
+        Should be called if an InputHandler's command names change or after changing max_command_typos. Changes to \
+        self.input_handlers, self.locations and each location's command_handlers are noticed automatically.
+        """
+        self._input_handler_index = None
+
+    def __get_location_index(self) -> Tuple[Dict[Point, 'Location'], Dict[type, 'Location']]:
+        """
+        :return: A tuple where [0] is a dict of each point to the first location at that point and [1] is a dict of\
+                 each type of location to the first location of that type
+        """
+        key = self.locations.version
+        if self._location_index is None or self._location_index[0] != key:
+            by_point = {}
+            by_type = {}
+            for location in self.locations:
+                by_point.setdefault(location.point, location)
+                by_type.setdefault(type(location), location)
+            self._location_index = key, by_point, by_type
+        return self._location_index[1:]
+
+    def invalidate_locations(self):
+        """
+        Should be called after changing the point of a location. Note that changing self.locations is noticed \
+        automatically.
+        """
+        self._location_index = None
+        self._input_handler_index = None
+        self._updating_locations = None
+
     def get_location(self, location_type: type):
         """
         :param location_type: The type of the location you are trying to get
-        :return:
+        :return: The first location in self.locations whose type is location_type (not a subclass) or None
         """
-        for location in self.locations:
-            # print("location's type: " + str(type(location)))
-            # print("location_type: " + str(location_type))
-            if type(location) is location_type:
-                return location
-        return None
+        return self.__get_location_index()[1].get(location_type)
+
+    def add_identifiable(self, identifiable: Identifiable):
+        """
+        Adds the identifiable to self.identifiables. Does nothing if it was already added.
+
+        :param identifiable: The Identifiable to add
+        """
+        self.identifiables.append(identifiable)
+        if isinstance(identifiable, Entity):
+            location = identifiable.location
+            if location is not None and identifiable not in location.occupants:
+                location.occupants.append(identifiable)  # it was removed from occupants in remove_identifiable
+
+    def remove_identifiable(self, identifiable: Identifiable):
+        """
+        Removes the identifiable from self.identifiables.
+
+        Entities are also removed from the occupants of their location so the location doesn't keep them alive. \
+        Their location isn't changed so they are put back in its occupants if they are added again.
+
+        :param identifiable: The Identifiable to remove
+        :raises ValueError: If the identifiable was never added
+        """
+        self.identifiables.remove(identifiable)
+        if isinstance(identifiable, Entity):
+            location = identifiable.location
+            if location is not None and identifiable in location.occupants:
+                location.occupants.remove(identifiable)
 
     # region identifiable getters
-    def get_players(self) -> TypeCollection[Player]:
-        # r = []
-        # for entity in self.identifiables:
-        #     if isinstance(entity, Player):
-        #         r.append(entity)
-        # return r
-        # return get_type_from_list(self.identifiables, Player, None)
-        return TypeCollection(self.identifiables, [Player])
-
-    def get_entities(self) -> TypeCollection[Entity]:
-        # return get_type_from_list(self.identifiables, Entity, None)
-        return TypeCollection(self.identifiables, [Entity])
-
-    def get_command_senders(self) -> TypeCollection[CommandSender]:
-        # return get_type_from_list(self.identifiables, CommandSender, None)
-        return TypeCollection(self.identifiables, [CommandSender])
+    def get_identifiable(self, uuid: UUID) -> Optional[Identifiable]:
+        """
+        :param uuid: The uuid of the Identifiable
+        :return: The Identifiable in self.identifiables with the given uuid or None if there isn't one
+        """
+        return self.identifiables.get(uuid)
+
+    def get_players(self) -> TypeView[Player]:
+        return self.identifiables.view(Player)
+
+    def get_entities(self) -> TypeView[Entity]:
+        return self.identifiables.view(Entity)
+
+    def get_command_senders(self) -> TypeView[CommandSender]:
+        return self.identifiables.view(CommandSender)
     # endregion
 
     def get_managers(self, manager_types: Type[Manager], expected_amount: Optional[int] = None) -> List[Manager]:
@@ -297,10 +833,11 @@ class Handler(HasSavable):
         return get_type_from_list(self.living_things, living_types, expected_amount)
 
     def get_point_location(self, point: Point):
-        for location in self.locations:
-            if location.point == point:
-                return location
-        return None
+        """
+        :param point: The point of the location
+        :return: The first location in self.locations at point or None
+        """
+        return self.__get_location_index()[0].get(point)
     # endregion end all getters
 
     def broadcast(self, message):
@@ -317,13 +854,32 @@ class HandlerSavable(Savable):
         self.savables = None  # type Dict[Any, Tuple[Savable, NoneType]]
 
     def before_save(self, source: Any, handler: 'Handler'):
+        """
+        Only calls before_save on the savables that need to be saved. The others still have the data from the last \
+        time they were saved
+        """
         assert source is handler
-        self.savables = {}
+        savables = {}
         for key, value in handler.get_savables().items():
             savable, source = value
-            savable.before_save(source, handler)
-            self.savables[key] = savable, None
+            if savable.needs_save(source):
+                savable.before_save(source, handler)
+            savables[key] = savable, None
             # print("saving: '{}' with '{}' as source".format(savable, source))
+        self.savables = savables
+
+    def needs_save(self, source: Any) -> bool:
+        if super().needs_save(source) or self.savables is None:
+            return True
+        savables = source.get_savables()
+        if savables is not self.savables and savables.keys() != self.savables.keys():
+            return True  # a savable was added or removed
+        return any(savable.needs_save(savable_source) for savable, savable_source in savables.values())
+
+    def mark_saved(self, source: Any):
+        super().mark_saved(source)
+        for savable, savable_source in source.get_savables().values():
+            savable.mark_saved(savable_source)
 
     def on_load(self, source: Any, handler: 'Handler'):
         assert source is handler
@@ -374,7 +930,7 @@ class PlayerHandler:
         errors = []
         good_amount = 0
         for item in folder.iterdir():
-            if item.is_file():
+            if item.is_file() and item.suffix != TEMP_SUFFIX:  # temporary files are only left over after a crash
                 data = load_data(item)
                 if isinstance(data, PlayerSavable):  # probably a PlayerSavable, but what do we care?
                     self.player_savables.append(data)
@@ -417,11 +973,16 @@ class PlayerHandler:
 
         return all(any(ord(c) in r for r in self.__class__._VALID_RANGES) for c in name)
 
-    def save_player(self, player: Player) -> CanDo:
+    def save_player(self, player: Player, durability: Optional[Durability] = None) -> CanDo:
+        """
+        :param player: The player to save
+        :param durability: The Durability passed to save_data or None to use the handler's save_durability
+        :return: The CanDo returned by save_data or a CanDo where [0] is False if the player couldn't be saved
+        """
         assert self.handler is not None
         path = self.get_save_path().get_player_path(player)
         try:
             player.savable.before_save(player, self.handler)
         except SaveLoadException as e:
             return False, e.args[0]
-        return save_data(player.savable, path)
+        return save_data(player.savable, path, self.handler.save_durability if durability is None else durability)
@@ -1,10 +1,11 @@
 from abc import abstractmethod, ABC
 from enum import Enum, unique
-from typing import List, Callable, Optional, TYPE_CHECKING, Dict, Union, Tuple
+from typing import List, Callable, Optional, TYPE_CHECKING, Dict, Union, Tuple, Set
 
 from textadventure.player import Player
 from textadventure.sending.commandsender import CommandSender
-from textadventure.utils import get_unimportant
+from textadventure.utils import get_unimportant, SlotsPickleMixin
+import re
 import shlex
 
 if TYPE_CHECKING:
@@ -16,6 +17,53 @@ FlagOptions = Dict[Tuple[str, ...], Optional[int]]
 arguments each flag should have. Usually 0 for most flags (True and False) but sometimes 1 for something like --file
 and rarely more than 1. If the value is None, then the flag takes up the rest of the command"""
 
+_SIMPLE_TOKEN = re.compile(r"[^ \t\r\n]+")
+"""Used to split input that doesn't have any quotes or backslashes"""
+_TOKEN_PIECE = re.compile(r"""([ \t\r\n]+)|([^ \t\r\n'"\\]+)|'([^']*)'|"((?:[^"\\]|\\[\s\S])*)"|\\([\s\S])|(["'\\])""")
+"""Matches one piece of input. The groups are: 1: whitespace 2: plain text 3: the inside of single quotes \
+4: the inside of double quotes 5: an escaped character 6: a quote that isn't closed or a backslash at the end"""
+_DOUBLE_QUOTE_ESCAPE = re.compile(r'\\([\\"])')
+"""Inside double quotes, a backslash only escapes another backslash or a double quote"""
+
+
+def split_input(to_split: str) -> List[str]:
+    """
+    Splits to_split the same way that shlex.split does (posix mode without comments) but in a single pass using \
+    compiled regular expressions.
+
+    :param to_split: The string to split
+    :return: A list of each part of the string
+    :raises ValueError: If there is a quote without a closing quote or if there is a backslash at the end. The \
+            messages are the same as the ones shlex uses
+    """
+    if "'" not in to_split and '"' not in to_split and "\\" not in to_split:
+        return _SIMPLE_TOKEN.findall(to_split)
+
+    r = []
+    token = None  # None when we aren't in a token. Note that '' is a token
+    for match in _TOKEN_PIECE.finditer(to_split):
+        group = match.lastindex
+        if group == 1:  # whitespace ends the current token
+            if token is not None:
+                r.append(token)
+                token = None
+            continue
+        if group == 6:
+            character = match.group(6)
+            if character == '"':  # shlex complains about the backslash first if the unclosed quote ends with one
+                rest = to_split[match.end():]
+                character = "\\" if (len(rest) - len(rest.rstrip("\\"))) % 2 == 1 else character
+            if character == "\\":
+                raise ValueError("No escaped character")
+            raise ValueError("No closing quotation")
+        piece = match.group(group)
+        if group == 4 and "\\" in piece:
+            piece = _DOUBLE_QUOTE_ESCAPE.sub(r"\1", piece)
+        token = piece if token is None else token + piece
+    if token is not None:
+        r.append(token)
+    return r
+
 
 @unique
 class InputHandleType(Enum):  # returned when the InputHandle's handle method/variable property is called
@@ -65,26 +113,59 @@ class CommandInput:
     This object contains a string_input which is the unchanged string that was inputted
     This object also contains the string split up (split_input) which is an array
 
-    Also, this uses shlex.split so a command like: "command_name 'cool string' space\ string" gives 3 parts. 1 command,
-    2 args
+    Also, this splits the same way shlex.split does so a command like: "command_name 'cool string' space\\ string" \
+    gives 3 parts. 1 command, 2 args
+
+    The string isn't split until it's needed
     """
 
-    def __init__(self, string_input: str):
+    def __init__(self, string_input: Optional[str], split: Optional[List[str]] = None):
+        """
+        Normally, only string_input is given. If you already have the split parts, use from_split instead
+
+        :param string_input: The string that was inputted or None if split is given
+        :param split: The already split parts of the input or None (default) to split string_input when needed
+        """
+        assert string_input is not None or split is not None, "string_input or split must be given"
         self._string_input = string_input
-        try:
-            self._split = self.__class__.do_split(string_input)
-        except ValueError as e:
-            self._split = string_input.split(" ")
-            self.input_error = e
-        else:
-            self.input_error = None
-            """
-            If the parser had trouble parsing the input. (Ex: There's no closing quote) this will be a ValueError
-            where input_error.args[0] is the error as a string. If this is not None, then that means that split() will 
-            return a list of strings split only by spaces (not using unix like parsing).
-            """
+        self._split = split  # type Optional[List[str]]
+        """None until split is called for the first time unless given in the constructor"""
+        self._input_error = None  # type Optional[ValueError]
+        self._unimportant = None  # type Optional[Set[int]]
+        """The indexes of the unimportant parts. Initialized when first needed"""
+        self._layouts = {}  # type Dict[Tuple[bool, int], Tuple[Union[FlagOptions, FlagSpec, None], _ArgumentLayout]]
+        """Used by get_arg. The key is ignore_unimportant_before and the id of the flag_options. The flag_options \
+        are kept in the value so the id can't be reused while this CommandInput exists"""
+        self._flags = {}  # type Dict[Tuple[bool, bool, bool], Tuple[str, ...]]
+        """Used by get_flags. The key is the arguments that were passed to get_flags"""
+        self.command_name = None  # type Optional[str]
+        """Set by the Handler when the command is a typo of a known command name. This is that name. See \
+        get_command_name"""
+
+    @classmethod
+    def from_split(cls, split: List[str]) -> 'CommandInput':
+        """
+        Creates a CommandInput from parts that have already been split. This doesn't split anything again. \
+        (Ex: subcommand uses this to give the sub command the parts of this command)
+
+        :param split: The parts where [0] is the command. The returned CommandInput now owns this list
+        :return: A CommandInput where split() returns the passed split and str() returns the joined parts
+        """
+        return cls(None, split)
+
+    @property
+    def input_error(self) -> Optional[ValueError]:
+        """
+        If the parser had trouble parsing the input. (Ex: There's no closing quote) this will be a ValueError
+        where input_error.args[0] is the error as a string. If this is not None, then that means that split() will
+        return a list of strings split only by spaces (not using unix like parsing).
+        """
+        self.split()
+        return self._input_error
 
     def __str__(self):
+        if self._string_input is None:
+            self._string_input = self.__class__.join(self._split)
         return self._string_input
 
     def is_empty(self):
@@ -101,7 +182,15 @@ class CommandInput:
         return len(self.split()) == 0
 
     def split(self) -> List[str]:
-        return self._split
+        split = self._split
+        if split is None:
+            try:
+                split = self.__class__.do_split(self._string_input)
+            except ValueError as e:
+                split = self._string_input.split(" ")
+                self._input_error = e
+            self._split = split
+        return split
 
     def get_command_index(self) -> int:
         """
@@ -116,8 +205,17 @@ class CommandInput:
         """
         return self.split()[self.get_command_index()]
 
+    def get_command_name(self) -> str:
+        """
+        :return: The lower case name of the command that was meant. Usually the same as get_command().lower() but \
+                if the command was a typo of a known command name, (Ex: "attakc") this is that name (Ex: "attack")
+        """
+        if self.command_name is not None:
+            return self.command_name
+        return self.get_command().lower()
+
     def get_arg(self, index: int, ignore_unimportant_before=True,
-                flag_options: Optional[FlagOptions] = None) -> List[str]:
+                flag_options: Union[FlagOptions, 'FlagSpec', None] = None) -> List[str]:
         """
         go to castle of rainbow unicorns
         get_arg(0, True) would return ["castle", "of", "rainbow", "unicorns"]
@@ -141,54 +239,37 @@ class CommandInput:
                              If this is an empty dict, then that essentially makes it so flags are not ignored
                              and can be in the returned list.
 
+                             This can also be a FlagSpec which is faster when there are flags
+
                              Note that flags after the first argument are not treated as flags ex:
                              "command_name my_arg --my_flag" --my_flag is always treated as an argument
         :return: A list of the requested argument and all arguments after it. (Requested arg is in [0]) You are allowed
                  to change (remove/append) to the returned list
         """
-        split = self.split()  # get the command args into split parts
-        unimportant = []  # a list of ints representing the unimportant words in a string where each is an index
-        if ignore_unimportant_before:
-            unimportant = get_unimportant(split)
-
-        start_comparing = self.get_command_index()  # not adding one because once set to True, i will be incremented
-        #       note that the value above is normally 0 because that's where the command is
-
-        ignored = index
-        appending = False  # set to True once ready to start adding to list
-        r = []
-        for i, s in enumerate(split):
-            if appending:  # once we start appending, we never stop
-                r.append(s)
-            else:
-                is_next_flag = False
-                if len(split) > i + 1:  # entire if statement is to check for flags
-                    next_arg = split[i + 1]
-                    flags = self.__class__.parse_flag(next_arg)
-                    if flags is not None:
-                        if len(flags) > 1:  # assume that there are 0 arguments after something like -al
-                            is_next_flag = all(FlagData.get_option(flag, flag_options) is not None for flag in flags)
-                        else:
-                            option = FlagData.get_option(flags[0], flag_options)
-                            if option is not None:
-                                aliases, num_flag_args = option
-                                is_next_flag = True  # 1 will be added to ignored anyway
-                                ignored += num_flag_args
-                                # TODO fix side effect where if next arg is flag it still increments ignored
-                    if is_next_flag:
-                        ignored += 1
-                if start_comparing + ignored == i:  # the next one is the request argument
-                    # assert not s.isspace()
-                    if i + 1 in unimportant:
-                        # basically what this does, if we are ignoring this arg, add 1 to ignored so we will get
-                        # one arg to the right
-                        ignored += 1  # Needed to execute if first if statement again
-                    else:  # the next one must be important
-                        appending = True
-        """
-        This method was a pain to write and think about. However, it was worth it because this helps out
-        """
-        return r
+        layout = self.__get_layout(ignore_unimportant_before, flag_options)
+        start = layout.get_start(index + self.get_command_index())
+        if start is None:
+            return []
+        return self.split()[start:]
+
+    def get_unimportant_indexes(self) -> Set[int]:
+        """
+        :return: The indexes of the parts that are unimportant words. This set should not be changed
+        """
+        if self._unimportant is None:
+            self._unimportant = set(get_unimportant(self.split()))
+        return self._unimportant
+
+    def __get_layout(self, ignore_unimportant_before: bool,
+                     flag_options: Union[FlagOptions, 'FlagSpec', None]) -> '_ArgumentLayout':
+        key = (ignore_unimportant_before, id(flag_options))
+        cached = self._layouts.get(key)
+        if cached is not None and cached[0] is flag_options:
+            return cached[1]
+        unimportant = self.get_unimportant_indexes() if ignore_unimportant_before else set()
+        layout = _ArgumentLayout(self.split(), unimportant, flag_options)
+        self._layouts[key] = (flag_options, layout)
+        return layout
 
     def subcommand(self, index=0, ignore_unimportant_before=True) -> 'CommandInput':
         """
@@ -200,7 +281,7 @@ class CommandInput:
                                           index
         :return: A CommandInput where the main command is the argument specified by index (normally 0)
         """
-        return CommandInput(self.__class__.join(self.get_arg(index, ignore_unimportant_before)))
+        return CommandInput.from_split(self.get_arg(index, ignore_unimportant_before))
 
     def get_flags(self, ignore_unimportant_before=True, allow_flags_after_args=False, ignore_command=True) -> List[str]:
         """
@@ -211,24 +292,24 @@ class CommandInput:
         :return: The flags of this command as a list of strings. You are allowed to change (remove/append) to the
                  returned list
         """
-        flags = []
-        split = self.split()
-        if ignore_unimportant_before:
-            unimportant = get_unimportant(split)
-        else:
-            unimportant = []
-
-        start_comparing = self.get_command_index()
-
-        for i, arg in enumerate(split):
-            if i > start_comparing or not ignore_command:  # make sure it isn't the command
-                flag = self.__class__.parse_flag(arg)
-                if flag is not None:
-                    flags.extend(flag)
-                elif i not in unimportant and not allow_flags_after_args:
-                    break
-
-        return flags
+        key = (ignore_unimportant_before, allow_flags_after_args, ignore_command)
+        flags = self._flags.get(key)
+        if flags is None:
+            flags = []
+            unimportant = self.get_unimportant_indexes() if ignore_unimportant_before else ()
+            start_comparing = self.get_command_index()
+
+            for i, arg in enumerate(self.split()):
+                if i > start_comparing or not ignore_command:  # make sure it isn't the command
+                    flag = self.__class__.parse_flag(arg)
+                    if flag is not None:
+                        flags.extend(flag)
+                    elif i not in unimportant and not allow_flags_after_args:
+                        break
+            flags = tuple(flags)
+            self._flags[key] = flags
+
+        return list(flags)
 
     # def get_arg_flag(self):
 
@@ -277,21 +358,218 @@ class CommandInput:
 
     @staticmethod
     def do_split(to_split: str) -> List[str]:
-        return shlex.split(to_split)
+        """
+        Splits the string the same way shlex.split does
+
+        :raises ValueError: If the string can't be split. (Ex: There's no closing quote)
+        """
+        return split_input(to_split)
+
+
+class _ArgumentLayout:
+    """
+    What CommandInput.get_arg needs to know about the parts of a CommandInput for one set of flag options. This is \
+    created once for each set of flag options and after that, getting an argument only compares ints.
+    """
+
+    def __init__(self, split: List[str], unimportant: Set[int], flag_options: Union[FlagOptions, 'FlagSpec', None]):
+        """
+        :param split: The parts of the CommandInput
+        :param unimportant: The indexes of the parts that are unimportant or an empty set if they shouldn't be ignored
+        :param flag_options: The flag options or None to treat every flag like it has 0 arguments after it
+        """
+        self.unimportant = unimportant
+        self.offsets = []  # type List[int]
+        """offsets[i] is i minus the number of parts up to and including i + 1 that belong to a flag. When a part \
+        is being compared with the requested index, this is what it's compared with."""
+        self._starts = {}  # type Dict[int, Optional[int]]
+        """A dict of each index (including the command index) to the index of the first part of that argument"""
+
+        ignored = 0
+        length = len(split)
+        for i in range(length):
+            if i + 1 < length:
+                flags = CommandInput.parse_flag(split[i + 1])
+                if flags is not None:
+                    if len(flags) > 1:  # assume that there are 0 arguments after something like -al
+                        if all(FlagData.get_option(flag, flag_options) is not None for flag in flags):
+                            ignored += 1
+                    else:
+                        option = FlagData.get_option(flags[0], flag_options)
+                        if option is not None:
+                            num_flag_args = option[1]
+                            if num_flag_args is None:
+                                break  # the flag takes up the rest of the command so there are no more arguments
+                            ignored += 1 + num_flag_args
+                            # TODO fix side effect where if next arg is flag it still increments ignored
+            self.offsets.append(i - ignored)
+
+    def get_start(self, index: int) -> Optional[int]:
+        """
+        :param index: The index of the argument plus the command index
+        :return: The index of the part where the argument starts or None if there is no argument at that index
+        """
+        try:
+            return self._starts[index]
+        except KeyError:
+            pass
+        start = None
+        compare = index
+        for i, offset in enumerate(self.offsets):
+            if offset == compare:  # the next part is the requested argument
+                if i + 1 in self.unimportant:
+                    compare += 1  # we are ignoring the next part so the one after it will be compared
+                else:
+                    start = i + 1
+                    break
+        self._starts[index] = start
+        return start
+
+
+class FlagSpec:
+    """
+    FlagOptions that have been compiled so that finding the option of a flag is O(1) instead of looking through each \
+    tuple of aliases. Create this once (Ex: as a constant) and use it for each CommandInput.
+
+    This can be used anywhere FlagOptions can be used. (CommandInput.get_arg and FlagData)
+    """
+
+    def __init__(self, flag_options: FlagOptions):
+        """
+        :param flag_options: The FlagOptions to compile. If an alias is in multiple tuples, the first one is used \
+                just like FlagData.get_option
+        """
+        self.flag_options = dict(flag_options)
+        self._options = {}  # type Dict[str, Tuple[Tuple[str, ...], Optional[int]]]
+        """A dict of each alias to its tuple of aliases and the number of arguments after it"""
+        for aliases, num_args in self.flag_options.items():
+            for alias in aliases:
+                self._options.setdefault(alias, (aliases, num_args))
+
+    def __str__(self):
+        return str(self.flag_options)
+
+    def get_option(self, flag_name: str) -> Optional[Tuple[Tuple[str, ...], Optional[int]]]:
+        """
+        :param flag_name: The name or any alias of the flag
+        :return: The same thing FlagData.get_option returns
+        """
+        return self._options.get(flag_name)
+
+    def get_canonical(self, flag_name: str) -> Optional[str]:
+        """
+        :param flag_name: The name or any alias of the flag
+        :return: The first alias of the flag or None if the flag isn't known
+        """
+        option = self._options.get(flag_name)
+        return None if option is None else option[0][0]
+
+    def parse(self, command: CommandInput) -> 'ParsedFlags':
+        """
+        Finds every flag in command that is in this FlagSpec in one pass.
+
+        Just like CommandInput.get_flags, the command itself is never a flag and flags with 0 arguments are only \
+        counted if they are before the first argument. Since this knows how many arguments each flag has, the \
+        arguments of a flag are skipped so they aren't mistaken for the first argument. (Ex: "--rest 0.5 --simple" \
+        has the simple flag)
+
+        Flags with arguments are counted anywhere. If one is in the command multiple times, the first one is used. \
+        Something that looks like a flag is never the argument of another flag so it ends that flag's arguments. \
+        (Ex: In "--file --simple", file is "" and simple is True)
+
+        :param command: The CommandInput to look through
+        :return: The ParsedFlags that has the value of each flag
+        """
+        values = {}  # type Dict[str, Union[bool, str, List[str]]]
+        unknown = []  # type List[str]
+        split = command.split()
+        unimportant = command.get_unimportant_indexes()
+        before_args = True  # True until the first argument that isn't part of a flag
+        length = len(split)
+        i = command.get_command_index() + 1  # the command is never a flag or an argument of one
+        while i < length:
+            flags = CommandInput.parse_flag(split[i])
+            if flags is None:
+                if i not in unimportant:
+                    before_args = False
+                i += 1
+                continue
+            i += 1
+            for flag in flags:
+                option = self._options.get(flag)
+                if option is None:
+                    unknown.append(flag)
+                    continue
+                aliases, num_args = option
+                name = aliases[0]
+                if num_args == 0:
+                    if before_args:
+                        values[name] = True
+                    continue
+                after = []
+                if len(flags) == 1:  # something like: -asdf has no arguments after it
+                    while i < length and (num_args is None or len(after) < num_args) \
+                            and CommandInput.parse_flag(split[i]) is None:
+                        after.append(split[i])
+                        i += 1
+                if name not in values:
+                    values[name] = (after[0] if after else "") if num_args == 1 else after
+        return ParsedFlags(self, values, unknown)
+
+
+class ParsedFlags:
+    """
+    The result of FlagSpec.parse. Each flag can be retrieved by any of its aliases
+    """
+
+    def __init__(self, spec: FlagSpec, values: Dict[str, Union[bool, str, List[str]]], unknown: List[str]):
+        """
+        :param spec: The FlagSpec that created this
+        :param values: A dict of the first alias of each flag that was in the command to its value
+        :param unknown: The flags that aren't in the FlagSpec in the order they were in the command
+        """
+        self.spec = spec
+        self.values = values
+        self.unknown = unknown
+
+    def __contains__(self, name: str):
+        """
+        :return: True if the flag was in the command. (Even if there were no arguments after it)
+        """
+        return self.spec.get_canonical(name) in self.values
+
+    def get(self, name: str) -> Union[bool, Optional[str], Optional[List[str]]]:
+        """
+        :param name: The name or any alias of the flag
+        :return: The same thing that FlagData.get_flag returns
+        :raises ValueError: If the flag isn't in the FlagSpec
+        """
+        option = self.spec.get_option(name)
+        if option is None:
+            raise ValueError("Was unable to find flag: '{}' in flag_options: {}".format(name, self.spec))
+        aliases, num_args = option
+        value = self.values.get(aliases[0])
+        if value is None and num_args == 0:
+            return False
+        return value
 
 
 class FlagData:
-    def __init__(self, command: CommandInput, flag_options: FlagOptions):
+    def __init__(self, command: CommandInput, flag_options: Union[FlagOptions, FlagSpec]):
         self.command = command
         self.flag_options = flag_options
+        self.spec = flag_options if isinstance(flag_options, FlagSpec) else FlagSpec(flag_options)
+        self._parsed = None  # type Optional[ParsedFlags]
 
     @staticmethod
-    def get_option(flag_name: str, flag_options: Optional[FlagOptions]) -> Optional[Tuple[Tuple[str], int]]:
+    def get_option(flag_name: str, flag_options: Union[FlagOptions, FlagSpec, None]) \
+            -> Optional[Tuple[Tuple[str], int]]:
         """
 
         :param flag_name: The name of the flag which may have multiple aliases
         :param flag_options: The FlagOptions dict where each key is a tuple of aliases/names and each value is the
-                             number of arguments that come after the flag represented by the names
+                             number of arguments that come after the flag represented by the names. This can also
+                             be a FlagSpec which is faster
 
                              If this is None, then the returned value will be (flag_name,), 0 meaning that by default,
                              this allows you to have no flag_options making things assume every flag is valid and
@@ -301,17 +579,27 @@ class FlagData:
         """
         if flag_options is None:
             return (flag_name,), 0
+        if isinstance(flag_options, FlagSpec):
+            return flag_options.get_option(flag_name)
         try:
             # thanks: https://stackoverflow.com/a/2974082
             return next((k, v) for k, v in flag_options.items() if flag_name in k)
         except StopIteration:
             return None
 
+    def parse(self) -> ParsedFlags:
+        """
+        :return: The ParsedFlags for the command. The command is only parsed the first time this is called
+        """
+        if self._parsed is None:
+            self._parsed = self.spec.parse(self.command)
+        return self._parsed
+
     def get_flag(self, name) -> Union[bool, Optional[str], Optional[List[str]]]:
         """
         :param name: The name of the flag.
         :return: If the value corresponding with the name is 0 (0 arguments) then the return value will be a bool
-                 that is True if the name (or any aliases) are in command.get_flags().
+                 that is True if the name (or any aliases) are before the first argument. (See FlagSpec.parse)
 
                  If the value is 1, then the return value will be: a string representing the argument that came after
                  the flag. If the flag was not in the command it will return None.
@@ -323,34 +611,7 @@ class FlagData:
                  if there were no arguments or there were less than <value> amount of arguments after it then the length
                  of the returned list may not be value
         """
-        option = self.__class__.get_option(name, self.flag_options)
-        if option is None:
-            raise ValueError("Was unable to find flag: '{}' in flag_options: {}".format(name, self.flag_options))
-        aliases, num_args = option
-
-        if num_args == 0:
-            return any(flag in aliases for flag in self.command.get_flags())
-
-        r = []
-        append = False
-        for arg in self.command.split():
-            if append:
-                r.append(arg)
-                if len(r) == num_args:
-                    break
-                continue
-
-            flags = CommandInput.parse_flag(arg)
-            if flags is not None and any(alias in flags for alias in aliases):
-                append = True
-                if len(flags) > 1:
-                    break  # if there are multiple flags like: -asdf then return an empty list or empty string
-
-        if not append:  # flag was not present in command
-            return None
-        if num_args == 1:
-            return r[0] if len(r) > 0 else ""
-        return r
+        return self.parse().get(name)
 
 
 class InputHandler(ABC):
@@ -369,6 +630,20 @@ class InputHandler(ABC):
         """
         pass
 
+    def get_command_names(self) -> Optional[List[str]]:
+        """
+        Used by the Handler so it doesn't have to call on_input on every InputHandler for every command. If this \
+        returns a list, the Handler will only call on_input when the command in lower case is in that list. If \
+        nothing handles a command, on_input may also be called when it is a typo of a name in that list. (See \
+        CommandInput.get_command_name)
+
+        By default, this returns None which means that on_input will be called no matter what the command is. \
+        (Needed for things like NameTaker that handle any input)
+
+        :return: A list of the command names this InputHandler reacts to or None if it may react to any input
+        """
+        return None
+
     def _should_handle_input(self, already_handled: List[InputHandleType]) -> bool:
         """
         Should not be called outside of InputHandler or its subclasses
@@ -413,7 +688,9 @@ class PlayerInputHandler(InputHandler):
         pass
 
 
-class InputHandle:  # returned and used to indicate when the handle function should be called
+class InputHandle(SlotsPickleMixin):  # returned and used to indicate when the handle function should be called
+    __slots__ = ("priority", "handle", "input_handler")
+
     PRIORITY_LOW = 12
     """Priority that is lower than PRIORITY_LOCATION."""
     PRIORITY_LOCATION = 10
@@ -0,0 +1,257 @@
+"""
+This file has what's needed to find the command a player meant to type even if they made a typo. Instead of each \
+    CommandHandler having a list of common misspellings, the names are put in a CommandLexicon which finds the \
+    closest name using a BK-tree. If there are a lot of names, an NGramMatcher is used to order names that are equally \
+    close so the one that looks the most like the typed word is first.
+"""
+from typing import List, Tuple, Optional, Callable, Dict, Generic, TypeVar, Union
+
+from textadventure.ngram import NGramMatcher, create_ngram_matcher, THRESHOLD
+
+T = TypeVar("T")
+
+MaxDistance = Union[int, Callable[[int], int]]
+"""Either the maximum number of typos allowed or a function that takes the length of the typed word and returns \
+    the maximum number of typos allowed"""
+
+
+def edit_distance(a: str, b: str) -> int:
+    """
+    Calculates the Damerau-Levenshtein distance between two strings. That is the number of insertions, deletions, \
+    substitutions and transpositions of two characters next to each other needed to change a into b. ("listne" and \
+    "listen" have a distance of 1)
+
+    Unlike the simpler optimal string alignment distance, this is a metric which is needed for a BKTree to work
+
+    :return: The distance between a and b
+    """
+    if a == b:
+        return 0
+    length_a = len(a)
+    length_b = len(b)
+    if length_a == 0 or length_b == 0:
+        return length_a + length_b
+
+    maximum = length_a + length_b
+    last_row = {}  # type Dict[str, int]
+    """A dict of each character to the last row it was in"""
+    # the first row and column of distances are filled with the maximum so they're never used
+    distances = [[maximum] * (length_b + 2)]
+    distances.extend([maximum, i] + [0] * length_b for i in range(length_a + 1))
+    for j in range(length_b + 1):
+        distances[1][j + 1] = j
+
+    for i in range(1, length_a + 1):
+        last_match_column = 0
+        character_a = a[i - 1]
+        row = distances[i + 1]
+        previous_row = distances[i]
+        for j in range(1, length_b + 1):
+            character_b = b[j - 1]
+            last_match_row = last_row.get(character_b, 0)
+            cost = 0 if character_a == character_b else 1
+            row[j + 1] = min(previous_row[j] + cost,  # substitution
+                             row[j] + 1,  # insertion
+                             previous_row[j + 1] + 1,  # deletion
+                             distances[last_match_row][last_match_column]  # transposition
+                             + (i - last_match_row - 1) + 1 + (j - last_match_column - 1))
+            if cost == 0:
+                last_match_column = j
+        last_row[character_a] = i
+    return distances[length_a + 1][length_b + 1]
+
+
+def default_max_distance(length: int) -> int:
+    """
+    The default maximum number of typos allowed for a word. Short words can't have any typos because there are so \
+    many short words that are close to each other.
+
+    :param length: The length of the typed word
+    :return: 0 if length <= 2, 1 if length <= 5, otherwise 2
+    """
+    if length <= 2:
+        return 0
+    if length <= 5:
+        return 1
+    return 2
+
+
+class BKTree:
+    """
+    A tree of words where each child is stored by its distance to its parent. Because edit_distance is a metric, \
+    finding every word within a distance of a word only needs to look at a small part of the tree.
+    """
+
+    def __init__(self, distance: Callable[[str, str], int] = edit_distance):
+        self.distance = distance
+        self._root = None  # type Optional[Tuple[str, Dict[int, tuple]]]
+        """None or a tuple where [0] is a word and [1] is a dict of each distance to the child node"""
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def add(self, word: str) -> bool:
+        """
+        :param word: The word to add
+        :return: True if the word was added, False if it was already in this
+        """
+        if self._root is None:
+            self._root = (word, {})
+            self._size = 1
+            return True
+        node = self._root
+        while True:
+            distance = self.distance(word, node[0])
+            if distance == 0:
+                return False
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                self._size += 1
+                return True
+            node = child
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """
+        :param word: The word to look for
+        :param max_distance: The maximum distance a word can be from word to be returned
+        :return: A list of tuples sorted by distance where [0] is the distance and [1] is the word in this tree
+        """
+        r = []
+        if self._root is None:
+            return r
+        to_check = [self._root]
+        while to_check:
+            node_word, children = to_check.pop()
+            distance = self.distance(word, node_word)
+            if distance <= max_distance:
+                r.append((distance, node_word))
+            low = distance - max_distance
+            high = distance + max_distance
+            for child_distance, child in children.items():
+                if low <= child_distance <= high:
+                    to_check.append(child)
+        r.sort()
+        return r
+
+
+class CommandLexicon(Generic[T]):
+    """
+    Indexes command names so the command a player meant can be found even if they made a typo. Each name can have \
+    multiple values. (Ex: Multiple InputHandlers that handle the same command)
+    """
+    MAX_CACHED = 1024
+    """The maximum number of resolved words to remember"""
+
+    def __init__(self, max_distance: MaxDistance = default_max_distance, use_numpy: Optional[bool] = None):
+        """
+        :param max_distance: The maximum number of typos allowed or a function that takes the length of the typed \
+                word and returns that. By default, default_max_distance
+        :param use_numpy: Passed to create_ngram_matcher when there are more than THRESHOLD names. By default, None \
+                which uses NumPy if it's installed
+        """
+        self.max_distance = max_distance
+        self.use_numpy = use_numpy
+        self._values = {}  # type Dict[str, List[T]]
+        """A dict of each lower case name to its values"""
+        self._tree = None  # type Optional[BKTree]
+        """A BKTree of each name. None until it's needed. This is only built when a typo needs to be resolved \
+        because most of the time, the exact name is typed. After that, names are added to it"""
+        self._matcher = None  # type Optional[NGramMatcher]
+        """Used to order names that are equally close when there are more than THRESHOLD names. None until it's \
+        needed. After that, names are added to it"""
+        self._matcher_indexes = {}  # type Dict[str, int]
+        """A dict of each name to its index in _matcher"""
+        self._resolved = {}  # type Dict[str, Optional[str]]
+        """A dict of each typed word to the name it resolved to. Cleared when a name is added"""
+
+    def __contains__(self, name: str):
+        return name.lower() in self._values
+
+    def add(self, name: str, value: T):
+        """
+        :param name: The name of the command. This is case insensitive
+        :param value: The value that will be returned by get when name is resolved
+        """
+        name = name.lower()
+        values = self._values.get(name)
+        if values is None:
+            values = []
+            self._values[name] = values
+            if self._tree is not None:
+                self._tree.add(name)
+            if self._matcher is not None:
+                self._matcher_indexes[name] = self._matcher.add(name)
+            self._resolved.clear()
+        values.append(value)
+
+    def get_max_distance(self, word: str) -> int:
+        if callable(self.max_distance):
+            return self.max_distance(len(word))
+        return self.max_distance
+
+    def __search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """
+        :return: The same thing as BKTree.search except if there are more than THRESHOLD names, names that are \
+                equally close to word are ordered by their NGramMatcher score, best first
+        """
+        if self._tree is None:
+            self._tree = BKTree()
+            for name in self._values:
+                self._tree.add(name)
+        r = self._tree.search(word, max_distance)
+        if len(r) > 1 and len(self._values) > THRESHOLD:
+            if self._matcher is None:
+                names = list(self._values)
+                self._matcher = create_ngram_matcher(names, self.use_numpy)
+                self._matcher_indexes = {name: i for i, name in enumerate(names)}
+            scores = self._matcher.get_scores(word)
+            indexes = self._matcher_indexes
+            r.sort(key=lambda match: (match[0], -scores[indexes[match[1]]]))
+        return r
+
+    def resolve(self, word: str) -> Optional[str]:
+        """
+        Finds the name that was most likely meant by word. If word is a name, that is returned. Otherwise, the \
+        closest name within the allowed distance is returned. If multiple names are equally close, it's not clear \
+        which one was meant so None is returned unless they all have the same values.
+
+        :param word: The word that was typed. This is case insensitive
+        :return: The name that was meant or None if there isn't one
+        """
+        word = word.lower()
+        if word in self._values:
+            return word
+        try:
+            return self._resolved[word]
+        except KeyError:
+            pass
+        r = None
+        max_distance = self.get_max_distance(word)
+        if max_distance > 0:
+            matches = self.__search(word, max_distance)
+            if matches:
+                best_distance, r = matches[0]
+                values = self._values[r]
+                for distance, name in matches[1:]:
+                    if distance != best_distance:
+                        break
+                    if self._values[name] != values:  # it's not clear which one was meant
+                        r = None
+                        break
+        if len(self._resolved) >= self.__class__.MAX_CACHED:
+            self._resolved.clear()
+        self._resolved[word] = r
+        return r
+
+    def get(self, word: str) -> List[T]:
+        """
+        :param word: The word that was typed. This is case insensitive
+        :return: The values of the name that word resolved to or an empty list if it didn't resolve to one. This \
+                list should not be changed
+        """
+        name = self.resolve(word)
+        if name is None:
+            return []
+        return self._values[name]
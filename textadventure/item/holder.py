@@ -1,9 +1,200 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Callable, Any, Dict, Type, List, TypeVar
 
 
 if TYPE_CHECKING:
     from textadventure.item.item import Item
 
+T = TypeVar("T")
+
+
+class ItemContainer:
+    """
+    Stores items in the order they were added like a list but also keeps them in a dict so checking if an item is in \
+    this and removing an item is O(1). Items are also grouped by their exact type and, if key is given, by their key \
+    so they can be counted without looping through every item.
+
+    This has the methods of a list that are used on Holder.items (append, remove, extend, clear) so it can be used \
+    in place of one. Note that an item can only be in this once.
+    """
+
+    def __init__(self, items: Iterable['Item'] = (), key: Optional[Callable[['Item'], Any]] = None):
+        """
+        :param items: The starting items
+        :param key: A function that returns a hashable key for an item so count_key can be used or None. If this \
+                is pickled, this function must be able to be pickled. (Not a lambda) By default, None
+        """
+        self.key = key
+        self._items = {}  # type Dict[Item, None]  # a dict is used as an ordered set
+        self._by_type = {}  # type Dict[Type, Dict[Item, None]]
+        """A dict of each exact type to the items of that type in the order they were added"""
+        self._by_key = {}  # type Dict[Any, Dict[Item, None]]
+        """Only used when self.key is not None. A dict of each key to the items with that key in the order they were \
+        added"""
+        self._subtypes = {}  # type Dict[Type, List[Type]]
+        """A cache of each type passed to count_type or get_type to the types in _by_type that are a subclass of it"""
+        self.extend(items)
+
+    def __reduce__(self):
+        return self.__class__, (list(self._items), self.key)
+
+    def append(self, item: 'Item'):
+        """
+        Adds item if it isn't already in this
+
+        :param item: The item to add
+        """
+        if item in self._items:
+            return
+        self._items[item] = None
+        item_type = type(item)
+        bucket = self._by_type.get(item_type)
+        if bucket is None:
+            bucket = {}
+            self._by_type[item_type] = bucket
+            self._subtypes.clear()  # the new type may need to be in them
+        bucket[item] = None
+        if self.key is not None:
+            key = self.key(item)
+            key_bucket = self._by_key.get(key)
+            if key_bucket is None:
+                key_bucket = {}
+                self._by_key[key] = key_bucket
+            key_bucket[item] = None
+
+    def extend(self, items: Iterable['Item']):
+        for item in items:
+            self.append(item)
+
+    def remove(self, item: 'Item'):
+        """
+        :param item: The item to remove
+        :raises ValueError: If item isn't in this
+        """
+        if item not in self._items:
+            raise ValueError("{} is not in this ItemContainer".format(item))
+        del self._items[item]
+        del self._by_type[type(item)][item]
+        if self.key is not None:
+            key = self.key(item)
+            key_bucket = self._by_key[key]
+            del key_bucket[item]
+            if not key_bucket:
+                del self._by_key[key]
+
+    def discard(self, item: 'Item'):
+        """
+        Removes item if it is in this
+        """
+        if item in self._items:
+            self.remove(item)
+
+    def clear(self):
+        self._items.clear()
+        self._by_type.clear()
+        self._by_key.clear()
+        self._subtypes.clear()
+
+    def __get_subtypes(self, item_type: Type) -> List[Type]:
+        r = self._subtypes.get(item_type)
+        if r is None:
+            r = [element_type for element_type in self._by_type if issubclass(element_type, item_type)]
+            self._subtypes[item_type] = r
+        return r
+
+    def count_type(self, item_type: Type) -> int:
+        """
+        :param item_type: The type of item to count. Subclasses of it are also counted
+        :return: The number of items that are an instance of item_type
+        """
+        return sum(len(self._by_type[element_type]) for element_type in self.__get_subtypes(item_type))
+
+    def get_type(self, item_type: Type[T]) -> List[T]:
+        """
+        :param item_type: The type of item to get. Subclasses of it are also included
+        :return: A new list of the items that are an instance of item_type. Items of the same exact type are in the \
+                order they were added
+        """
+        r = []
+        for element_type in self.__get_subtypes(item_type):
+            r.extend(self._by_type[element_type])
+        return r
+
+    def get_first(self, item_type: Type[T]) -> Optional[T]:
+        """
+        :param item_type: The type of item to get
+        :return: The first item that was added that is an instance of item_type or None
+        """
+        subtypes = self.__get_subtypes(item_type)
+        if len(subtypes) == 1:  # usually the case. No need to look at every item
+            return next(iter(self._by_type[subtypes[0]]), None)
+        for item in self._items:
+            if isinstance(item, item_type):
+                return item
+        return None
+
+    def count_key(self, key) -> int:
+        """
+        Can only be used if key was passed to the constructor
+
+        :param key: The key
+        :return: The number of items whose key is equal to key
+        """
+        assert self.key is not None, "A key function must be passed to the constructor in order to use count_key"
+        return len(self._by_key.get(key, ()))
+
+    def get_key(self, key) -> List['Item']:
+        """
+        Can only be used if key was passed to the constructor
+
+        :param key: The key
+        :return: A new list of the items whose key is equal to key in the order they were added
+        """
+        assert self.key is not None, "A key function must be passed to the constructor in order to use get_key"
+        return list(self._by_key.get(key, ()))
+
+    def get_first_key(self, key) -> Optional['Item']:
+        """
+        Can only be used if key was passed to the constructor
+
+        :param key: The key
+        :return: The first item that was added whose key is equal to key or None
+        """
+        assert self.key is not None, "A key function must be passed to the constructor in order to use get_first_key"
+        return next(iter(self._by_key.get(key, ())), None)
+
+    def keys(self) -> List[Any]:
+        """
+        Can only be used if key was passed to the constructor
+
+        :return: A new list of the key of every item without duplicates
+        """
+        assert self.key is not None, "A key function must be passed to the constructor in order to use keys"
+        return list(self._by_key)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        try:
+            return item in self._items
+        except TypeError:  # unhashable so it can't be in this
+            return False
+
+    def __iter__(self) -> Iterator['Item']:
+        return iter(list(self._items))  # copy so items can be added or removed while iterating
+
+    def __eq__(self, other):
+        if isinstance(other, ItemContainer):
+            return list(self._items) == list(other._items)
+        if isinstance(other, list):
+            return list(self._items) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "ItemContainer({})".format(list(self._items))
+
 
 class Holder:  # kind of like an interface
     """
@@ -11,9 +202,28 @@ class Holder:  # kind of like an interface
     Item picking up/dropping is handled by the weapon that is being dropped/picked up using change_holder
     """
     def __init__(self):
-        self.items = []
+        self.items = self._create_item_container()
         """Should almost never be appended to directly. You should use the item's change_holder method"""
 
+    def _create_item_container(self, items: Iterable['Item'] = ()) -> ItemContainer:
+        """
+        Can be overridden to create an ItemContainer with a key
+
+        :param items: The starting items
+        :return: The ItemContainer that will be used for self.items
+        """
+        return ItemContainer(items)
+
+    def __setstate__(self, state):
+        """
+        Used when unpickling so a Holder (like a Wallet) that was saved when items was a list still gets an \
+        ItemContainer
+        """
+        self.__dict__.update(state)
+        items = self.__dict__.get("items")
+        if items is not None and not isinstance(items, ItemContainer):
+            self.items = self._create_item_container(items)
+
     def can_hold(self, item: 'Item'):
         """
         Returns whether or not this holder can hold this item. Usually True and usually only reacts to the weapon type
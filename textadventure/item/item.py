@@ -2,10 +2,11 @@ from abc import abstractmethod, ABC
 from typing import Optional, Any, TYPE_CHECKING
 
 from textadventure.item.holder import Holder
-from textadventure.saving.savable import Savable
+from textadventure.saving.savable import Savable, HasSavable
 from textadventure.sending.commandsender import CommandSender
 from textadventure.sending.message import Message
-from textadventure.utils import are_mostly_equal, CanDo, MessageConstant
+from textadventure.utils import are_normalized_mostly_equal, normalize_reference, ReferenceName, CanDo, \
+    MessageConstant
 
 if TYPE_CHECKING:
     from textadventure.handler import Handler
@@ -17,6 +18,16 @@ def create_use_message(item: 'Item') -> MessageConstant:
     return Message("You used {}.", named_variables=[item])
 
 
+def mark_holder_dirty(holder: Optional[Holder]):
+    """
+    Marks holder as dirty if it is saved so the Handler saves it again after its items change
+
+    :param holder: The holder whose items changed or None
+    """
+    if isinstance(holder, (Savable, HasSavable)):
+        holder.mark_dirty()
+
+
 class FiveSensesHandler(ABC):
     """
     The methods don't return a CanDo because locations need to be able to handle these and a Item's can_<sense>methods\
@@ -78,6 +89,8 @@ class Item(Savable, FiveSensesHandler):
     #         setattr(instance, item, None)
     #     return instance
 
+    name = ReferenceName()  # type str
+
     def __init__(self, name: str, needs_light_to_see: bool):
         """
         An object that is in a location with properties that define how it should react when players type commands
@@ -117,6 +130,9 @@ class Item(Savable, FiveSensesHandler):
             previous_holder.items.remove(self)
         if self not in new_holder.items:
             new_holder.items.append(self)
+        self.mark_dirty()
+        mark_holder_dirty(previous_holder)
+        mark_holder_dirty(new_holder)
         return True
 
     def before_save(self, source: Any, handler: 'Handler'):
@@ -138,7 +154,7 @@ class Item(Savable, FiveSensesHandler):
         :param reference: The string used to reference this Item
         :return: A boolean telling whether or not the string is close enough to reference this Item
         """
-        return are_mostly_equal(self.name, reference)
+        return are_normalized_mostly_equal(Item.name.get_normalized(self), normalize_reference(reference))
 
     def can_reference(self, player: 'Player') -> CanDo:
         location = player.location
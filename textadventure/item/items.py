@@ -1,7 +1,7 @@
-from typing import Optional, Any, TYPE_CHECKING
+from typing import Optional, Any, TYPE_CHECKING, Dict, List
 
-from textadventure.item.holder import Holder
-from textadventure.item.item import Item
+from textadventure.item.holder import Holder, ItemContainer
+from textadventure.item.item import Item, mark_holder_dirty
 
 if TYPE_CHECKING:
     from textadventure.player import Player
@@ -19,13 +19,20 @@ class CoinType:
         self.name = name
         self.same_name_for_equal = same_name_for_equal
 
-    def create(self):
-        return Coin(self)
+    def create(self, amount: int = 1) -> 'Coin':
+        """
+        :param amount: The number of coins in the stack. By default, 1
+        :return: A new Coin stack of this type
+        """
+        return Coin(self, amount)
 
     def __eq__(self, other):
         return isinstance(other, CoinType) and other.worth == self.worth and \
                ((not self.same_name_for_equal and not other.same_name_for_equal) or other.name == self.name)
 
+    def __hash__(self):
+        return hash(self.worth)  # the name isn't always used in __eq__ so it can't be used here
+
 
 class Coin(Item):
     PENNY = CoinType(1, "penny")
@@ -33,12 +40,70 @@ class Coin(Item):
     QUARTER = CoinType(25, "quarter")
     DOLLAR = CoinType(100, "dollar")
 
-    def __init__(self, coin_type):
+    def __init__(self, coin_type: CoinType, amount: int = 1):
+        """
+        A Coin is a stack of coins of the same CoinType so having a lot of coins doesn't mean having a lot of objects
+
+        :param coin_type: The CoinType of each coin in this stack
+        :param amount: The number of coins in this stack. By default, 1
+        """
         super().__init__(coin_type.name, True)
+        assert amount > 0, "A stack must have at least one coin"
         self.coin_type = coin_type
+        self.amount = amount
+        """The number of coins in this stack"""
+
+    def __setstate__(self, state):
+        """
+        Used when unpickling so a Coin that was saved before coins were stacked is a stack of 1 coin
+        """
+        self.__dict__.update(state)
+        self.__dict__.setdefault("amount", 1)
+
+    def get_worth(self) -> int:
+        """
+        :return: The worth of every coin in this stack
+        """
+        return self.coin_type.worth * self.amount
+
+    def split(self, amount: int) -> 'Coin':
+        """
+        Takes amount coins from this stack and puts them in a new stack. The new stack isn't held by anything so you \
+        should call its change_holder method
+
+        :param amount: The number of coins to take. Must be more than 0 and less than self.amount
+        :return: The new stack
+        :raises ValueError: If amount isn't more than 0 and less than self.amount
+        """
+        if not 0 < amount < self.amount:
+            raise ValueError("Cannot split {} coins from a stack of {}".format(amount, self.amount))
+        self.amount -= amount
+        self.mark_dirty()
+        return Coin(self.coin_type, amount)
+
+    def merge(self, other: 'Coin'):
+        """
+        Moves all of the coins in other into this stack. other should no longer be used after this is called and it \
+        should not be held by anything. (Wallet.add_coin does this for you)
+
+        :param other: The stack to merge into this one. Its coin_type must be equal to this one's
+        """
+        assert other is not self, "Cannot merge a stack with itself"
+        assert other.coin_type == self.coin_type, "Can only merge stacks of the same CoinType"
+        self.amount += other.amount
+        other.amount = 0
+        self.mark_dirty()
+        other.mark_dirty()
 
     def change_holder(self, previous_holder: Optional[Holder], new_holder: Holder) -> bool:
         new_holder = new_holder.get_wallet()
+        if isinstance(new_holder, Wallet) and self not in new_holder.items:
+            if previous_holder is not None and self in previous_holder.items:
+                previous_holder.items.remove(self)
+            new_holder.add_coin(self)
+            mark_holder_dirty(previous_holder)
+            mark_holder_dirty(new_holder)
+            return True
         return super().change_holder(previous_holder, new_holder)
 
     def can_feel(self, player: 'Player'):
@@ -55,10 +120,10 @@ class Coin(Item):
             assert wallet is not None
             holder = wallet
 
-        amount_more = 0
-        for item in holder.items:
-            if isinstance(item, Coin) and item.coin_type == self.coin_type:
-                amount_more += 1
+        if isinstance(holder, Wallet):
+            amount_more = holder.get_amount(self.coin_type)
+        else:
+            amount_more = sum(item.amount for item in holder.items.get_type(Coin) if item.coin_type == self.coin_type)
         if holder == player:
             player.send_message("You have {} of this type of coin.".format(amount_more))
         else:
@@ -86,15 +151,142 @@ class Coin(Item):
         player.send_message("It doesn't smell that great.")
 
 
+def get_coin_type(coin: 'Coin') -> CoinType:
+    """
+    The key of the ItemContainer of a Wallet. This isn't a lambda so the ItemContainer can be pickled
+
+    :param coin: A Coin in a Wallet
+    :return: The CoinType of coin or None if it isn't a Coin
+    """
+    return getattr(coin, "coin_type", None)
+
+
 class Wallet(Item, Holder):
     """
     Since we don't want the player class to have to handle coins and all that, a wallet holds and handles coins
+
+    A wallet has at most one Coin stack for each CoinType. When a Coin is added, it is merged into the stack that's \
+    already there.
     """
 
     def __init__(self):
         super().__init__("wallet", True)
         Holder.__init__(self)
 
+    def _create_item_container(self, items=()):  # from Holder
+        return ItemContainer(items, key=get_coin_type)
+
+    def __setstate__(self, state):
+        """
+        Used when unpickling so a Wallet that was saved with one Coin for each coin has one stack for each CoinType
+        """
+        super().__setstate__(state)
+        self.merge_stacks()
+
+    def merge_stacks(self):
+        """
+        Merges Coins that have the same CoinType into one stack. Only needed if something added to self.items directly
+        """
+        for coin_type in self.items.keys():
+            coins = self.items.get_key(coin_type)
+            stack = coins[0]
+            for coin in coins[1:]:
+                self.items.remove(coin)
+                stack.merge(coin)
+
+    def get_stack(self, coin_type: CoinType) -> Optional[Coin]:
+        """
+        :param coin_type: The CoinType
+        :return: The stack of coin_type coins in this wallet or None
+        """
+        return self.items.get_first_key(coin_type)
+
+    def get_amount(self, coin_type: CoinType) -> int:
+        """
+        :param coin_type: The CoinType
+        :return: The number of coin_type coins in this wallet
+        """
+        stack = self.get_stack(coin_type)
+        return 0 if stack is None else stack.amount
+
+    def get_amounts(self) -> Dict[CoinType, int]:
+        """
+        :return: A dict of each CoinType in this wallet to the number of coins of that type
+        """
+        return {coin_type: self.get_amount(coin_type) for coin_type in self.items.keys()}
+
+    def get_total(self) -> int:
+        """
+        :return: The total worth of every coin in this wallet. This only looks at one stack per CoinType
+        """
+        return sum(stack.get_worth() for stack in self.items)
+
+    def add_coin(self, coin: Coin) -> Coin:
+        """
+        Adds coin to this wallet merging it into the stack of its CoinType if there is one. Normally, you should call \
+        coin.change_holder instead which calls this
+
+        :param coin: The Coin stack to add. It should not be held by anything else
+        :return: The stack that now has the coins. This is coin if there wasn't a stack of its CoinType
+        """
+        stack = self.get_stack(coin.coin_type)
+        if stack is None:
+            self.items.append(coin)
+            self.mark_dirty()
+            return coin
+        if stack is not coin:
+            stack.merge(coin)
+        return stack
+
+    def take_coins(self, coin_type: CoinType, amount: Optional[int] = None) -> Coin:
+        """
+        Removes coins from this wallet. If all of the coins of coin_type are taken, the stack itself is removed and \
+        returned. The returned stack isn't held by anything so you should call its change_holder method with \
+        None as the previous holder
+
+        :param coin_type: The CoinType of the coins to take
+        :param amount: The number of coins to take or None to take all of them. By default, None
+        :return: A Coin stack with amount coins
+        :raises ValueError: If this wallet doesn't have amount coins of coin_type or if amount isn't more than 0
+        """
+        stack = self.get_stack(coin_type)
+        has = 0 if stack is None else stack.amount
+        if amount is None:
+            amount = has
+        if amount <= 0 or amount > has:
+            raise ValueError("Cannot take {} of {} {} coins".format(amount, has, coin_type.name))
+        if amount == has:
+            self.items.remove(stack)
+            self.mark_dirty()
+            return stack
+        return stack.split(amount)
+
+    def transfer(self, new_holder: Holder, coin_type: CoinType, amount: Optional[int] = None) -> bool:
+        """
+        Moves coins from this wallet to new_holder. (Or new_holder's wallet)
+
+        :param new_holder: The holder to give the coins to
+        :param coin_type: The CoinType of the coins to move
+        :param amount: The number of coins to move or None to move all of them. By default, None
+        :return: The result of the moved stack's change_holder method
+        :raises ValueError: If this wallet doesn't have amount coins of coin_type or if amount isn't more than 0
+        """
+        return self.take_coins(coin_type, amount).change_holder(None, new_holder)
+
+    def transfer_all(self, new_holder: Holder) -> List[Coin]:
+        """
+        Moves every coin in this wallet to new_holder. (Or new_holder's wallet)
+
+        :param new_holder: The holder to give the coins to
+        :return: A list of the stacks that were moved. If new_holder has a wallet, some may have been merged into it
+        """
+        moved = []
+        for coin_type in self.items.keys():
+            stack = self.take_coins(coin_type)
+            stack.change_holder(None, new_holder)
+            moved.append(stack)
+        return moved
+
     def before_save(self, source: Any, handler: 'Handler'):
         super().before_save(source, handler)
         for item in self.items:
@@ -105,6 +297,14 @@ class Wallet(Item, Holder):
         for item in self.items:
             item.on_load(self, handler)  # This wallet is the source for each coin in it
 
+    def needs_save(self, source: Any) -> bool:
+        return super().needs_save(source) or any(item.needs_save(self) for item in self.items)
+
+    def mark_saved(self, source: Any):
+        super().mark_saved(source)
+        for item in self.items:
+            item.mark_saved(self)
+
     def can_hold(self, item: Item):  # from Holder
         return isinstance(item, Coin)
 
@@ -7,13 +7,15 @@ from typing import List, Optional, TypeVar, Type
 
 from textadventure.entity import EntityAction, Entity
 from textadventure.handler import Handler
-from textadventure.input.inputhandling import CommandInput, PlayerInputHandler
+from textadventure.input.inputhandling import CommandInput, PlayerInputHandler, InputHandler
 from textadventure.item.holder import Holder
 from textadventure.item.item import Item, FiveSensesHandler
 from textadventure.player import Player
+from textadventure.reference import ReferenceMatch, get_location_entity_index
 from textadventure.sending.commandsender import CommandSender
 from textadventure.sending.message import Message, MessageType
-from textadventure.utils import Point, MessageConstant, are_mostly_equal, CanDo
+from textadventure.utils import Point, MessageConstant, are_normalized_mostly_equal, normalize_reference, \
+    ReferenceName, CanDo, TypeRegistry, VersionedList
 
 T = TypeVar('T')
 
@@ -34,6 +36,8 @@ class Location(Holder, PlayerInputHandler, FiveSensesHandler):
 
     NO_YELL_RESPONSE = "There was no response."
 
+    name = ReferenceName()  # type str
+
     def __init__(self, name, description, point: Point):
         super().__init__()
         self.name = name
@@ -42,14 +46,31 @@ class Location(Holder, PlayerInputHandler, FiveSensesHandler):
 
         self.initializers = []
         """A list of HandlerInitialize. Each called by the handler on the start of a new game or loading an old one"""
+        self.occupants = TypeRegistry()  # type TypeRegistry[Entity]
+        """The entities whose location is this location. This is updated when an entity's location is set so it\
+        shouldn't be changed directly. Note that this may include entities that aren't in handler.identifiables. \
+        (Use get_entities to exclude those)"""
         self.command_handlers = []
-        """Keeps a list of command_handlers. After __init__ is called, Handler should call these when location is \ 
-        getting its on_input called. (Like extra input handlers that's per location)"""
         self.__add_command_handlers()
 
     def __str__(self):
         return self.name
 
+    @property
+    def command_handlers(self) -> List[InputHandler]:
+        """
+        Keeps a list of command_handlers. After __init__ is called, Handler should call these when location is \
+        getting its on_input called. (Like extra input handlers that's per location)
+
+        This is a VersionedList so the Handler notices when it changes. Setting this to a normal list makes it a \
+        VersionedList
+        """
+        return self._command_handlers
+
+    @command_handlers.setter
+    def command_handlers(self, command_handlers: List[InputHandler]):
+        self._command_handlers = VersionedList(command_handlers)
+
     def __add_command_handlers(self) -> None:
         """
         Should only add to command_handlers using append or extend
@@ -72,7 +93,7 @@ class Location(Holder, PlayerInputHandler, FiveSensesHandler):
         :param reference: The string that is close to the location name
         :return: True if the reference string is close enough to reference this location
         """
-        return are_mostly_equal(self.name, reference)
+        return are_normalized_mostly_equal(Location.name.get_normalized(self), normalize_reference(reference))
 
     def on_take(self, handler: Handler, item: Item, new_holder: Holder) -> None:
         """
@@ -160,12 +181,23 @@ class Location(Holder, PlayerInputHandler, FiveSensesHandler):
     def update(self, handler: Handler):
         """
         By default, doesn't do anything unless overridden
-        This method should be called on the infinite loop by handler
+        This method should be called on the infinite loop by handler. If this isn't overridden, the handler won't \
+        call it at all
 
         :param handler: the handler object
         """
         pass
 
+    def get_next_update_time(self, handler: Handler) -> Optional[float]:
+        """
+        Just like Manager's get_next_update_time, this is only used when the Handler is running event driven.
+        If you override update to do something over time, you should also override this.
+
+        :param handler: the handler object
+        :return: The time (from handler.clock()) when update should be called again or None. By default, None
+        """
+        return None
+
     @abstractmethod
     def on_enter(self, player: Player, previous_location: Optional['Location'], handler: Handler):
         """
@@ -214,9 +246,10 @@ class Location(Holder, PlayerInputHandler, FiveSensesHandler):
         :param entity_type: The type of the entity you are looking for. Defaults to Entity (gets all types of entities)
         :return: The list of entities in this location
         """
+        entities = handler.get_entities()
         r = []
-        for entity in handler.get_entities():
-            if entity.location == self and isinstance(entity, entity_type):
+        for entity in self.occupants.view(entity_type):
+            if entity in entities:
                 r.append(entity)
 
         return r
@@ -232,13 +265,26 @@ class Location(Holder, PlayerInputHandler, FiveSensesHandler):
         """
         return player.location == self
 
-    def get_referenced_entity(self, handler: Handler, reference: str):
-
-        for entity in self.get_entities(handler):
-            if entity.is_reference(reference):
-                return entity
+    def find_referenced_entity(self, handler: Handler, reference: str) -> Optional[ReferenceMatch[Entity]]:
+        """
+        :param handler: The handler object
+        :param reference: The string used to reference an entity in this location
+        :return: The ReferenceMatch of the entity whose name is closest to reference or None if no entity's \
+                is_reference accepts reference. If two entities are equally close, the one that has been in this \
+                location longer is used. Use is_ambiguous to see if the player may have meant another entity
+        """
+        return get_location_entity_index(self).find(self.get_entities(handler), reference)
 
-        return None
+    def get_referenced_entity(self, handler: Handler, reference: str) -> Optional[Entity]:
+        """
+        :param handler: The handler object
+        :param reference: The string used to reference an entity in this location
+        :return: The entity whose name is closest to reference or None. See find_referenced_entity
+        """
+        match = self.find_referenced_entity(handler, reference)
+        if match is None:
+            return None
+        return match.value
 
     def is_lit_up(self):
         """
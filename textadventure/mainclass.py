@@ -1,7 +1,8 @@
 import time
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Type
 
+from textadventure.asynchandler import AsyncHandler
 from textadventure.customgame import CustomGame
 from textadventure.handler import Handler, HandlerSavable, PlayerHandler
 from textadventure.manager import Manager
@@ -15,7 +16,7 @@ class Main:
     a lot simpler and more abstract
     """
     def __init__(self, game: CustomGame, custom_managers: List[Manager], save_path: SavePath, rest=0.0, clean=False,
-                 player_handler: PlayerHandler = None):
+                 player_handler: PlayerHandler = None, handler_type: Type[Handler] = Handler):
         """
         Note: Custom managers do not yet call on_action when an action happens. This may be easily implemented in the
         future but, is not needed as of right now
@@ -25,9 +26,11 @@ class Main:
                                 be related to the game and should not alter game play at all. They should only be
                                 cosmetic or should help with things unrelated to the game
         :param rest: The amount of time to wait between each update. If this is not 0, calling update will pause the
-                     program
+                     program. This is not used by run
         :param clean: True if the program shouldn't attempt to load any data which will overwrite existing data when
                       saving
+        :param handler_type: The type of Handler that will be created when start is called. By default, Handler. \
+                If you want to use run_async, this should be AsyncHandler
         """
         self.game = game
 
@@ -38,6 +41,7 @@ class Main:
         self.rest = rest
         self.clean = clean
         self.player_handler = player_handler
+        self.handler_type = handler_type
 
     def create_players(self) -> List[Player]:
         """
@@ -94,7 +98,7 @@ class Main:
                 message = "Loaded data successfully."
             else:
                 message = "Tried to load data for handler and got: {}".format(data)
-        self.handler = Handler(list(players), locations, input_handlers, managers, self.save_path, savable,
+        self.handler = self.handler_type(list(players), locations, input_handlers, managers, self.save_path, savable,
                                player_handler=self.player_handler)
         self.handler.broadcast(message)
 
@@ -110,12 +114,47 @@ class Main:
             player.location.on_enter(player, None, self.handler)
 
     def update(self):
-        self.handler.update()
-        for manager in self.custom_managers:
-            manager.update(self.handler)
+        """
+        Updates the handler and the custom managers once and then sleeps for self.rest seconds. Use this if you want\
+        to update on a fixed interval. If you want to update only when something needs to be done, use run instead
+        """
+        self._update_once()
 
         time.sleep(self.rest)
 
+    def _update_once(self):
+        self.handler.update()
+        self.handler.update_managers(self.custom_managers)
+
+    def run(self, max_wait: Optional[float] = None):
+        """
+        Runs the game event driven until handler.should_end is True. Instead of updating on a fixed interval, this\
+        waits until there is input, a message that needs to be printed or until a Manager needs to be updated.
+
+        Unlike update, this ignores self.rest unless a player's InputGetter can only be polled (See \
+        Handler.is_polling_only). In that case, this sleeps for self.rest seconds between updates instead of waiting
+
+        :param max_wait: The maximum amount of time in seconds to wait between updates or None (default) to wait as\
+                long as needed
+        """
+        while not self.handler.should_end:
+            self._update_once()
+            if self.handler.is_polling_only():
+                time.sleep(self.rest)
+            else:
+                self.handler.wait(self.custom_managers, max_wait=max_wait)
+
+    async def run_async(self, max_wait: Optional[float] = None):
+        """
+        The same as run except this runs on the current asyncio event loop. In order to use this, handler_type must\
+        be AsyncHandler (or a subclass of it)
+
+        :param max_wait: The maximum amount of time in seconds to wait between updates or None (default) to wait as\
+                long as needed
+        """
+        assert isinstance(self.handler, AsyncHandler), "handler_type must be AsyncHandler in order to use run_async"
+        await self.handler.run_async(self.custom_managers, max_wait=max_wait)
+
     def end(self):
         """
         Method that should not be overridden. It will call on_end
@@ -131,8 +170,9 @@ class Main:
 
 class ClientSideMain(Main):
     def __init__(self, game: CustomGame, custom_managers: List[Manager], player: Player, save_path: SavePath, rest=0.0,
-                 clean=False, player_handler: PlayerHandler = None):
-        super().__init__(game, custom_managers, save_path, rest=rest, clean=clean, player_handler=player_handler)
+                 clean=False, player_handler: PlayerHandler = None, handler_type: Type[Handler] = Handler):
+        super().__init__(game, custom_managers, save_path, rest=rest, clean=clean, player_handler=player_handler,
+                         handler_type=handler_type)
         self.player = player
 
     def create_players(self):
@@ -8,6 +8,7 @@ Also, to avoid import errors, this class doesn't import Handler
 """
 import typing
 from abc import ABC, abstractmethod
+from typing import Optional, Tuple, Type
 
 from textadventure.action import Action
 
@@ -43,3 +44,51 @@ class Manager(ABC):
         :return: None because the action contains all the needed cancellation methods
         """
         pass
+
+    def get_action_types(self) -> Optional[Tuple[Type[Action], ...]]:
+        """
+        Used by the Handler so it only calls on_action with the actions this Manager cares about. If this returns a \
+        tuple, on_action will only be called with actions that are an instance of one of the types in the tuple.
+
+        By default, this returns None which means that on_action will be called with every action. If on_action \
+        doesn't do anything, return an empty tuple.
+
+        Note that this is only called once (not for every action) unless handler.invalidate_managers is called. \
+        Since this is a method, you can import the types locally to avoid import errors.
+
+        :return: A tuple of the types of actions on_action should be called with or None for every action
+        """
+        return None
+
+    def get_update_interval(self) -> Optional[float]:
+        """
+        Tells the Handler how often update should be called.
+
+        By default, this returns 0 which means update is called every time the Handler is updated.
+
+        Note that this is only called once unless handler.invalidate_managers is called.
+
+        :return: 0 if update should be called every time, a number of seconds if update should be called at most once\
+                 every that many seconds or None if update should only be called after handler.wake_manager is \
+                 called or after the time returned by get_next_update_time. (Return None if update doesn't do \
+                 anything)
+        """
+        return 0
+
+    def get_next_update_time(self, handler: 'Handler') -> Optional[float]:
+        """
+        Only used when the Handler is running event driven. When that is the case, update is called every time the \
+        handler wakes up (after input or after another Manager's time), not every frame.
+
+        By default, this returns None. Override this if the update method needs to be called even when nothing \
+        else is happening. (Ex: Text that is being typed out or a timer)
+
+        If get_update_interval returns None, the Handler only calls this after update is called so if the time \
+        changes because of something else, call handler.wake_manager.
+
+        :param handler: The handler object
+        :return: The time (from handler.clock()) when update should be called again or None if update does not need \
+                 to be called until something else wakes up the Handler. Returning a time in the past means as soon as \
+                 possible.
+        """
+        return None
@@ -0,0 +1,184 @@
+"""
+This file has what's needed to quickly find which of many names are similar to a string. Each name is turned into a \
+    vector of its hashed trigrams and a string is scored against every name at once using cosine similarity.
+
+If NumPy is installed, all of the vectors are stored in a matrix so scoring is one matrix multiplication. If it isn't, \
+    the same scores are calculated in pure Python. NumPy is completely optional.
+
+These scores are only an estimate of how similar two strings are so they should be used to pick a few names that \
+    are then compared more accurately. (See ReferenceIndex and CommandLexicon)
+"""
+import zlib
+from typing import List, Set, Optional, Sequence
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+DIMENSIONS = 2048
+"""The number of buckets each trigram is hashed into"""
+THRESHOLD = 64
+"""When there are more than this many names to compare, an NGramMatcher should be used to pick the best few"""
+SHORTLIST_SIZE = 16
+"""The default number of names returned by NGramMatcher.get_best"""
+
+
+def get_trigrams(normalized: str) -> Set[str]:
+    """
+    :param normalized: A normalized string (See normalize_reference)
+    :return: A set of each group of 3 characters next to each other. The string is padded with spaces so even \
+            strings with 1 or 2 characters have trigrams and so the start and end of words count more.
+    """
+    padded = "  " + normalized + " "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def get_buckets(normalized: str) -> Set[int]:
+    """
+    The trigrams are hashed with crc32 instead of hash because hash is randomized each time Python starts so the \
+    scores would change between runs.
+
+    :param normalized: A normalized string
+    :return: The indexes of the vector of normalized that are 1. (Every other index is 0)
+    """
+    return {zlib.crc32(trigram.encode()) % DIMENSIONS for trigram in get_trigrams(normalized)}
+
+
+class NGramMatcher:
+    """
+    Scores a string against a list of names using the cosine similarity of their hashed trigram vectors. This is the \
+    pure Python version. Use create_ngram_matcher to get the fastest version that's available.
+
+    Names can be added and removed without recreating this. The index of a removed name is reused by the next name \
+    that is added.
+    """
+
+    def __init__(self, names: Sequence[str]):
+        """
+        :param names: The normalized names. The index of each name is used by the other methods
+        """
+        self.names = list(names)  # type List[Optional[str]]
+        """The normalized name at each index or None if the name at that index was removed"""
+        self._buckets = [get_buckets(name) for name in self.names]
+        self._free = []  # type List[int]
+        """The indexes of the removed names"""
+
+    def __len__(self):
+        return len(self.names) - len(self._free)
+
+    def add(self, name: str) -> int:
+        """
+        :param name: The normalized name to add
+        :return: The index of name
+        """
+        buckets = get_buckets(name)
+        if self._free:
+            index = self._free.pop()
+            self.names[index] = name
+            self._buckets[index] = buckets
+        else:
+            index = len(self.names)
+            self.names.append(name)
+            self._buckets.append(buckets)
+        self._set_row(index, buckets)
+        return index
+
+    def remove(self, index: int):
+        """
+        :param index: The index of the name to remove. It will never be returned by get_best
+        """
+        self.names[index] = None
+        self._buckets[index] = set()
+        self._free.append(index)
+        self._set_row(index, None)
+
+    def _set_row(self, index: int, buckets: Optional[Set[int]]):
+        """
+        Called when the name at index is added or removed so subclasses can update how they store it
+
+        :param index: The index of the name
+        :param buckets: The buckets of the name or None if it was removed
+        """
+        pass
+
+    def get_scores(self, normalized: str) -> List[float]:
+        """
+        :param normalized: The normalized string to compare to each name
+        :return: A list with a score from 0 to 1 for each index where 1 means they have the same trigrams. Removed \
+                names have a score of 0
+        """
+        buckets = get_buckets(normalized)
+        size = len(buckets)
+        return [len(buckets & name_buckets) / (size * len(name_buckets)) ** .5 if name_buckets else 0.0
+                for name_buckets in self._buckets]
+
+    def get_best(self, normalized: str, count: int = SHORTLIST_SIZE) -> List[int]:
+        """
+        :param normalized: The normalized string to compare to each name
+        :param count: The maximum number of indexes to return. By default, SHORTLIST_SIZE
+        :return: A list of the indexes of the names with the highest scores, best first. Names that don't share any \
+                trigrams with normalized aren't included.
+        """
+        scores = self.get_scores(normalized)
+        r = sorted((i for i, score in enumerate(scores) if score > 0), key=lambda i: -scores[i])
+        return r[:count]
+
+
+class NumpyNGramMatcher(NGramMatcher):
+    """
+    Does the same thing as NGramMatcher except the vectors are stored in a NumPy matrix so every name is scored \
+    with one matrix multiplication
+    """
+
+    def __init__(self, names: Sequence[str]):
+        super().__init__(names)
+        matrix = numpy.zeros((max(len(self.names), 1), DIMENSIONS), dtype=numpy.float32)
+        for row, name_buckets in enumerate(self._buckets):
+            matrix[row, list(name_buckets)] = 1.0 / len(name_buckets) ** .5
+        self._matrix = matrix
+        """The vector of each name. It may have more rows than names so adding a name doesn't always copy it"""
+
+    def _set_row(self, index: int, buckets: Optional[Set[int]]):
+        if index >= len(self._matrix):  # double the capacity
+            matrix = numpy.zeros((len(self._matrix) * 2, DIMENSIONS), dtype=numpy.float32)
+            matrix[:len(self._matrix)] = self._matrix
+            self._matrix = matrix
+        row = self._matrix[index]
+        row[:] = 0.0
+        if buckets:
+            row[list(buckets)] = 1.0 / len(buckets) ** .5
+
+    def _get_score_array(self, normalized: str):
+        buckets = get_buckets(normalized)
+        vector = numpy.zeros(DIMENSIONS, dtype=numpy.float32)
+        vector[list(buckets)] = 1.0 / len(buckets) ** .5
+        return self._matrix[:len(self.names)] @ vector
+
+    def get_scores(self, normalized: str) -> List[float]:
+        return self._get_score_array(normalized).tolist()
+
+    def get_best(self, normalized: str, count: int = SHORTLIST_SIZE) -> List[int]:
+        scores = self._get_score_array(normalized)
+        if count < len(scores):
+            indexes = numpy.argpartition(-scores, count)[:count]
+        else:
+            indexes = numpy.arange(len(scores))
+        indexes = indexes[scores[indexes] > 0]
+        return indexes[numpy.argsort(-scores[indexes], kind="stable")].tolist()
+
+
+def create_ngram_matcher(names: Sequence[str], use_numpy: Optional[bool] = None) -> NGramMatcher:
+    """
+    :param names: The normalized names
+    :param use_numpy: True to use NumPy, False to use pure Python or None to use NumPy only if it is installed. \
+            By default, None
+    :return: A NumpyNGramMatcher or an NGramMatcher
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    if use_numpy:
+        if numpy is None:
+            raise ImportError("numpy is not installed")
+        return NumpyNGramMatcher(names)
+    return NGramMatcher(names)
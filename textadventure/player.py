@@ -1,4 +1,4 @@
-from typing import TypeVar, Type, Optional, TYPE_CHECKING
+from typing import TypeVar, Type, Optional, TYPE_CHECKING, Dict, Any
 
 from textadventure.entity import Entity, Health
 from textadventure.saving.savables import PlayerSavable
@@ -23,9 +23,10 @@ class Player(Entity, CommandSender):
     def __init__(self, input_getter: InputGetter, output: OutputSender, savable: Optional[PlayerSavable]):
         super().__init__(None, Health(30, 30), None, savable)  # TODO max_health, heath, location
         CommandSender.__init__(self, input_getter, output)
-        self.handled_objects = []
-        """A list of objects which will be saved if they inherit Savable. This list does not include self.savable as
-        self.savable should help handle saving THIS list."""
+        self.handled_objects = {}  # type Dict[Type, Any]
+        """A dict of each type to the object of that type. The objects will be saved if they inherit Savable. The \
+        dict keeps the order the types were added in. This does not include self.savable as self.savable should \
+        help handle saving THIS dict. Use player[Type] to get and set these."""
         self.is_new = savable is None  # NOTE even if savable is None, self.savable is not None because of HasSavable
         """
         This is True when the player first plays until they log off and save their game. After their first
@@ -41,22 +42,14 @@ class Player(Entity, CommandSender):
     def __getitem__(self, item: Type[T]) -> Optional[T]:
         if not isinstance(item, type):
             raise ValueError()
-        for handled_object in self.handled_objects:
-            if type(handled_object) == item:
-                return handled_object
-        return None
+        return self.handled_objects.get(item)
 
     def __setitem__(self, key: Type[T], value: T):
         if not isinstance(key, type):  # if we replace type with Type, python 3.5 will be mad
             raise ValueError()
 
-        for index, handled_object in enumerate(list(self.handled_objects)):
-            if type(handled_object) == key:
-                self.handled_objects[index] = value
-                return
-
-        # append the value to handled_objects if there isn't already a value for that type
-        self.handled_objects.append(value)
+        # if there's already a value for that type, it's replaced and keeps its place in the order
+        self.handled_objects[key] = value
 
     def get_used_name(self, sender: CommandSender):
         if sender == self:
@@ -73,7 +66,7 @@ class Player(Entity, CommandSender):
         pass
 
     def get_wallet(self):
-        for item in self.items:
-            if isinstance(item, Wallet):
-                return item
+        wallet = self.items.get_first(Wallet)
+        if wallet is not None:
+            return wallet
         return super().get_wallet()
@@ -0,0 +1,323 @@
+"""
+This file has what's needed to find which object a player is referencing. (Like "the wooden sword" or "ninja") \
+    Instead of returning the first object whose is_reference returns True, a ReferenceIndex scores every object \
+    that could be referenced and returns the best one.
+
+Each ReferenceIndex keeps a trigram index of the names it has seen so only the objects that share part of their name \
+    with the reference are scored. If there are still a lot of objects to score, (Like a location with hundreds of \
+    items) an NGramMatcher picks the few that are most similar. The score only decides which object is best. An object \
+    is only referenced if its own is_reference returns True.
+
+Use get_holder_index and get_location_entity_index to get the index of a Holder or Location. Those indexes are kept \
+    until the Holder or Location is garbage collected.
+"""
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import TypeVar, Generic, Optional, Dict, Set, Tuple, List, Iterable, Any, Callable, TYPE_CHECKING
+from weakref import WeakKeyDictionary, ref
+
+from textadventure.ngram import get_trigrams, create_ngram_matcher, NGramMatcher, THRESHOLD, SHORTLIST_SIZE
+from textadventure.utils import ReferenceName, normalize_reference, MOSTLY_EQUAL_CACHE_SIZE
+
+if TYPE_CHECKING:
+    from textadventure.item.holder import Holder
+    from textadventure.location import Location
+
+T = TypeVar("T")
+
+MINIMUM_SCORE = .8
+"""The minimum score a name needs to be referenced. The same as the default percent_equal of are_mostly_equal"""
+AMBIGUOUS_MARGIN = .05
+"""If the score of the second best match is within this of the best match, the match is ambiguous"""
+AMBIGUOUS_MESSAGE = "Did you mean {} or {}?"
+"""The message sent to a player when a ReferenceMatch is ambiguous. Formatted with the value and the runner_up"""
+
+
+def get_normalized_name(named: Any) -> Optional[str]:
+    """
+    :param named: An object with a name attribute. (Like an Item, Living or Location)
+    :return: The normalized name of named or None if its name is None
+    """
+    descriptor = getattr(type(named), "name", None)
+    if isinstance(descriptor, ReferenceName):
+        return descriptor.get_normalized(named)
+    name = named.name
+    return None if name is None else normalize_reference(name)
+
+
+@lru_cache(maxsize=MOSTLY_EQUAL_CACHE_SIZE)
+def get_score(normalized_reference: str, normalized_name: str, minimum_score: float = MINIMUM_SCORE,
+              reference_first: bool = False) -> float:
+    """
+    :param normalized_reference: The normalized string the player typed
+    :param normalized_name: The normalized name of the object that may be referenced
+    :param minimum_score: If the score is known to be lower than this, 0 is returned without calculating the exact \
+            score. By default, MINIMUM_SCORE
+    :param reference_first: SequenceMatcher.ratio() can change when its strings are swapped so this should match \
+            the order used by the is_reference of the object. True if the reference is the first string (Like \
+            Living.is_reference) False if the name is. (Like Item.is_reference) By default, False
+    :return: A number from 0 to 1 where 1 means they are equal. This is the same as SequenceMatcher.ratio()
+    """
+    if normalized_reference == normalized_name:
+        return 1.0
+    if reference_first:
+        matcher = SequenceMatcher(a=normalized_reference, b=normalized_name)
+    else:
+        matcher = SequenceMatcher(a=normalized_name, b=normalized_reference)
+    if matcher.real_quick_ratio() < minimum_score or matcher.quick_ratio() < minimum_score:
+        return 0.0
+    return matcher.ratio()
+
+
+class ReferenceMatch(Generic[T]):
+    """
+    The result of ReferenceIndex.find.
+    """
+    __slots__ = ("value", "score", "runner_up", "runner_up_score")
+
+    def __init__(self, value: T, score: float, runner_up: Optional[T] = None, runner_up_score: float = 0.0):
+        self.value = value
+        """The object that was referenced"""
+        self.score = score
+        """A number from 0 to 1 telling how close the reference was to the value's name. Usually at least \
+        MINIMUM_SCORE unless the value's is_reference accepts other references"""
+        self.runner_up = runner_up
+        """The object with the second best score or None if only one object could be referenced"""
+        self.runner_up_score = runner_up_score
+
+    def is_ambiguous(self, margin: float = AMBIGUOUS_MARGIN) -> bool:
+        """
+        :param margin: How close the runner_up_score has to be to score to be ambiguous. By default, AMBIGUOUS_MARGIN
+        :return: True if another object was almost as close to the reference so the player may have meant it \
+                instead. If the runner_up has the same name as the value, this is False because the player wouldn't \
+                be able to tell them apart anyway
+        """
+        return self.runner_up is not None and self.score - self.runner_up_score <= margin \
+            and get_normalized_name(self.runner_up) != get_normalized_name(self.value)
+
+    def __repr__(self):
+        return "ReferenceMatch(value={}, score={:.3f}, runner_up={}, runner_up_score={:.3f})".format(
+            self.value, self.score, self.runner_up, self.runner_up_score)
+
+
+class ReferenceIndex(Generic[T]):
+    """
+    An index of objects that have names which finds the object a player is referencing. The objects are given each \
+    time find is called so the index is updated when objects are added, removed or renamed. Updating is cheap \
+    because the trigrams of an object are only recalculated when its name changes.
+
+    Every object must have an is_reference method. An object is only found if its is_reference returns True.
+    """
+
+    def __init__(self, default_is_reference: Optional[Callable[[Any, str], bool]] = None,
+                 reference_first: bool = False, use_numpy: Optional[bool] = None):
+        """
+        :param default_is_reference: The is_reference function that only accepts references whose score (see \
+                get_score) is at least MINIMUM_SCORE. (Like Item.is_reference) Objects whose class overrides it may \
+                accept references that don't share a trigram with their name so they are always passed to their \
+                is_reference. If None, every object is always passed to its is_reference. By default, None
+        :param reference_first: Passed to get_score. Should be True if default_is_reference compares the reference \
+                first. (Like Living.is_reference) By default, False
+        :param use_numpy: Passed to create_ngram_matcher. By default, None which uses NumPy if it's installed
+        """
+        self.default_is_reference = default_is_reference
+        self.reference_first = reference_first
+        self.use_numpy = use_numpy
+        self._entries = {}  # type Dict[int, Tuple[ref, str, Set[str]]]
+        """A dict of the id of each object to a tuple of a weak reference to the object, its normalized name and its \
+        trigrams. Weak references are used so the index doesn't keep an entity (and its location) alive"""
+        self._trigrams = {}  # type Dict[str, Set[int]]
+        """A dict of each trigram to the ids of the objects that have it in their name"""
+        self._overriding = set()  # type Set[int]
+        """The ids of the objects whose class overrides default_is_reference. These are never pruned"""
+        self._matcher = None  # type Optional[NGramMatcher]
+        """None until it's needed. After that, its names are added and removed along with the objects"""
+        self._matcher_keys = []  # type List[Optional[int]]
+        """The id of the object at each index of _matcher or None if the index isn't used"""
+        self._matcher_indexes = {}  # type Dict[int, int]
+        """A dict of the id of each object to its index in _matcher"""
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __add(self, key: int, value: T, normalized: str):
+        trigrams = get_trigrams(normalized)
+        self._entries[key] = (ref(value), normalized, trigrams)
+        if self._matcher is not None:
+            self.__add_to_matcher(key, normalized)
+        default = self.default_is_reference
+        if default is None or getattr(type(value), "is_reference", None) is not default:
+            self._overriding.add(key)
+        for trigram in trigrams:
+            self._trigrams.setdefault(trigram, set()).add(key)
+
+    def __remove(self, key: int):
+        value, normalized, trigrams = self._entries.pop(key)
+        if self._matcher is not None:
+            index = self._matcher_indexes.pop(key)
+            self._matcher.remove(index)
+            self._matcher_keys[index] = None
+        self._overriding.discard(key)
+        for trigram in trigrams:
+            keys = self._trigrams[trigram]
+            keys.discard(key)
+            if not keys:
+                del self._trigrams[trigram]
+
+    def __add_to_matcher(self, key: int, normalized: str):
+        index = self._matcher.add(normalized)
+        if index == len(self._matcher_keys):
+            self._matcher_keys.append(key)
+        else:
+            self._matcher_keys[index] = key
+        self._matcher_indexes[key] = index
+
+    def update(self, values: Iterable[T]) -> List[int]:
+        """
+        Makes the index contain exactly the objects in values
+
+        :param values: The objects that can be referenced. Objects whose name is None are ignored
+        :return: A list of the ids of the objects in values in order
+        """
+        order = []
+        entries = self._entries
+        for value in values:
+            normalized = get_normalized_name(value)
+            if normalized is None:
+                continue
+            key = id(value)
+            entry = entries.get(key)
+            if entry is None or entry[0]() is not value or entry[1] != normalized:
+                if entry is not None:
+                    self.__remove(key)
+                self.__add(key, value, normalized)
+            order.append(key)
+        keep = set(order)
+        if len(keep) != len(entries):
+            for key in [key for key in entries if key not in keep]:
+                self.__remove(key)
+        return order
+
+    def __shortlist(self, normalized_reference: str) -> Set[int]:
+        """
+        :return: A set of the ids of the SHORTLIST_SIZE objects whose names are the most similar to the reference. \
+                (See NGramMatcher.get_best)
+        """
+        if self._matcher is None:
+            self._matcher = create_ngram_matcher((), self.use_numpy)
+            for key, entry in self._entries.items():
+                self.__add_to_matcher(key, entry[1])
+        keys = self._matcher_keys
+        return {keys[i] for i in self._matcher.get_best(normalized_reference, SHORTLIST_SIZE)}
+
+    def __score(self, order: List[int], candidates: Set[int], reference: str, normalized_reference: str) \
+            -> Tuple[Optional[Tuple[float, T]], Optional[Tuple[float, T]]]:
+        """
+        :return: A tuple of the best (score, object) and the second best (score, object) of the candidates that \
+                accept reference. Either can be None
+        """
+        best = None  # type Optional[Tuple[float, T]]
+        runner_up = None  # type Optional[Tuple[float, T]]
+        for key in order:
+            if key not in candidates:
+                continue
+            candidates.discard(key)  # if an object is in values twice, only score it once
+            entry = self._entries[key]
+            value = entry[0]()
+            if not value.is_reference(reference):
+                continue
+            score = get_score(normalized_reference, entry[1], 0.0, self.reference_first)
+            if best is None or score > best[0]:
+                runner_up = best
+                best = (score, value)
+            elif runner_up is None or score > runner_up[0]:
+                runner_up = (score, value)
+        return best, runner_up
+
+    def find(self, values: Iterable[T], reference: str) -> Optional[ReferenceMatch[T]]:
+        """
+        Finds the object in values whose name is closest to reference and whose is_reference returns True. When two \
+        objects have the same score, the one that comes first in values is returned.
+
+        If more than THRESHOLD objects share a trigram with reference, only the SHORTLIST_SIZE most similar ones \
+        (see NGramMatcher) are scored first so with that many objects, the best match may rarely be missed. If none \
+        of them accept reference, the rest are scored.
+
+        :param values: The objects that can be referenced. The index is updated to contain these
+        :param reference: The string the player typed
+        :return: The best match or None if no object accepts reference
+        """
+        order = self.update(values)
+        normalized_reference = normalize_reference(reference)
+        candidates = set(self._overriding)
+        for trigram in get_trigrams(normalized_reference):
+            keys = self._trigrams.get(trigram)
+            if keys is not None:
+                candidates.update(keys)
+        if not candidates:
+            return None
+        rest = None  # type Optional[Set[int]]
+        if len(candidates) > THRESHOLD:
+            rest = candidates
+            candidates = self.__shortlist(normalized_reference) | self._overriding
+            rest -= candidates
+
+        best, runner_up = self.__score(order, candidates, reference, normalized_reference)
+        if best is None and rest:
+            best, runner_up = self.__score(order, rest, reference, normalized_reference)
+        if best is None:
+            return None
+        if runner_up is None:
+            return ReferenceMatch(best[1], best[0])
+        return ReferenceMatch(best[1], best[0], runner_up[1], runner_up[0])
+
+
+def get_best_match(*matches: Optional[ReferenceMatch[T]]) -> Optional[ReferenceMatch[T]]:
+    """
+    Combines the results of multiple calls to find. (Like finding an item in a location and in a player's inventory)
+
+    :param matches: The ReferenceMatches or Nones to combine. If two have the same score, the first one is used
+    :return: The best match with the second best match as its runner_up or None if all of them are None
+    """
+    scored = []  # type List[Tuple[float, Any]]
+    for match in matches:
+        if match is not None:
+            scored.append((match.score, match.value))
+            if match.runner_up is not None:
+                scored.append((match.runner_up_score, match.runner_up))
+    if not scored:
+        return None
+    scored.sort(key=lambda pair: pair[0], reverse=True)  # sort is stable so the first one wins a tie
+    if len(scored) == 1:
+        return ReferenceMatch(scored[0][1], scored[0][0])
+    return ReferenceMatch(scored[0][1], scored[0][0], scored[1][1], scored[1][0])
+
+
+_holder_indexes = WeakKeyDictionary()  # type WeakKeyDictionary[Holder, ReferenceIndex]
+_location_entity_indexes = WeakKeyDictionary()  # type WeakKeyDictionary[Location, ReferenceIndex]
+
+
+def get_holder_index(holder: 'Holder') -> ReferenceIndex:
+    """
+    :param holder: The Holder
+    :return: The ReferenceIndex used for the items of holder. Pass holder.items to its find method
+    """
+    index = _holder_indexes.get(holder)
+    if index is None:
+        from textadventure.item.item import Item
+        index = ReferenceIndex(Item.is_reference)
+        _holder_indexes[holder] = index
+    return index
+
+
+def get_location_entity_index(location: 'Location') -> ReferenceIndex:
+    """
+    :param location: The Location
+    :return: The ReferenceIndex used for the entities in location
+    """
+    index = _location_entity_indexes.get(location)
+    if index is None:
+        from textadventure.entity import Living
+        index = ReferenceIndex(Living.is_reference, reference_first=True)
+        _location_entity_indexes[location] = index
+    return index
@@ -40,7 +40,7 @@ class IdentifiableInitialize(HandlerInitialize):
             if savable is not None:  # if there was saved data, load it
                 savable.on_load(created, handler)
 
-            handler.identifiables.append(created)
+            handler.add_identifiable(created)
             # don't call handler.set_savable because the superclass does that
             return created.savable, created  # may be different than savable
 
@@ -38,12 +38,24 @@ class Savable(ABC):
     if this is stored somewhere, there might be side effects from implementing this and that unless you do
     something with non_serialized, all data will be saved"
 
+    When something this saves changes, call mark_dirty so the Handler knows it needs to be saved again. If this saves
+    plain attributes of its source, override _get_snapshot instead so changing them doesn't need to call mark_dirty.
+
     Data in each instance/implementation should be player specific TODO edit comment
 
     If you are getting a KeyError, remember to override __new__ and set any fields that are in the non_serialized list.
     You can look in the Item in weapon.py class for an example
     """
 
+    is_dirty = True
+    """True if this has changed since it was last saved. This is never pickled so a Savable that was just loaded \
+    uses this class attribute and is dirty"""
+    _saved_snapshot = None
+    """What _get_snapshot returned when mark_saved was last called. This is never pickled"""
+    transient_attributes = frozenset()
+    """The names of attributes that are only caches so they are never pickled. (Like the normalized name stored by \
+    ReferenceName) Unlike non_serialized, this is set on the class"""
+
     def __init__(self):
         self.non_serialized = []
         """A list of strings. Appending to this list allows you to stop pickler from saving a field"""
@@ -53,9 +65,51 @@ class Savable(ABC):
         state = dict(self.__dict__)
         for item in self.non_serialized:
             del state[item]
+        state.pop("is_dirty", None)
+        state.pop("_saved_snapshot", None)
+        for name in self.transient_attributes:
+            state.pop(name, None)
 
         return state
 
+    def mark_dirty(self):
+        """
+        Makes it so this will be saved the next time the Handler saves. Should be called whenever something this \
+        saves is changed
+        """
+        self.is_dirty = True
+
+    def _get_snapshot(self, source: Any) -> Any:
+        """
+        Can be overridden to return a cheap value made from the data this saves that's changed without calling \
+        mark_dirty. (Like plain attributes of source) If it isn't equal to what it was when mark_saved was last \
+        called, needs_save returns True
+
+        :param source: What is saving/handling this object. The same as the source passed to before_save
+        :return: A value that can be compared with ==. By default, None
+        """
+        return None
+
+    def needs_save(self, source: Any) -> bool:
+        """
+        Tells the Handler whether or not before_save needs to be called and this needs to be written. If this saves \
+        data from other objects, (Like the items of source) this should be overridden to check if they changed too
+
+        :param source: What is saving/handling this object. The same as the source passed to before_save
+        :return: True if something this saves has changed since mark_saved was last called
+        """
+        return self.is_dirty or self._get_snapshot(source) != self._saved_snapshot
+
+    def mark_saved(self, source: Any):
+        """
+        Called after this was written successfully. If needs_save is overridden to check other objects, this should \
+        be overridden to call their mark_saved
+
+        :param source: What is saving/handling this object. The same as the source passed to before_save
+        """
+        self.is_dirty = False
+        self._saved_snapshot = self._get_snapshot(source)
+
     @abstractmethod
     def before_save(self, source: Any, handler: 'Handler'):
         """
@@ -117,6 +171,14 @@ class HasSavable(ABC):  # TODO do we actually need this class at all? Or can we
         isn't what you should be doing. This should be used upon the initialization of this object and no
         other objects."""
 
+    def mark_dirty(self):
+        """
+        Should be called when something that self.savable saves changes so it is saved the next time the Handler \
+        saves. Does nothing if self.savable is None
+        """
+        if self.savable is not None:
+            self.savable.mark_dirty()
+
     @abstractmethod
     def _create_savable(self) -> Optional[Savable]:
         """
@@ -1,4 +1,4 @@
-from typing import Any, TYPE_CHECKING
+from typing import Any, TYPE_CHECKING, List, Optional
 
 from textadventure.saving.savable import Savable, SaveLoadException
 
@@ -34,10 +34,22 @@ class EntitySavable(Savable):
 
         source.name = self.name
         source.uuid = self.uuid
+        handler.identifiables.update_key(source)  # since the uuid may have changed
 
         for item in self.items:
             item.on_load(source, handler)
 
+    def _get_snapshot(self, source: Any) -> Any:
+        return source.name, source.uuid
+
+    def needs_save(self, source: Any) -> bool:
+        return super().needs_save(source) or any(item.needs_save(source) for item in source.items)
+
+    def mark_saved(self, source: Any):
+        super().mark_saved(source)
+        for item in source.items:
+            item.mark_saved(source)
+
 
 class PlayerSavable(EntitySavable):
     """
@@ -50,12 +62,14 @@ class PlayerSavable(EntitySavable):
 
     def __init__(self):
         super().__init__()
-        self.handled_savables = None
+        self.handled_savables = None  # type Optional[List[Savable]]
+        """A list of the values of the player's handled_objects that are Savable in the same order. A list is used \
+        so the format of saved data doesn't depend on how Player stores handled_objects"""
 
     def before_save(self, source: Any, handler: 'Handler'):
         super().before_save(source, handler)
         self.handled_savables = []
-        for o in source.handled_objects:
+        for o in source.handled_objects.values():
             if isinstance(o, Savable):
                 self.handled_savables.append(o)
 
@@ -72,4 +86,15 @@ class PlayerSavable(EntitySavable):
             o.on_load(source, handler)
 
         source.handled_objects.clear()
-        source.handled_objects.extend(self.handled_savables)
+        for o in self.handled_savables:
+            source.handled_objects[type(o)] = o
+
+    def needs_save(self, source: Any) -> bool:
+        return super().needs_save(source) or any(o.needs_save(source) for o in source.handled_objects.values()
+                                                 if isinstance(o, Savable))
+
+    def mark_saved(self, source: Any):
+        super().mark_saved(source)
+        for o in source.handled_objects.values():
+            if isinstance(o, Savable):
+                o.mark_saved(source)
@@ -1,9 +1,13 @@
+import os
 import pickle
+import stat
 import sys
+import tempfile
+from enum import Enum, unique
 from pathlib import Path
 
 from pickle import UnpicklingError
-from typing import Union, Any, TYPE_CHECKING
+from typing import Union, Any, TYPE_CHECKING, List
 
 from textadventure.utils import CanDo
 
@@ -11,21 +15,99 @@ if TYPE_CHECKING:
     from textadventure.player import Player
 
 
-def save_data(data, path: Path) -> CanDo:
+@unique
+class Durability(Enum):
+    """
+    How hard save_data tries to make sure the data is not lost or left half written. Each level does everything the \
+    levels before it do. The higher the level, the slower saving is
+    """
+
+    DIRECT = 1
+    """The file is overwritten directly. If the game crashes or the disk is full while writing, the file is left \
+    half written"""
+    ATOMIC = 2
+    """The data is written to a temporary file that then replaces the file so the file always has either the old or \
+    the new data. If the computer loses power, the new data may not have been written to the disk yet"""
+    FSYNC = 3
+    """The temporary file is flushed to the disk before it replaces the file"""
+    FULL = 4
+    """The directory is also flushed to the disk after the file is replaced so the replacement itself survives losing \
+    power. Does the same thing as FSYNC if the operating system can't do this"""
+
+
+DEFAULT_DURABILITY = Durability.ATOMIC
+"""The Durability used when one isn't given. A crash or a full disk can't leave a file half written but the data \
+isn't flushed to the disk so FSYNC or FULL have to be asked for"""
+TEMP_SUFFIX = ".tmp"
+"""The suffix of the temporary files used by save_data. These files are only left over if the game crashed"""
+
+_UMASK = os.umask(0)
+os.umask(_UMASK)  # the umask can only be read by setting it so it's read once before any other threads start
+
+
+def _get_file_mode(path: Path) -> int:
+    """
+    :param path: The path of the file that will be replaced
+    :return: The permission bits of the file at path or, if there isn't one, the bits a new file would have. (Files \
+            created by tempfile.mkstemp can only be read by their owner)
+    """
+    try:
+        return stat.S_IMODE(os.stat(str(path)).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def _fsync_directory(directory: Path):
+    """
+    Flushes the entries of directory (like a renamed file) to the disk. Does nothing if that's not supported
+    """
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:  # Windows can't open directories
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def save_data(data, path: Path, durability: Durability = DEFAULT_DURABILITY) -> CanDo:
     """
     Saves the data to file opened from path and does nothing else. (Doesn't call methods, doesn't check if Savable)
 
+    Unless durability is DIRECT, the data is written to a temporary file in the same directory which then replaces \
+    the file at path so if writing fails, the file at path still has the data that was there before
+
     :param data: The data that you want to save to a file.
     :param path: The path to the file to open
+    :param durability: How much work should be done to make sure the data isn't lost. By default, DEFAULT_DURABILITY
     :return: A CanDo where [0] represents whether or not it was successful or not and [1] tells the person who
             saved the data if they were successful. [1] should normally be printed unlike most other CanDo[1]
     """
     try:
         if not path.parent.exists():
             path.parent.mkdir()
-        with path.open("wb") as file:
-            # print("Going to save: {}".format(to_save))
-            pickle.dump(data, file)
+        if durability is Durability.DIRECT:
+            with path.open("wb") as file:
+                # print("Going to save: {}".format(to_save))
+                pickle.dump(data, file)
+        else:
+            fd, temp_name = tempfile.mkstemp(suffix=TEMP_SUFFIX, prefix="." + path.name + ".", dir=str(path.parent))
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    pickle.dump(data, file)
+                    if durability is not Durability.ATOMIC:
+                        file.flush()
+                        os.fsync(file.fileno())
+                os.chmod(temp_name, _get_file_mode(path))
+                os.replace(temp_name, str(path))
+            except BaseException:
+                os.remove(temp_name)
+                raise
+            if durability is Durability.FULL:
+                _fsync_directory(path.parent)
     except IOError:
         info = sys.exc_info()
         return False, "error: '{}'".format(info)
@@ -61,6 +143,27 @@ def load_data(path: Path) -> Union[Any, str]:
     return content
 
 
+class SaveReport:
+    """
+    Tells what was written and what was skipped because it didn't change when the Handler saved
+    """
+    def __init__(self):
+        self.written = []  # type List[Path]
+        """The paths of the files that were written"""
+        self.unchanged = []  # type List[Path]
+        """The paths of the files that weren't written because nothing they save changed since they were last saved"""
+        self.failed = []  # type List[Path]
+        """The paths of the files that couldn't be saved"""
+
+    def __str__(self):
+        r = "Wrote {} file{}".format(len(self.written), "" if len(self.written) == 1 else "s")
+        if self.unchanged:
+            r += ", {} unchanged".format(len(self.unchanged))
+        if self.failed:
+            r += ", {} failed".format(len(self.failed))
+        return r + "."
+
+
 class SavePath:
     """
     A class that represents a path object and has helper methods but doesn't actually do any of the work in saving data.
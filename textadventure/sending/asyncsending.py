@@ -0,0 +1,107 @@
+"""
+This file has InputGetters and OutputSenders that work with asyncio. They should be used with the AsyncHandler.
+"""
+import asyncio
+from typing import Optional
+
+from textadventure.sending.commandsender import AsyncInputGetter, AsyncOutputSender, OutputSenderType
+from textadventure.sending.message import Message
+from textprint.colors import Color
+
+
+class QueueInputGetter(AsyncInputGetter):
+    """
+    An AsyncInputGetter where input is given to it by calling put. Useful when something else (like a web server) \
+    receives the input.
+    """
+
+    def __init__(self):
+        self.queue = asyncio.Queue()
+
+    def put(self, inp: Optional[str]):
+        """
+        Adds input that will be returned by take_input or wait_for_input. This doesn't block.
+
+        :param inp: The input to add or None if there will never be any more input
+        """
+        self.queue.put_nowait(inp)
+
+    def take_input(self) -> Optional[str]:
+        try:
+            return self.queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+    async def wait_for_input(self) -> Optional[str]:
+        return await self.queue.get()
+
+
+class StreamInputGetter(AsyncInputGetter):
+    """
+    An AsyncInputGetter that reads each line from a asyncio.StreamReader. (Ex: A socket that a player is connected to)
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, encoding="utf-8"):
+        self.reader = reader
+        self.encoding = encoding
+
+    def take_input(self) -> Optional[str]:
+        return None  # we don't know if reading will block so only wait_for_input can be used
+
+    async def wait_for_input(self) -> Optional[str]:
+        line = await self.reader.readline()
+        if not line:  # EOF
+            return None
+        return line.decode(self.encoding, errors="replace").rstrip("\r\n")
+
+
+class StreamOutputSender(AsyncOutputSender):
+    """
+    An AsyncOutputSender that writes each message to a asyncio.StreamWriter. Just like ImmediateStreamOutput, this \
+    doesn't type out messages, it sends all of the text right away.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, encoding="utf-8"):
+        self.writer = writer
+        self.encoding = encoding
+        self._has_written = False
+        """True when something has been written to writer and flush hasn't been called yet"""
+
+    def get_sender_type(self):
+        return OutputSenderType.REMOTE_SENDER
+
+    def send_message(self, message: Message):
+        for part in message.create_parts():
+            full = part.print_before + part.main_text + part.print_after
+            full = full.replace("\n", "\n" + Color.RESET)
+            full = full.replace(str(Color.CLEAR_SECTION), "\n" * 5 + "." * 10 + "\n" * 5)
+            self.send_raw_message(full)
+
+    def _is_closing(self) -> bool:
+        """
+        :return: True if the writer is closed or is closing. (StreamWriter.is_closing was only added in Python 3.7 so \
+                the transport is used instead)
+        """
+        return self.writer.transport.is_closing()
+
+    def send_raw_message(self, string_message: str):
+        if self._is_closing():
+            return False
+        self.writer.write(string_message.encode(self.encoding))
+        self._has_written = True
+        return True
+
+    def print_immediately(self):
+        return True  # every message is already sent immediately
+
+    def needs_flush(self):
+        return self._has_written
+
+    async def flush(self):
+        self._has_written = False
+        if self._is_closing():
+            return
+        try:
+            await self.writer.drain()
+        except ConnectionError:
+            pass  # the connection was closed. The StreamInputGetter will see that too
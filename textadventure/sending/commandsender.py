@@ -8,6 +8,7 @@ from textprint.colors import Color
 
 if TYPE_CHECKING:
     from textadventure.input.inputhandling import CommandInput
+    from textadventure.wakeup import WakeupNotifier
 
 
 class InputGetter(ABC):
@@ -19,6 +20,60 @@ class InputGetter(ABC):
         """
         pass
 
+    def get_next_input_time(self, notifier: 'WakeupNotifier') -> Optional[float]:
+        """
+        Called by the Handler right before it waits for something to do. (Only when it is running event driven)
+
+        If this InputGetter gets its input on another thread, it should keep a reference to notifier and call its \
+        notify method whenever there is new input so the Handler wakes up right away.
+
+        By default, this returns None
+
+        :param notifier: The WakeupNotifier that will wake up the Handler
+        :return: The time (from time.time()) when take_input should be called again or None if this InputGetter will \
+                 notify the Handler (or if get_input_file will have something to read) when there is input
+        """
+        return None
+
+    def is_polling_only(self) -> bool:
+        """
+        An InputGetter that can't tell the Handler when there is input (it doesn't notify the WakeupNotifier and it \
+        doesn't have an input file) should return True so the Handler is updated on a fixed interval instead of \
+        waiting for something that will never wake it up.
+
+        :return: True if take_input has to be called over and over again to get input. By default, False
+        """
+        return False
+
+    def get_input_file(self) -> Optional[Any]:
+        """
+        Used when the Handler is running event driven. If this returns something (like sys.stdin), the Handler will \
+        wake up whenever there is something to read from it.
+
+        :return: An object with a fileno method that can be passed to select or None. By default, None
+        """
+        return None
+
+
+class AsyncInputGetter(InputGetter):
+    """
+    An InputGetter that can be awaited instead of being polled. This should be used with the AsyncHandler so that \
+    thousands of InputGetters can wait for input on a single thread without each of them needing a Thread like \
+    KeyboardInputGetter does.
+
+    take_input should still be implemented so this can be used with a normal Handler.
+    """
+    @abstractmethod
+    async def wait_for_input(self) -> Optional[str]:
+        """
+        Waits until there is input and returns it. Once this returns a string, that string should not be returned by \
+        take_input.
+
+        :return: A string representing the input or None if there will never be any more input (Ex: the connection \
+                 was closed)
+        """
+        pass
+
 
 @unique
 class OutputSenderType(Enum):
@@ -95,6 +150,27 @@ class OutputSender(ABC):
         return OutputSenderType.UNKNOWN
 
 
+class AsyncOutputSender(OutputSender):
+    """
+    An OutputSender that can be awaited. Since send_message is called from code that isn't async (almost \
+    everywhere), send_message should not block and should only buffer the message. The AsyncHandler will await flush \
+    after it updates if needs_flush returns True.
+    """
+    def needs_flush(self) -> bool:
+        """
+        :return: True if there are buffered messages and flush should be awaited. By default, False
+        """
+        return False
+
+    async def flush(self):
+        """
+        Sends all the buffered messages and waits until they are sent (or until it is OK to send more).
+
+        By default, this does nothing
+        """
+        pass
+
+
 class CommandSender:
 
     def __init__(self, input_getter: InputGetter, output: OutputSender):
@@ -2,7 +2,7 @@ import warnings
 from enum import Enum
 from typing import List
 
-from textadventure.utils import join_list
+from textadventure.utils import join_list, SlotsPickleMixin
 from textprint.colors import Color
 
 
@@ -19,11 +19,12 @@ class MessageType(Enum):
     """TYPE_SLOW The message will be typed out slower than the TYPED MessageType"""
 
 
-class MessagePart:
+class MessagePart(SlotsPickleMixin):
     """
     A class to represent a small and simple part of a message where all of the text in this part has the same\
     properties.
     """
+    __slots__ = ("main_text", "print_before", "print_after", "wait_between", "wait_after_print")
     DEFAULT_WAIT_BETWEEN = .018
 
     def __init__(self, main_text: str, print_before="", print_after="", wait_between=DEFAULT_WAIT_BETWEEN,
@@ -48,7 +49,8 @@ class MessagePart:
         # self.main_text += "'{}'".format(wait_between)
 
 
-class Message:
+class Message(SlotsPickleMixin):
+    __slots__ = ("message_type", "text", "end", "wait_in_seconds", "named_variables")
     DEFAULT_ENDING = "\n"
 
     def __init__(self, text: str, message_type: MessageType = MessageType.TYPED, end=DEFAULT_ENDING,
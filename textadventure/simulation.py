@@ -0,0 +1,192 @@
+"""
+This file has what is needed to run a game without a terminal. Input is scripted, output is captured (or thrown away) \
+    and time is simulated so nothing ever sleeps. This makes it easy to test or benchmark a CustomGame.
+
+Example:
+    simulation = Simulation(NinjaGame(), [["yes", "Bob", "y", "Jim", "y", "look"]], seed=0)
+    simulation.start()
+    simulation.run()
+    print(simulation.outputs[0].get_text())
+"""
+import random
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Iterable
+from uuid import UUID
+
+from textadventure.customgame import CustomGame
+from textadventure.entity import Identifiable
+from textadventure.handler import PlayerHandler
+from textadventure.mainclass import Main
+from textadventure.player import Player
+from textadventure.saving.saving import SavePath
+from textadventure.sending.commandsender import InputGetter, OutputSender, OutputSenderType
+from textadventure.sending.message import Message
+
+
+class ScriptedInputGetter(InputGetter):
+    """
+    An InputGetter that returns each line of a script one at a time. (One line each time take_input is called)
+    """
+
+    def __init__(self, lines: Iterable[str]):
+        self.lines = list(lines)
+        self.index = 0
+        """The index of the next line that will be returned"""
+
+    def take_input(self) -> Optional[str]:
+        if self.index >= len(self.lines):
+            return None
+        line = self.lines[self.index]
+        self.index += 1
+        return line
+
+    def is_done(self) -> bool:
+        """
+        :return: True if every line has been returned by take_input
+        """
+        return self.index >= len(self.lines)
+
+
+class CapturingOutputSender(OutputSender):
+    """
+    An OutputSender that doesn't print anything. Depending on capture, it either keeps each Message so it can be \
+    looked at later or it throws them away and only counts them.
+    """
+
+    def __init__(self, capture: bool = True):
+        """
+        :param capture: True if each message should be kept in self.messages. If False, messages are only counted. \
+                By default, True
+        """
+        self.capture = capture
+        self.messages = []  # type List[Message]
+        self.message_count = 0
+
+    def send_message(self, message: Message):
+        self.message_count += 1
+        if self.capture:
+            self.messages.append(message)
+
+    def print_immediately(self):
+        return True  # nothing is ever typed out so everything is already "printed"
+
+    def get_sender_type(self):
+        return OutputSenderType.CLIENT_CUSTOM
+
+    def get_text(self) -> str:
+        """
+        :return: The text from all of the captured messages without any colors or other escape codes
+        """
+        return "".join(part.main_text for message in self.messages for part in message.create_parts())
+
+
+class VirtualClock:
+    """
+    A clock that only moves forward when advance is called. An instance of this can be used as handler.clock
+    """
+
+    def __init__(self, start: float = 0.0):
+        self.time = start
+
+    def __call__(self) -> float:
+        return self.time
+
+    def advance(self, seconds: float):
+        self.time += seconds
+
+    def advance_to(self, new_time: float):
+        """
+        Moves the clock to new_time if it is later than the current time
+        """
+        if new_time > self.time:
+            self.time = new_time
+
+
+class Simulation(Main):
+    """
+    Runs a CustomGame with players whose input is scripted. Each update happens right after the other and the \
+    clock is a VirtualClock that is moved forward after each update, so waits end instantly.
+    """
+
+    def __init__(self, game: CustomGame, scripts: List[List[str]], seed: Optional[int] = None,
+                 save_path: Optional[SavePath] = None, tick_seconds: float = 0.05, capture: bool = True):
+        """
+        :param game: The game to simulate. It should be a new instance
+        :param scripts: A list of scripts where each script is a list of lines of input for one player
+        :param seed: If not None, random.seed is called with this when start is called so that anything random \
+                (like a RandomMoveChooser) does the same thing every time. New uuids are also created from this \
+                seed until close is called
+        :param save_path: The path where the game will be saved and loaded from or None to use a new temporary \
+                directory that is deleted when close is called. By default, None
+        :param tick_seconds: The amount of time the clock moves forward after each update. By default, 0.05
+        :param capture: True if the output of each player should be kept. Use False when benchmarking
+        """
+        self.temporary_directory = None
+        if save_path is None:
+            self.temporary_directory = tempfile.mkdtemp(prefix="textadventure-simulation-")
+            save_path = SavePath(Path(self.temporary_directory))
+        super().__init__(game, [], save_path, rest=0.0, player_handler=PlayerHandler(save_path))
+        self.seed = seed
+        self.tick_seconds = tick_seconds
+        self.clock = VirtualClock()
+        self.input_getters = [ScriptedInputGetter(script) for script in scripts]
+        self.outputs = [CapturingOutputSender(capture) for _ in scripts]
+        self.tick_count = 0
+        """The number of times update has been called"""
+        self._previous_uuid_factory = None
+
+    def create_players(self) -> List[Player]:
+        return [Player(input_getter, output, None) for input_getter, output in zip(self.input_getters, self.outputs)]
+
+    def start(self):
+        if self.seed is not None:
+            random.seed(self.seed)
+            uuid_random = random.Random(self.seed)
+            self._previous_uuid_factory = Identifiable.uuid_factory
+            Identifiable.uuid_factory = lambda: UUID(int=uuid_random.getrandbits(128), version=4)
+        super().start()
+        self.handler.clock = self.clock
+
+    def update(self):
+        """
+        Updates the game once and moves the clock forward. This never sleeps.
+        """
+        self._update_once()
+        self.tick_count += 1
+        self.clock.advance(self.tick_seconds)
+
+    def is_done(self) -> bool:
+        """
+        :return: True if every line of every script has been used and nothing in the game is waiting to be updated
+        """
+        if not all(input_getter.is_done() for input_getter in self.input_getters):
+            return False
+        next_time = self.handler.get_next_update_time(self.custom_managers)
+        return next_time is None or next_time > self.clock()
+
+    def run(self, max_ticks: int = 10000) -> int:
+        """
+        Updates the game until is_done returns True, until the game ends or until max_ticks updates have happened.
+
+        :param max_ticks: The maximum number of times to update. By default, 10000
+        :return: The number of times update was called
+        """
+        start_count = self.tick_count
+        while self.tick_count - start_count < max_ticks and not self.handler.should_end:
+            self.update()
+            if self.is_done():
+                break
+        return self.tick_count - start_count
+
+    def close(self):
+        """
+        Deletes the temporary save directory if one was created and stops creating uuids from the seed
+        """
+        if self._previous_uuid_factory is not None:
+            Identifiable.uuid_factory = self._previous_uuid_factory
+            self._previous_uuid_factory = None
+        if self.temporary_directory is not None:
+            shutil.rmtree(self.temporary_directory, ignore_errors=True)
+            self.temporary_directory = None
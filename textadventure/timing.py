@@ -0,0 +1,151 @@
+"""
+This file has what is needed to time how long each part of Handler's update method takes.
+
+Just like manager.py, this doesn't import Handler to avoid import errors
+"""
+import math
+from collections import deque
+from time import perf_counter
+from typing import Dict, List, Tuple, Deque
+
+
+class RollingTimings:
+    """
+    Keeps the most recent samples of how long something took so percentiles can be calculated
+    """
+
+    def __init__(self, max_samples: int):
+        """
+        :param max_samples: The maximum amount of samples to keep. Once there are more, the oldest ones are removed
+        """
+        self.samples = deque(maxlen=max_samples)  # type Deque[float]
+        self.total_count = 0
+        """The number of samples that have ever been added (including the ones that are no longer in samples)"""
+
+    def add(self, seconds: float):
+        self.samples.append(seconds)
+        self.total_count += 1
+
+    def get_percentile(self, percent: float) -> float:
+        """
+        :param percent: A number from 0 to 100
+        :return: The sample at that percentile (using nearest rank) or 0 if there are no samples
+        """
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = max(0, math.ceil(percent / 100 * len(ordered)) - 1)
+        return ordered[index]
+
+    def get_percentiles(self, percents: Tuple[float, ...]) -> Tuple[float, ...]:
+        """
+        The same as get_percentile except this only sorts the samples once
+
+        :param percents: A tuple of numbers from 0 to 100
+        :return: A tuple of the sample at each percentile
+        """
+        if not self.samples:
+            return tuple(0.0 for _ in percents)
+        ordered = sorted(self.samples)
+        length = len(ordered)
+        return tuple(ordered[max(0, math.ceil(percent / 100 * length) - 1)] for percent in percents)
+
+
+class PhaseStats:
+    """
+    A summary of the timings of a phase of the Handler's update method. All times are in seconds
+    """
+
+    def __init__(self, name: str, count: int, p50: float, p95: float, p99: float, maximum: float):
+        self.name = name
+        self.count = count
+        """The number of updates this phase was recorded in"""
+        self.p50 = p50
+        self.p95 = p95
+        self.p99 = p99
+        self.maximum = maximum
+
+    def __str__(self):
+        return "{}: p50={:.3f}ms p95={:.3f}ms p99={:.3f}ms max={:.3f}ms (n={})".format(
+            self.name, self.p50 * 1000, self.p95 * 1000, self.p99 * 1000, self.maximum * 1000, self.count)
+
+
+class TickProfiler:
+    """
+    Records how long each phase of each update takes. Phases are named using strings like "players", "input", \
+    "input_handler:GoCommandHandler", "location:Entrance" or "manager:BattleManager". If the same phase happens \
+    multiple times in one update, (Ex: Many locations of the same type) the times are added together.
+
+    The Handler only uses this when handler.profiler is not None. Use handler.enable_profiling to create one.
+    """
+    TICK = "tick"
+    """The name of the phase that represents the entire update"""
+
+    def __init__(self, max_samples: int = 500):
+        """
+        :param max_samples: The number of updates to calculate the percentiles from. By default, 500
+        """
+        self.max_samples = max_samples
+        self.timings = {}  # type Dict[str, RollingTimings]
+        self._current = {}  # type Dict[str, float]
+        """The times added during the current update"""
+        self._tick_start = None
+
+    @staticmethod
+    def now() -> float:
+        return perf_counter()
+
+    def start_tick(self):
+        """
+        Should be called at the start of each update. Note that times added after the last end_tick and before this\
+        are still counted. (Ex: The custom managers in Main are updated after the Handler)
+        """
+        self._tick_start = perf_counter()
+
+    def add(self, name: str, seconds: float):
+        """
+        Adds the time that a phase took in the current update
+
+        :param name: The name of the phase
+        :param seconds: The amount of time it took
+        """
+        self._current[name] = self._current.get(name, 0.0) + seconds
+
+    def end_tick(self):
+        """
+        Should be called at the end of each update. This adds the times from the current update to the samples
+        """
+        if self._tick_start is not None:
+            self.add(self.__class__.TICK, perf_counter() - self._tick_start)
+            self._tick_start = None
+        for name, seconds in self._current.items():
+            timings = self.timings.get(name)
+            if timings is None:
+                timings = RollingTimings(self.max_samples)
+                self.timings[name] = timings
+            timings.add(seconds)
+        self._current.clear()
+
+    def reset(self):
+        self.timings.clear()
+        self._current.clear()
+
+    def get_stats(self) -> List[PhaseStats]:
+        """
+        :return: A list of the PhaseStats for each phase that has been recorded in no particular order
+        """
+        r = []
+        for name, timings in self.timings.items():
+            p50, p95, p99, maximum = timings.get_percentiles((50, 95, 99, 100))
+            r.append(PhaseStats(name, timings.total_count, p50, p95, p99, maximum))
+        return r
+
+    def get_top(self, amount: int = 5, include_tick: bool = False) -> List[PhaseStats]:
+        """
+        :param amount: The maximum number of PhaseStats to return
+        :param include_tick: True if the phase representing the entire update should be included. By default, False
+        :return: A list of the PhaseStats with the highest p95 first
+        """
+        stats = [stat for stat in self.get_stats() if include_tick or stat.name != self.__class__.TICK]
+        stats.sort(key=lambda stat: stat.p95, reverse=True)
+        return stats[:amount]
@@ -1,6 +1,9 @@
 import sys
+from itertools import count
 from difflib import SequenceMatcher
-from typing import Union, List, Tuple, TypeVar, Type, Optional, Iterator, Container, Iterable, Generic
+from functools import lru_cache
+from typing import Union, List, Tuple, TypeVar, Type, Optional, Iterator, Container, Iterable, Generic, Callable, \
+    Any
 
 # if TYPE_CHECKING:
 #     from textadventure.message import Message
@@ -157,35 +160,150 @@ def get_unimportant(to_change: List[str], unimportant_list=NOT_IMPORTANT) -> Lis
     return r
 
 
+MOSTLY_EQUAL_CACHE_SIZE = 4096
+"""The maximum number of normalized strings and compared pairs that are_mostly_equal remembers"""
+
+
+@lru_cache(maxsize=MOSTLY_EQUAL_CACHE_SIZE)
+def normalize_reference(text: str) -> str:
+    """
+    Changes text into the form are_mostly_equal compares. Words in NOT_IMPORTANT are removed and the rest is \
+    lowercase. Ex: "My the Bike" -> "bike"
+
+    :param text: The string to normalize
+    :return: The normalized string
+    """
+    split = text.split(" ")
+    unimportant = get_unimportant(split)
+    return " ".join(s for index, s in enumerate(split) if index not in unimportant).lower()
+
+
+@lru_cache(maxsize=MOSTLY_EQUAL_CACHE_SIZE)
+def are_normalized_mostly_equal(a: str, b: str, percent_equal=.8) -> bool:
+    """
+    Does the same thing as are_mostly_equal except a and b must already be normalized using normalize_reference. \
+    The cheap upper bounds of the ratio are checked first so most strings that aren't close are rejected without \
+    calculating the ratio.
+
+    :param a: First normalized string
+    :param b: Second normalized string
+    :param percent_equal: A number from 0 to 1 representing the minimum value of SequenceMatcher#ratio() to return True\
+            By default: .8
+    :return: True if the strings are mostly equal
+    """
+    if a == b:
+        return True  # the ratio is always 1.0
+    matcher = SequenceMatcher(a=a, b=b)
+    return matcher.real_quick_ratio() >= percent_equal and matcher.quick_ratio() >= percent_equal \
+        and matcher.ratio() >= percent_equal
+
+
 def are_mostly_equal(a: str, b: str, percent_equal=.8) -> bool:
     """
     Checks to see if the provided strings are mostly equal.
     Converts both to lowercase and removes words from the unimportant list so a: "my the bike" b: "bike" will be True
 
+    If one of the strings is compared often, (like the name of an Item) it can be normalized once using \
+    normalize_reference and are_normalized_mostly_equal can be used instead
+
     :param a: First string
     :param b: Second string
     :param percent_equal: A number from 0 to 1 representing the minimum value of SequenceMatcher#ratio() to return True\
             By default: .8
     :return: True if the strings are mostly equal
     """
-    def remove_for(change: str):
-        split = change.split(" ")
+    return are_normalized_mostly_equal(normalize_reference(a), normalize_reference(b), percent_equal)
+
+
+class ReferenceName:
+    """
+    A descriptor used for the name of something that can be referenced by a player. (Like an Item or Entity) The \
+    name is stored in the instance's __dict__ like a normal attribute so objects saved before this was used load \
+    fine. When the name is set, its normalized form (see normalize_reference) is also stored so it doesn't have to \
+    be recalculated each time the object is referenced. The normalized form is only a cache so its attribute name is \
+    added to the owner's transient_attributes which Savable leaves out when pickling.
+
+    Usage:
+        class Item:
+            name = ReferenceName()
+
+            def is_reference(self, reference: str):
+                return are_normalized_mostly_equal(Item.name.get_normalized(self), normalize_reference(reference))
+    """
+
+    def __init__(self):
+        self.attribute_name = None  # type str
+        self.normalized_name = None  # type str
+
+    def __set_name__(self, owner, name):
+        self.attribute_name = name
+        self.normalized_name = "_normalized_" + name
+        owner.transient_attributes = frozenset(getattr(owner, "transient_attributes", ())) | {self.normalized_name}
 
-        unimportant = get_unimportant(split)
-        important = []
-        for index, s in enumerate(split):
-            if index not in unimportant:
-                important.append(s)
-        return " ".join(important)
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            return instance.__dict__[self.attribute_name]
+        except KeyError:
+            raise AttributeError(self.attribute_name) from None
 
-    a = remove_for(a).lower()
-    b = remove_for(b).lower()
+    def __set__(self, instance, value: Optional[str]):
+        instance.__dict__[self.attribute_name] = value
+        instance.__dict__[self.normalized_name] = None if value is None else normalize_reference(value)
 
-    ratio = SequenceMatcher(a=a, b=b).ratio()
-    return ratio >= percent_equal
+    def __delete__(self, instance):
+        del instance.__dict__[self.attribute_name]
+        instance.__dict__.pop(self.normalized_name, None)
+
+    def get_normalized(self, instance) -> Optional[str]:
+        """
+        :param instance: The object that has this name
+        :return: The normalized name or None if the name is None
+        """
+        try:
+            return instance.__dict__[self.normalized_name]
+        except KeyError:  # saved before the normalized name was stored
+            self.__set__(instance, self.__get__(instance, type(instance)))
+            return instance.__dict__[self.normalized_name]
+
+
+class SlotsPickleMixin:
+    """
+    A class that has __slots__ should inherit this so it can still be unpickled if it was pickled before it had \
+    __slots__. (When it still had a __dict__) Objects pickled after it has __slots__ are also unpickled by this.
+
+    Each subclass should define __slots__ for it to actually save memory.
+    """
+    __slots__ = ()
+
+    def __getstate__(self):
+        """
+        :return: A dict of each attribute to its value. This is the same format as the __dict__ this used to be \
+                pickled as so it works with every pickle protocol
+        """
+        state = dict(getattr(self, "__dict__", {}))  # a subclass might not have __slots__
+        for cls in type(self).__mro__:
+            for key in cls.__dict__.get("__slots__", ()):
+                if key not in ("__dict__", "__weakref__") and hasattr(self, key):
+                    state[key] = getattr(self, key)
+        return state
+
+    def __setstate__(self, state):
+        if isinstance(state, tuple):  # (__dict__ or None, slots dict or None)
+            dict_state, slots_state = state
+            state = dict(dict_state or {})
+            state.update(slots_state or {})
+        for key, value in state.items():
+            object.__setattr__(self, key, value)
 
 
 class Point:
+    """
+    An immutable point. Since it can't be changed, it can be used as a key in a dict or put in a set.
+    """
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: int, y: int, z: int = 0):
         """
         Used on locations by having an x, y and z position (z is normally 0)
@@ -194,9 +312,28 @@ class Point:
         :param y: The y position on the map
         :param z: Used for the height/priority (usually 0)
         """
-        self.x = x
-        self.y = y
-        self.z = z
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+        object.__setattr__(self, "z", z)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("A Point cannot be changed. Create a new one instead.")
+
+    def __delattr__(self, item):
+        raise AttributeError("A Point cannot be changed.")
+
+    def __reduce__(self):
+        return self.__class__, (self.x, self.y, self.z)
+
+    def __setstate__(self, state):
+        """
+        Only used when loading a Point that was saved before Point had __slots__ and __reduce__. (state is the \
+        old __dict__)
+        """
+        if isinstance(state, tuple):  # (__dict__, slots dict)
+            state = state[1] or state[0]
+        for key in self.__class__.__slots__:
+            object.__setattr__(self, key, state[key])
 
     def __mul__(self, other: Union['Point', int]):
         if type(other) is int:
@@ -214,7 +351,10 @@ class Point:
     def __eq__(self, other):
         if isinstance(other, Point):
             return self.x == other.x and self.y == other.y and self.z == other.z
-        return super(Point, self).__eq__(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.x, self.y, self.z))
 
     def __str__(self):
         return "Point(x:{},y:{},z:{})".format(self.x, self.y, self.z)
@@ -236,61 +376,230 @@ be doing that"""
 T = TypeVar('T')
 
 
-class TypeCollection(Generic[T], Iterable[T], Container[T]):
-    def __init__(self, the_list: List, types_list: List[Type], use_isinstance=True):
+class _TypeBucket:
+    """
+    Used by TypeRegistry to store the elements that are an instance of element_type
+    """
+    def __init__(self, element_type: Type):
+        self.element_type = element_type
+        self.elements = {}  # type Dict[Any, None]  # a dict is used as an ordered set
+        self.snapshot = None  # type Optional[Tuple]
+        """A tuple of the elements used when iterating or None if elements has changed since the last iteration"""
+
+    def add(self, element):
+        self.elements[element] = None
+        self.snapshot = None
+
+    def discard(self, element):
+        if element in self.elements:
+            del self.elements[element]
+            self.snapshot = None
+
+    def get_snapshot(self) -> Tuple:
+        if self.snapshot is None:
+            self.snapshot = tuple(self.elements)
+        return self.snapshot
+
+
+class TypeView(Generic[T], Iterable[T], Container[T]):
+    """
+    A read only view of the elements in a TypeRegistry that are an instance of a certain type. This does not copy\
+    the elements so it's cheap to create and it always reflects what is currently in the TypeRegistry.
+
+    It's safe to change the TypeRegistry while iterating over this. The iteration will continue over the elements that\
+    were there when it started.
+    """
+    def __init__(self, bucket: _TypeBucket):
+        self._bucket = bucket
+
+    def __len__(self):
+        return len(self._bucket.elements)
+
+    def __contains__(self, x):
+        return x in self._bucket.elements
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._bucket.get_snapshot())
+
+
+class TypeRegistry(Generic[T], Iterable[T], Container[T]):
+    """
+    Stores elements in the order they were added along with keeping them in a bucket for each type that has been\
+    requested using view. Because of this, getting all the elements of a certain type is O(elements of that type)\
+    instead of O(all elements).
+
+    This has an append and remove method so it can be used in most of the places a list was used. Note that each\
+    element must be hashable and an element can only be in this once.
+
+    If key is given, elements can also be retrieved in O(1) by using get. (Ex: Getting an Identifiable by its uuid)
+    """
+    def __init__(self, elements: Iterable[T] = (), key: Optional[Callable[[T], Any]] = None):
         """
-        :param the_list: The list of elements that you want to use. Note that changing this list won't affect the one
-                in self.the_list because it was initialized using self.the_list = list(the_list)
-        :param types_list: The list of types where each time is an acceptable type this is in this Collection
-        :param use_isinstance: By default True. If set to False, this will compare types_list using type() instead of
-                isinstance()
+        :param elements: The starting elements
+        :param key: A function that returns the key used to get an element with get or None if get won't be used. \
+                If the key of an element changes after it's added, update_key must be called. By default, None
         """
-        self.the_list = list(the_list)
-        self.types_list = types_list
-        self.use_isinstance = use_isinstance
-        #
-        # self._known_length = None  # simple cache for the __len__ function
-
-    def _can_have(self, element):
-        for t in self.types_list:
-            can = isinstance(element, t) if self.use_isinstance else type(element) == t
-            if can:
-                return True
+        self._key = key
+        self._by_key = {}  # type Dict[Any, T]
+        """Only used when self._key is not None. A dict of each key to the element with that key"""
+        self._keys = {}  # type Dict[T, Any]
+        """Only used when self._key is not None. A dict of each element to the key it is stored under in _by_key"""
+        self._all = _TypeBucket(object)
+        self._buckets = {}  # type Dict[Type, _TypeBucket]
+        """A dict of each type passed to view and the bucket for that type"""
+        self._buckets_for = {}  # type Dict[Type, List[_TypeBucket]]
+        """A cache of the exact type of an element to the list of buckets that it should be in"""
+        self._views = {}  # type Dict[Type, TypeView]
+        for element in elements:
+            self.append(element)
+
+    def __get_buckets_for(self, element) -> List[_TypeBucket]:
+        element_type = type(element)
+        r = self._buckets_for.get(element_type)
+        if r is None:
+            r = [bucket for bucket in self._buckets.values() if isinstance(element, bucket.element_type)]
+            self._buckets_for[element_type] = r
+        return r
+
+    def append(self, element: T):
+        """
+        Adds the element if it isn't already added
 
-        return False
+        :param element: The element to add
+        """
+        if element in self._all.elements:
+            return
+        self._all.add(element)
+        for bucket in self.__get_buckets_for(element):
+            bucket.add(element)
+        if self._key is not None:
+            self.__set_key(element, self._key(element))
+
+    def remove(self, element: T):
+        """
+        Removes the element
+
+        :param element: The element to remove
+        :raises ValueError: If the element isn't in this TypeRegistry
+        """
+        if element not in self._all.elements:
+            raise ValueError("{} is not in this TypeRegistry".format(element))
+        self._all.discard(element)
+        for bucket in self.__get_buckets_for(element):
+            bucket.discard(element)
+        if self._key is not None:
+            self.__remove_key(element)
+
+    def __set_key(self, element: T, key):
+        self._keys[element] = key
+        self._by_key[key] = element
+
+    def __remove_key(self, element: T):
+        key = self._keys.pop(element)
+        if self._by_key.get(key) is element:  # another element might have been added with the same key
+            del self._by_key[key]
+
+    def get(self, key, default: Optional[T] = None) -> Optional[T]:
+        """
+        Can only be used if key was passed to the constructor
 
-    # def __len__(self):
-    #     if self._known_length is not None:
-    #         return self._known_length
-    #     r = 0
-    #     for e in self.the_list:
-    #         if self.can_have(e):
-    #             r += 1
-    #     self._known_length = r
-    #     return self._known_length
+        :param key: The key of the element to get
+        :param default: The value to return if there is no element with that key. By default, None
+        :return: The element with the given key or default
+        """
+        assert self._key is not None, "A key function must be passed to the constructor in order to use get"
+        return self._by_key.get(key, default)
+
+    def update_key(self, element: T):
+        """
+        Should be called if the key of an element has changed after it was added. If the element isn't in this\
+        TypeRegistry or key wasn't passed to the constructor, this does nothing.
+
+        :param element: The element whose key may have changed
+        """
+        if self._key is None or element not in self._keys:
+            return
+        self.__remove_key(element)
+        self.__set_key(element, self._key(element))
+
+    def view(self, element_type: Type[T]) -> TypeView[T]:
+        """
+        :param element_type: The type of the elements that the returned view should contain.
+        :return: A TypeView of the elements that are an instance of element_type
+        """
+        r = self._views.get(element_type)
+        if r is None:
+            bucket = _TypeBucket(element_type)
+            for element in self._all.elements:
+                if isinstance(element, element_type):
+                    bucket.add(element)
+            self._buckets[element_type] = bucket
+            self._buckets_for.clear()  # each list in here may need the new bucket
+            r = TypeView(bucket)
+            self._views[element_type] = r
+        return r
+
+    def __len__(self):
+        return len(self._all.elements)
 
     def __contains__(self, x):
-        return self._can_have(x) and x in self.the_list
+        return x in self._all.elements
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._all.get_snapshot())
+
+
+_versions = count()
+"""Where every VersionedList gets its versions from so no two lists ever have the same version"""
 
-    def __iter__(self):
-        return TypeSequenceIterable(self)
 
+def _changes_list(method_name: str):
+    """
+    :return: A method for VersionedList that calls list's method_name and then gives the list a new version
+    """
+    method = getattr(list, method_name)
+
+    def changed(self, *args, **kwargs):
+        r = method(self, *args, **kwargs)
+        self.version = next(_versions)
+        return r
+    changed.__name__ = method_name
+    return changed
 
-class TypeSequenceIterable(Iterator):
-    def __init__(self, type_sequence: TypeCollection):
-        self.type_sequence = type_sequence
-        self.iterator = self.type_sequence.the_list.__iter__()
 
-    def __next__(self):
-        n = self.iterator.__next__()
-        while not self.type_sequence._can_have(n):
-            n = self.iterator.__next__()
-        return n
+class VersionedList(list):
+    """
+    A list that gets a new version every time it's changed. Caches that are built from VersionedLists can store the \
+    versions of the lists they were built from and rebuild once one changes instead of guessing if a list changed \
+    from its length.
+    """
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = next(_versions)
+        """Changed every time this is changed. Versions are never reused, even by other VersionedLists, so a list \
+        that replaced another one never has the same version. Only compare this with =="""
+
+    append = _changes_list("append")
+    extend = _changes_list("extend")
+    insert = _changes_list("insert")
+    remove = _changes_list("remove")
+    pop = _changes_list("pop")
+    clear = _changes_list("clear")
+    sort = _changes_list("sort")
+    reverse = _changes_list("reverse")
+    __setitem__ = _changes_list("__setitem__")
+    __delitem__ = _changes_list("__delitem__")
+    __iadd__ = _changes_list("__iadd__")
+    __imul__ = _changes_list("__imul__")
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
 
 
 def main():
     my_list = [1., 3, 8, "hello", "cool", 9.0, "c", False, 8]
-    seq = TypeCollection(my_list, [str, float, bool])
+    registry = TypeRegistry(my_list)
+    seq = registry.view(str)
     for item in my_list:
         print("item: {} is {} in seq".format(item, item in seq))
 
@@ -0,0 +1,84 @@
+"""
+This file has what is needed to let the Handler sleep until it has something to do instead of updating it over and \
+    over again on a fixed interval.
+
+Just like manager.py, this doesn't import Handler to avoid import errors
+"""
+import select
+import socket
+from typing import Optional, List, Any
+
+
+def get_earliest(first: Optional[float], second: Optional[float]) -> Optional[float]:
+    """
+    A simple helper function for combining wakeup times where None means "there is no need to wake up"
+
+    :param first: A time (from time.time()) or None
+    :param second: A time (from time.time()) or None
+    :return: The earliest of the two times or None if both of them are None
+    """
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return min(first, second)
+
+
+class WakeupNotifier:
+    """
+    An object that is used to wake up something that is waiting (usually the Handler) from another thread. For \
+    instance, KeyboardInputGetter uses this to tell the Handler that there is input ready as soon as the player \
+    presses enter.
+
+    This uses a pair of connected sockets instead of a threading.Event so waiting on this can be combined with \
+    waiting on other files (like stdin) using select. Because of that, calling notify is thread safe and if notify \
+    is called before wait, the next call to wait will return immediately.
+    """
+
+    def __init__(self):
+        self._receive, self._send = socket.socketpair()
+        self._receive.setblocking(False)
+        self._send.setblocking(False)
+
+    def fileno(self):
+        """Allows this to be passed to select"""
+        return self._receive.fileno()
+
+    def notify(self):
+        """
+        Wakes up whatever is currently waiting or makes the next call to wait return immediately. This can be called\
+        from any thread.
+        """
+        try:
+            self._send.send(b"\0")
+        except (BlockingIOError, InterruptedError):
+            pass  # the buffer is full which means that there are plenty of notifications that haven't been cleared
+
+    def clear(self):
+        """
+        Clears all the notifications that have been received so far
+        """
+        try:
+            while self._receive.recv(1024):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
+    def wait(self, timeout: Optional[float], files: List[Any] = ()) -> bool:
+        """
+        Blocks the current thread until notify is called, one of the files is ready to read, or the timeout ends.
+
+        :param timeout: The maximum amount of time in seconds to wait or None to wait until notified
+        :param files: A list of objects that have a fileno method (like sys.stdin) that should also end the wait when\
+                they have something to read. By default, empty.
+        :return: True if the wait ended because of a notification or a file. False if the timeout ran out
+        """
+        if timeout is not None and timeout < 0:
+            timeout = 0
+        readable = select.select([self] + list(files), [], [], timeout)[0]
+        self.clear()
+        return len(readable) != 0
+
+    def close(self):
+        self._receive.close()
+        self._send.close()
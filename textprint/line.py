@@ -13,6 +13,7 @@ class Line:
     """
     A class that holds data for a line. Should be created by a Section
     """
+    __slots__ = ("_contents", "section", "line_number", "_last_length_lines", "_did_contents_change")
     # TODO add a color option
     def __init__(self, contents: str, section: 'Section', line_number: int):
         """